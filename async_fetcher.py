@@ -0,0 +1,158 @@
+"""async_fetcher.py
+asyncio 기반 게시글 상세 수집기.
+
+enhance_posts_with_details 는 게시글마다 driver.get + 고정 대기 + iframe 탐색을
+순차로 수행한다. 이 모듈은 검색/게시판 단계에서 얻은 URL 목록을 aiohttp 로
+동시에 가져와 page_parser 로 파싱하고, full_content / comments / images /
+attachments 를 원래 순서 그대로 게시글 dict 에 병합한다.
+
+- 동시 요청 수 상한 (concurrency)
+- 호스트별 요청 속도는 브라우저/requests 와 같은 공용 토큰 버킷
+  (utils.rate_limiter) 으로 제한
+
+Usage
+-----
+from async_fetcher import enhance_posts_async
+
+posts = enhance_posts_async(posts, keyword="채용", concurrency=8)
+"""
+# Disclaimer: use at your own risk. The authors take no responsibility for misuse.
+
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+try:
+    # aiohttp 는 선택 의존성 – 없으면 enhance_posts_async 호출 시 안내
+    import aiohttp
+except ImportError:  # pragma: no cover – aiohttp 미설치
+    aiohttp = None  # type: ignore
+
+from config import Config
+from page_parser import parse_article_page
+from utils.rate_limiter import RateLimiter, get_rate_limiter
+
+__all__ = ["is_available", "fetch_details", "enhance_posts_async"]
+
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/120.0.0.0 Safari/537.36"
+)
+RETRY_STATUS = {429, 500, 502, 503, 504}
+MAX_RETRIES = 2
+
+
+def is_available() -> bool:
+    """aiohttp 설치 여부"""
+    return aiohttp is not None
+
+
+async def _fetch_one(session, url: str, semaphore: asyncio.Semaphore,
+                     limiter: RateLimiter) -> Optional[str]:
+    async with semaphore:
+        for attempt in range(MAX_RETRIES + 1):
+            delay = limiter.reserve(url)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            start = time.monotonic()
+            try:
+                async with session.get(url) as response:
+                    limiter.record(url, ok=response.status not in RETRY_STATUS,
+                                   elapsed=time.monotonic() - start)
+                    if response.status in RETRY_STATUS and attempt < MAX_RETRIES:
+                        await asyncio.sleep(0.5 * 2 ** attempt)
+                        continue
+                    response.raise_for_status()
+                    return await response.text(errors="replace")
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                client_error = isinstance(e, aiohttp.ClientResponseError) and e.status not in RETRY_STATUS
+                if not isinstance(e, aiohttp.ClientResponseError):
+                    limiter.record(url, ok=False)
+                if client_error or attempt >= MAX_RETRIES:
+                    print(f"        ❌ 상세 수집 실패: {url[:60]}... ({e})")
+                    return None
+                await asyncio.sleep(0.5 * 2 ** attempt)
+    return None
+
+
+async def fetch_details(urls: List[str], concurrency: int = 8,
+                        cookies: Optional[Dict[str, str]] = None,
+                        timeout: float = 20.0,
+                        limiter: Optional[RateLimiter] = None) -> List[Optional[Dict[str, Any]]]:
+    """URL 목록의 상세 페이지를 동시에 가져와 파싱
+
+    Returns
+    -------
+    list[dict | None]
+        urls 와 같은 순서의 parse_article_page 결과. 실패한 항목은 None.
+        댓글 번호는 게시글마다 1부터 매긴다.
+    """
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+    limiter = limiter or get_rate_limiter()
+    connector = aiohttp.TCPConnector(limit=max(concurrency, 1), ttl_dns_cache=300)
+    client_timeout = aiohttp.ClientTimeout(total=timeout)
+    headers = {"User-Agent": USER_AGENT, "Referer": "https://cafe.naver.com/"}
+
+    async with aiohttp.ClientSession(connector=connector, timeout=client_timeout,
+                                     headers=headers, cookies=cookies) as session:
+        pages = await asyncio.gather(
+            *(_fetch_one(session, url, semaphore, limiter) for url in urls)
+        )
+
+    return [parse_article_page(html, start_comment_id=1) if html is not None else None
+            for html in pages]
+
+
+def enhance_posts_async(posts: List[Dict[str, Any]], keyword: Optional[str] = None,
+                        concurrency: Optional[int] = None,
+                        cookies: Optional[Dict[str, str]] = None,
+                        comment_quota=None) -> List[Dict[str, Any]]:
+    """enhance_posts_with_details 의 비동기 대체 구현 (동기 호출용 래퍼)
+
+    게시글 순서는 입력 순서를 유지하며, 실패한 게시글은 enhanced=False 로 남는다.
+    comment_quota(comment_api.CommentQuota) 를 넘기면 게시글 순서대로 댓글을
+    take() 에 통과시켜 실행 전체 한도와 댓글 번호를 순차/드라이버 풀 수집과 맞춘다.
+    """
+    if not is_available():
+        raise ImportError("aiohttp 가 설치되어 있지 않습니다: pip install aiohttp")
+
+    max_total_posts = getattr(Config, 'MAX_TOTAL_POSTS', 100)
+    if concurrency is None:
+        concurrency = getattr(Config, 'ASYNC_DETAIL_CONCURRENCY', 8)
+
+    posts = posts[:max_total_posts]
+    targets = [post for post in posts if post.get('url')]
+    print(f"    ⚡ 비동기 상세 수집: {len(targets)}개 (동시 {concurrency})")
+
+    details = asyncio.run(
+        fetch_details([post['url'] for post in targets], concurrency=concurrency,
+                      cookies=cookies)
+    )
+    detail_by_id = {id(post): detail for post, detail in zip(targets, details)}
+
+    collection_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    for post in posts:
+        detail = detail_by_id.get(id(post))
+        if detail:
+            if detail.get('content'):
+                post['full_content'] = detail['content']
+            comments = detail.get('comments')
+            if comments and comment_quota is not None:
+                comments = comment_quota.take(comments)
+            if comments:
+                post['comments'] = comments
+                post['comment_count'] = len(comments)
+            if detail.get('images'):
+                post['images'] = detail['images']
+            if detail.get('attachments'):
+                post['attachments'] = detail['attachments']
+        post['keyword'] = keyword
+        post['collection_time'] = collection_time
+        post['enhanced'] = detail is not None
+
+    print(f"    ✅ 비동기 상세 수집 완료: {sum(1 for p in posts if p['enhanced'])}/{len(posts)}개")
+    return posts
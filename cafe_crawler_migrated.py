@@ -6,7 +6,9 @@
 
 import time
 import re
+import copy
 from typing import Optional, List, Dict, Any, Tuple
+from collections.abc import Mapping
 import os
 import pandas as pd
 from datetime import datetime
@@ -14,7 +16,29 @@ import random
 
 # 기존 imports ?��?
 from config import Config
-from utils import clean_text, safe_wait, get_timestamp, print_progress, extract_post_number
+from utils import (
+    clean_text, safe_wait, get_timestamp, print_progress, extract_post_number,
+    get_page_param, set_page_param, register_cafe_id, cafe_name_of
+)
+from utils.page_scripts import extract_board_rows, read_pager, extract_comment_tree
+from page_parser import parse_post_list, parse_article_page
+from async_fetcher import enhance_posts_async, is_available as async_fetcher_available
+from session_bridge import SessionBridge, SessionExpiredError
+from comment_api import CommentFetcher, CommentQuota
+from driver_pool import DriverPool, pool_size
+from crawl_state import CrawlState, board_key
+from checkpoint import CrawlJournal
+from post_sink import PostSink, read_posts
+from storage import CafeStore
+from keyword_matcher import KeywordMatcher
+from records import Post, Comment, Image, Attachment, Board
+from near_dup import NearDuplicateIndex, dedupe_posts
+from frontier import CrawlFrontier, default_frontier_path
+from utils.constants import POST_SELECTORS, ARTICLE_TITLE_SELECTORS, CONTENT_SELECTORS
+from utils.waits import (
+    wait_for_element, wait_for_frame, wait_for_navigation, wait_for_rows_stable, polite_delay
+)
+from utils.rate_limiter import get_rate_limiter, throttle_driver
 from exporter import CafeDataExporter
 
 # ?�로??모듈??import
@@ -66,6 +90,41 @@ class CafeCrawlerMigrated:
         self._current_cafe_id = None
         self._cafe_metadata = {}
 
+        # 로그인 후 HTTP 수집 경로에서 사용할 쿠키 브리지
+        self.session_bridge: Optional[SessionBridge] = None
+        self.comment_fetcher: Optional[CommentFetcher] = None
+
+        # 실행 전체 댓글 한도와 댓글 번호 (풀 작업자와 공유)
+        self.comment_quota = CommentQuota()
+
+        # 키워드/게시판/상세 페이지 병렬 처리용 드라이버 풀 (DRIVER_POOL_SIZE > 1 일 때)
+        self._driver_pool: Optional[DriverPool] = None
+        self._is_pool_worker = False
+        # 부모가 프런티어 예약을 이미 마친 게시글을 받은 작업자 (_enhance_posts_pooled)
+        self._claims_held = False
+
+        # 증분 크롤링 상태 (INCREMENTAL_CRAWL 일 때 처음 사용 시 로드)
+        self.crawl_state: Optional[CrawlState] = None
+
+        # 체크포인트 저널 (open_checkpoint 로 시작) 과 현재 작업 단위
+        self.journal: Optional[CrawlJournal] = None
+        self._journal_unit = None
+
+        # 스트리밍 출력 (Config.STREAM_OUTPUT 이 jsonl/csv 일 때 open_post_sink 로 시작)
+        self.post_sink: Optional[PostSink] = None
+
+        # SQLite 저장소 (Config.SAVE_TO_DB 일 때 처음 사용 시 생성)
+        self.store: Optional[CafeStore] = None
+
+        # 실행 키워드 전체(+변형어) 매처 (crawl_cafe 에서 한 번 생성)
+        self.keyword_matcher: Optional[KeywordMatcher] = None
+
+        # 실행 전체 유사 게시글 색인 (검색 전략·키워드·게시판 사이 재게시 검출)
+        self.near_dup_index: Optional[NearDuplicateIndex] = None
+
+        # 상세 수집 프런티어 (PERSIST_FRONTIER 면 실행 간 공유, 아니면 이번 실행만)
+        self.frontier: Optional[CrawlFrontier] = None
+
         print("??CafeCrawler (Migration Version) 초기???�료")
 
     def setup_driver(self):
@@ -82,6 +141,9 @@ class CafeCrawlerMigrated:
                 from driver import create_driver
                 self.driver = create_driver()
 
+            # 모든 driver.get 이 공용 요청 예산(토큰 버킷)을 거치도록 설정
+            throttle_driver(self.driver)
+
             print("✅ 드라이버 설정 완료")
             return True
 
@@ -106,18 +168,286 @@ class CafeCrawlerMigrated:
 
                 if login_success:
                     self._is_logged_in = True
+                    self.sync_http_session()
                     print("??로그???�공")
                     return True
                 else:
                     raise LoginFailedException("로그???�패")
             else:
                 # 기존 방식 fallback
-                return self._legacy_login()
+                login_success = self._legacy_login()
+                if login_success:
+                    self.sync_http_session()
+                return login_success
 
         except Exception as e:
             print(f"??로그???�패: {e}")
             return False
 
+    def sync_http_session(self):
+        """브라우저 로그인 쿠키를 HTTP 세션으로 복사 (세션 브리지)"""
+        if not self.driver:
+            return False
+
+        if self.session_bridge is None:
+            self.session_bridge = SessionBridge(self.driver, refresh_callback=self._legacy_login)
+        return self.session_bridge.sync()
+
+    def get_driver_pool(self) -> Optional[DriverPool]:
+        """로그인 쿠키를 공유하는 드라이버 풀 (풀 크기가 1 이하이면 None)"""
+        if self._driver_pool is not None:
+            return self._driver_pool
+        if self._is_pool_worker or pool_size() <= 1 or not self.driver:
+            return None
+
+        try:
+            cookies = self.driver.get_cookies()
+        except Exception:
+            cookies = []
+
+        pool = DriverPool(cookies=cookies)
+        if not pool.start():
+            print("    ⚠️ 드라이버 풀 생성 실패 - 순차 처리로 진행")
+            return None
+
+        self._driver_pool = pool
+        return pool
+
+    def close_driver_pool(self):
+        """드라이버 풀의 브라우저 모두 종료"""
+        if self._driver_pool is not None:
+            self._driver_pool.close()
+            self._driver_pool = None
+
+    def _incremental_state(self) -> Optional[CrawlState]:
+        """증분 크롤링 상태 저장소 (Config.INCREMENTAL_CRAWL 이 꺼져 있으면 None)"""
+        if not getattr(Config, 'INCREMENTAL_CRAWL', False):
+            return None
+        if self.crawl_state is None:
+            self.crawl_state = CrawlState()
+        return self.crawl_state
+
+    def _state_club_id(self):
+        return self._current_cafe_id or self.get_cafe_club_id() or self.current_cafe_url
+
+    def _skip_seen_posts(self, posts, keyword=None, menu_id=None):
+        """이전 실행의 high-water mark 이하 게시글 제외 (상세 수집 전)"""
+        state = self._incremental_state()
+        if state is None or not posts:
+            return posts
+
+        new_posts, _ = state.filter_new(self._state_club_id(), board_key(menu_id, keyword), posts)
+        if len(new_posts) < len(posts):
+            print(f"    ⏭️ 이전 실행에서 수집한 게시글 {len(posts) - len(new_posts)}개 건너뜀")
+        return new_posts
+
+    def _filter_seen_page(self, page_posts, state_key):
+        """목록 한 페이지 → (새 게시글, 이전 실행 게시글 도달 여부) – 증분 모드가 아니면 그대로"""
+        state = self._incremental_state() if state_key else None
+        if state is None or not page_posts:
+            return page_posts, False
+        return state.filter_new(self._state_club_id(), state_key, page_posts)
+
+    def _record_crawl_state(self, posts, keyword=None, menu_id=None):
+        """수집 완료한 게시글로 high-water mark 갱신 (상세 수집 실패 글은 다음 실행에 재시도)"""
+        state = self._incremental_state()
+        if state is None or not posts:
+            return
+
+        key = board_key(menu_id, keyword)
+        failed = [post for post in posts if post.get('enhanced') is False]
+        mark = state.update(self._state_club_id(), key, posts, failed=failed)
+        state.save()
+        print(f"    💾 증분 상태 저장: {key} → #{mark}")
+
+    def open_checkpoint(self, resume=False) -> Optional[CrawlJournal]:
+        """체크포인트 저널 시작 (resume=True 면 이전 실행의 저널을 이어서 사용)
+
+        Config.CHECKPOINT_ENABLED(--checkpoint) 를 켰거나 resume 일 때만 기록한다.
+        """
+        if not (resume or getattr(Config, 'CHECKPOINT_ENABLED', False)):
+            return None
+        self.journal = CrawlJournal(resume=resume)
+        print(f"💾 체크포인트 저널: {self.journal.path}")
+        return self.journal
+
+    def close_checkpoint(self, completed=False):
+        """저널 닫기 – 결과 저장까지 끝났으면(completed) 저널 파일 삭제"""
+        if self.journal is None:
+            return
+        if completed:
+            self.journal.discard()
+        else:
+            self.journal.close()
+        self.journal = None
+
+    def _journaled(self, unit, collect):
+        """작업 단위 실행 – 저널에 완료 기록이 있으면 저장된 결과를 그대로 반환"""
+        journal = self.journal
+        if journal is not None and journal.is_done(unit):
+            result = journal.unit_result(unit)
+            print(f"    ♻️ 체크포인트에서 복원 (건너뜀): {unit}")
+            return result
+
+        self._journal_unit = unit
+        result = collect()
+        if journal is not None:
+            journal.mark_done(unit, result)
+        return result
+
+    def _journal_post(self, post):
+        if self.journal is not None:
+            self.journal.record_post(self._journal_unit or "posts", post)
+
+    def open_post_sink(self, resume=False) -> Optional[PostSink]:
+        """스트리밍 출력 시작 – 재개 시에는 저널에 기록된 같은 파일에 이어 씀"""
+        fmt = getattr(Config, 'STREAM_OUTPUT', None)
+        if not fmt:
+            return None
+
+        path = self.journal.meta('stream_file') if (resume and self.journal is not None) else None
+        self.post_sink = PostSink(path, fmt=None if path else fmt, resume=bool(path))
+        if self.journal is not None:
+            self.journal.set_meta('stream_file', self.post_sink.path)
+        print(f"📄 스트리밍 출력: {self.post_sink.path} (기존 {len(self.post_sink)}개)")
+        return self.post_sink
+
+    def close_post_sink(self):
+        """스트리밍 출력 파일 닫기 (파일 경로 반환)"""
+        if self.post_sink is None:
+            return None
+        self.post_sink.close()
+        return self.post_sink.path
+
+    def iter_streamed_posts(self):
+        """스트리밍 출력 파일에 기록된 게시글을 한 건씩 읽기 (내보내기용)"""
+        path = self.close_post_sink()
+        return read_posts(path) if path else iter(())
+
+    def get_store(self) -> Optional[CafeStore]:
+        """SQLite 저장소 (Config.SAVE_TO_DB 가 꺼져 있으면 None)"""
+        if not getattr(Config, 'SAVE_TO_DB', False):
+            return None
+        if self.store is None:
+            self.store = CafeStore()
+        return self.store
+
+    def close_store(self):
+        if self.store is not None:
+            self.store.close()
+            self.store = None
+
+    def _emit_post(self, post):
+        """스트리밍 출력이 켜져 있으면 게시글을 파일에 쓰고 가벼운 참조만 반환"""
+        self._tag_keywords(post)
+        if self.post_sink is None:
+            return post
+        return self.post_sink.write(post)
+
+    def _stream_posts(self, posts):
+        for post in posts:
+            self._tag_keywords(post)
+        if self.post_sink is None:
+            return posts
+        return [self.post_sink.write(post) for post in posts]
+
+    def get_near_dup_index(self) -> NearDuplicateIndex:
+        """실행 전체 유사 게시글 색인 (처음 사용 시 생성, 풀 작업자와 공유)"""
+        if self.near_dup_index is None:
+            self.near_dup_index = NearDuplicateIndex()
+        return self.near_dup_index
+
+    def get_frontier(self) -> CrawlFrontier:
+        """상세 수집 프런티어 (처음 사용 시 생성, 풀 작업자와 공유)"""
+        if self.frontier is None:
+            path = default_frontier_path() if getattr(Config, 'PERSIST_FRONTIER', False) else None
+            self.frontier = CrawlFrontier(path)
+            if path:
+                print(f"🧭 프런티어: {path} (이전 실행 수집 {len(self.frontier)}개)")
+        return self.frontier
+
+    def close_frontier(self):
+        if self.frontier is not None:
+            self.frontier.close()
+            self.frontier = None
+
+    def _fetch_claimed(self, posts, keyword):
+        """프런티어에서 예약에 성공한 게시글만 상세 수집하고, 수집 완료를 기록
+
+        키워드별 풀 작업자도 공유 프런티어(스레드 안전) 에서 직접 예약하므로 여러
+        키워드에 걸린 같은 글은 한 번만 받는다. 상세 수집에 실패했거나 한도에서
+        잘린 게시글은 예약을 풀어 다른 검색에서 다시 받을 수 있게 한다.
+        """
+        # 상세 병렬 수집 작업자는 부모가 이미 예약한 게시글을 받으므로 바로 수집
+        if self._claims_held:
+            return self._fetch_post_details(posts, keyword)
+
+        frontier = self.get_frontier()
+        club_id = self._state_club_id()
+        claimed = frontier.claim_posts(posts, club_id)
+        if len(claimed) < len(posts):
+            print(f"    🧭 이미 수집했거나 다른 검색에서 예약된 게시글 {len(posts) - len(claimed)}개 건너뜀")
+
+        fetched = []
+        try:
+            fetched = self._fetch_post_details(claimed, keyword) if claimed else []
+        finally:
+            enhanced = [post for post in fetched if post.get('enhanced')]
+            frontier.mark_fetched(enhanced, club_id)
+            frontier.release_posts(claimed, club_id, keep=enhanced)
+        return fetched
+
+    def _dedupe_posts(self, posts, require_body=False):
+        """게시글 번호 중복 + 이번 실행에서 이미 본 글과 거의 같은 게시글 제거"""
+        return dedupe_posts(posts, self.get_near_dup_index(), require_body)
+
+    def _skip_near_duplicates(self, posts):
+        """상세 수집 전: 재게시/다중 게시판 게시글은 다시 받지 않음 (제목뿐인 목록 행은 번호 중복만)"""
+        unique = self._dedupe_posts(posts, require_body=True)
+        if len(unique) < len(posts):
+            print(f"    🧬 유사 게시글 {len(posts) - len(unique)}개 건너뜀 (재게시/다중 게시판)")
+        return unique
+
+    def _tag_keywords(self, post):
+        """이번 실행 키워드 중 게시글에 나오는 것 전체를 matched_keywords 로 기록"""
+        matcher = self.keyword_matcher
+        if matcher is None or not isinstance(post, Mapping) or 'matched_keywords' in post:
+            return post
+        matched = matcher.match(post.get('title', ''), post.get('full_content') or post.get('content', ''))
+        # 검색해서 찾은 게시글은 검색 키워드가 본문 밖(작성자 등)에서 맞았어도 포함
+        keyword = post.get('keyword')
+        if keyword and keyword not in matched:
+            matched.insert(0, keyword)
+        post['matched_keywords'] = matched
+        return post
+
+    def _collection_summary(self, posts):
+        """(내용 포함 수, 댓글 포함 수, 이미지 수) – 스트리밍 중이면 싱크 집계 사용"""
+        if self.post_sink is not None:
+            stats = self.post_sink.stats
+            return stats['with_content'], stats['with_comments'], stats['images']
+        return (sum(1 for post in posts if post.get('full_content')),
+                sum(1 for post in posts if post.get('comments')),
+                sum(len(post.get('images', [])) for post in posts))
+
+    def _pool_worker(self, driver):
+        """풀 드라이버를 사용하는 작업용 크롤러 (설정/세션 공유, 드라이버만 교체)
+
+        얕은 복사라 아래 구성 요소는 부모와 같은 객체를 쓴다. 모두 내부 잠금으로
+        여러 스레드에서 써도 안전하다: journal(CrawlJournal), post_sink(PostSink),
+        store(CafeStore), near_dup_index(NearDuplicateIndex), frontier(CrawlFrontier),
+        crawl_state(CrawlState), comment_quota(CommentQuota). keyword_matcher 는
+        crawl_cafe 시작 때 만든 뒤 읽기만 한다. session_bridge 는 requests 세션을
+        공유하지만 쿠키 갱신은 잠금 안에서 한 번만 한다.
+        """
+        worker = copy.copy(self)
+        worker.driver = driver
+        worker.posts_data = []
+        worker._driver_pool = None
+        worker._is_pool_worker = True
+        worker._claims_held = False
+        return worker
+
     def _legacy_login(self):
         """기존 로그??방식 (fallback)"""
         try:
@@ -160,7 +490,7 @@ class CafeCrawlerMigrated:
                 self.driver.get(cafe_url)
 
             self.current_cafe_url = cafe_url
-            safe_wait(self.driver, 3)
+            wait_for_frame(self.driver, "cafe_main", timeout=3)
 
             # 카페 구조 분석
             self._analyze_cafe_structure()
@@ -273,7 +603,7 @@ class CafeCrawlerMigrated:
                         continue
 
                 safe_wait(self.driver, 3)
-                return self._extract_search_results(max_pages)
+                return self._extract_search_results(max_pages, board_key(keyword=keyword))
 
             return []
 
@@ -288,7 +618,7 @@ class CafeCrawlerMigrated:
                 search_url = f"https://cafe.naver.com/ArticleSearchList.nhn?search.clubid={self._current_cafe_id}&search.searchBy=0&search.query={keyword}"
                 self.driver.get(search_url)
                 safe_wait(self.driver, 3)
-                return self._extract_search_results(max_pages)
+                return self._extract_search_results(max_pages, board_key(keyword=keyword))
 
             return []
 
@@ -317,15 +647,15 @@ class CafeCrawlerMigrated:
                         try:
                             title = clean_text(link.text or link.get_attribute("title") or "")
                             if keyword.lower() in title.lower():
-                                post_data = {
-                                    'title': title,
-                                    'url': link.get_attribute("href"),
-                                    'author': '',
-                                    'date': '',
-                                    'views': 0,
-                                    'likes': 0,
-                                    'content': ''
-                                }
+                                post_data = Post(
+                                    title=title,
+                                    url=link.get_attribute("href"),
+                                    author='',
+                                    date='',
+                                    views=0,
+                                    likes=0,
+                                    content=''
+                                )
                                 post_results.append(post_data)
                         except:
                             continue
@@ -342,9 +672,14 @@ class CafeCrawlerMigrated:
             print(f"??기본 ?�비게이???�패: {e}")
             return []
 
-    def _extract_search_results(self, max_pages: int) -> List[Dict]:
+    def _extract_search_results(self, max_pages: int, state_key: Optional[str] = None) -> List[Dict]:
         """검??결과 추출"""
         try:
+            # 목록/검색 URL 이면 페이지 번호로 직접 이동 (풀 사용 시 병렬)
+            list_url = self._current_list_url()
+            if self._is_paged_list_url(list_url):
+                return self.collect_pages_by_url(list_url, max_pages, state_key=state_key)
+
             results = []
 
             for page in range(max_pages):
@@ -352,7 +687,11 @@ class CafeCrawlerMigrated:
 
                 # ?�재 ?�이지??게시글 추출
                 page_results = self._extract_posts_from_current_page()
+                page_results, reached_seen = self._filter_seen_page(page_results, state_key)
                 results.extend(page_results)
+                if reached_seen:
+                    print(f"  ⏹️ 이전 실행에서 수집한 게시글에 도달 (페이지 {page + 1})")
+                    break
 
                 # ?�음 ?�이지�??�동
                 if page < max_pages - 1:
@@ -360,8 +699,6 @@ class CafeCrawlerMigrated:
                         print("  ?�️ ???�상 ?�이지가 ?�습?�다")
                         break
 
-                safe_wait(self.driver, 2)
-
             return results
 
         except Exception as e:
@@ -371,7 +708,10 @@ class CafeCrawlerMigrated:
     def _extract_posts_from_current_page(self) -> List[Dict]:
         """현재 페이지에서 게시글 추출"""
         try:
-            posts = []
+            # 스크립트 1회 호출로 목록 전체 추출 (실패 시 요소별 추출로 폴백)
+            posts = self._extract_posts_bulk()
+            if posts:
+                return posts
 
             # 게시글 ?�소??찾기
             post_selectors = [
@@ -405,18 +745,48 @@ class CafeCrawlerMigrated:
             print(f"???�이지 게시글 추출 ?�패: {e}")
             return []
 
+    def _extract_posts_bulk(self) -> List[Dict]:
+        """게시글 목록 일괄 추출 (execute_script 1회)"""
+        # 오프라인 파서: page_source 1회 + BeautifulSoup 파싱
+        if getattr(Config, 'USE_OFFLINE_PARSER', False):
+            return parse_post_list(self.safe_get_page_source(), self.safe_get_current_url() or "https://cafe.naver.com/")
+
+        if not getattr(Config, 'USE_BULK_EXTRACTION', True):
+            return []
+
+        rows = extract_board_rows(self.driver)
+        if not rows:
+            return []
+
+        posts = []
+        for row in rows:
+            title = clean_text(row.get('title', ''))
+            url = row.get('url', '')
+            if not title or not url:
+                continue
+            posts.append(Post(
+                title=title,
+                url=url,
+                author=row.get('author', ''),
+                date=row.get('date', ''),
+                views=row.get('views'),
+                likes=row.get('likes'),
+                content=''
+            ))
+        return posts
+
     def _extract_single_post_data(self, element) -> Optional[Dict]:
         """단일 게시글 데이터 추출"""
         try:
-            post_data = {
-                'title': '',
-                'url': '',
-                'author': '',
-                'date': '',
-                'views': 0,
-                'likes': 0,
-                'content': ''
-            }
+            post_data = Post(
+                title='',
+                url='',
+                author='',
+                date='',
+                views=0,
+                likes=0,
+                content=''
+            )
 
             # ?�목�?URL 추출
             title_selectors = ["a[href*='Article']", ".title a", "a.article", "td a"]
@@ -457,6 +827,11 @@ class CafeCrawlerMigrated:
     def _go_to_next_page(self) -> bool:
         """다음 페이지로 이동"""
         try:
+            # URL 의 page 파라미터로 바로 이동 (목록/검색 URL 인 경우 클릭 탐색 불필요)
+            jumped = self._jump_to_next_page()
+            if jumped is not None:
+                return jumped
+
             # 다양한 "다음 페이지" 패턴들
             next_patterns = [
                 # ?�반?�인 ?�턴
@@ -484,9 +859,10 @@ class CafeCrawlerMigrated:
                         if element.is_displayed() and element.is_enabled():
                             # ?�릭 가?�한지 ?�인
                             if 'disabled' not in element.get_attribute('class').lower():
+                                old_url, marker = self._navigation_snapshot()
                                 element.click()
                                 print(f"        ?�️ ?�음 ?�이지 ?�동 ?�공: {pattern}")
-                                self.safe_wait(self.driver, 2)
+                                wait_for_navigation(self.driver, old_url, marker, timeout=5)
                                 return True
                 except:
                     continue
@@ -513,8 +889,7 @@ class CafeCrawlerMigrated:
                     next_page = current_page + 1
                     page_selectors = [
                         f"a[href*='page={next_page}']",
-                        f"//a[text()='{next_page}']",
-                        f".pagination a:contains('{next_page}')"
+                        f"//a[text()='{next_page}']"
                     ]
 
                     for selector in page_selectors:
@@ -525,9 +900,10 @@ class CafeCrawlerMigrated:
                                 element = self.driver.find_element(By.CSS_SELECTOR, selector)
 
                             if element.is_displayed():
+                                old_url, marker = self._navigation_snapshot()
                                 element.click()
                                 print(f"        ?�️ ?�이지 {next_page}�??�동 ?�공")
-                                self.safe_wait(self.driver, 2)
+                                wait_for_navigation(self.driver, old_url, marker, timeout=5)
                                 return True
                         except:
                             pass
@@ -555,6 +931,15 @@ class CafeCrawlerMigrated:
             except:
                 pass
 
+            # 댓글 API: 화면에 없는 페이지의 댓글·답글까지 전체 수집 (실패 시 화면에서 수집)
+            api_comments = self._fetch_comments_api(post_url)
+
+            # HTTP 경로: 브라우저 쿠키로 상세 페이지를 직접 요청 (만료 시에만 브라우저 갱신)
+            if getattr(Config, 'USE_HTTP_DETAILS', False) and self.session_bridge:
+                detail = self._fetch_post_detail_http(post_url)
+                if detail is not None:
+                    return self._merge_api_comments(detail, api_comments)
+
             # 게시글 ?�이지�??�동
             self.driver.get(post_url)
             self.safe_wait(self.driver, 2)
@@ -562,6 +947,10 @@ class CafeCrawlerMigrated:
             # iframe 처리 (게시글 ?�세 ?�이지??iframe 구조?????�음)
             self.handle_post_detail_iframe()
 
+            # 오프라인 파서: page_source 1회로 본문/댓글/이미지/첨부 파싱
+            if getattr(Config, 'USE_OFFLINE_PARSER', False):
+                return self._merge_api_comments(self._parse_post_detail_offline(), api_comments)
+
             # 게시글 ?�용 추출
             content = self.extract_post_content()
 
@@ -569,7 +958,9 @@ class CafeCrawlerMigrated:
             comments = []
             extract_comments = getattr(Config, 'EXTRACT_COMMENTS', True)
             include_comments = getattr(Config, 'INCLUDE_COMMENTS', True)
-            if extract_comments and include_comments:
+            if api_comments is not None:
+                comments = api_comments
+            elif extract_comments and include_comments:
                 comments = self.extract_comments()
 
             print(f"        📄 내용: {len(content)}자, 댓글: {len(comments)}개")
@@ -598,6 +989,61 @@ class CafeCrawlerMigrated:
             except:
                 pass
 
+    def _fetch_post_detail_http(self, post_url):
+        """세션 브리지로 상세 페이지를 가져와 파싱 (실패 시 None → 브라우저 경로)"""
+        try:
+            html = self.session_bridge.get_text(post_url)
+        except SessionExpiredError as e:
+            print(f"        ⚠️ HTTP 세션 만료, 브라우저로 수집: {e}")
+            return None
+        except Exception as e:
+            print(f"        ⚠️ HTTP 상세 수집 실패, 브라우저로 수집: {e}")
+            return None
+
+        detail = parse_article_page(html)
+        print(f"        📄 내용: {len(detail['content'])}자, 댓글: {len(detail['comments'])}개 (HTTP)")
+        return detail
+
+    def _fetch_comments_api(self, post_url):
+        """댓글 API 로 게시글 댓글 전체 수집 (USE_COMMENT_API – 쓸 수 없거나 실패하면 None)"""
+        if not getattr(Config, 'USE_COMMENT_API', False) or self.session_bridge is None:
+            return None
+        if not (getattr(Config, 'EXTRACT_COMMENTS', True) and getattr(Config, 'INCLUDE_COMMENTS', True)):
+            return None
+        if self.comment_fetcher is None:
+            self.comment_fetcher = CommentFetcher(self.session_bridge)
+
+        try:
+            comments = self.comment_fetcher.fetch_post_comments(
+                post_url, limit=self.comment_quota.remaining())
+        except SessionExpiredError as e:
+            print(f"        ⚠️ HTTP 세션 만료, 화면에서 댓글 수집: {e}")
+            return None
+        except Exception as e:
+            print(f"        ⚠️ 댓글 API 수집 실패, 화면에서 댓글 수집: {e}")
+            return None
+        if comments is None:
+            return None
+
+        comments = self.comment_quota.take(comments)
+        print(f"        💬 댓글: {len(comments)}개 (댓글 API)")
+        return comments
+
+    def _merge_api_comments(self, detail, api_comments):
+        """댓글 API 결과가 있으면 파싱한 화면 댓글 대신 사용, 없으면 화면 댓글을 전체 한도 안에서 사용"""
+        if api_comments is not None:
+            detail['comments'] = api_comments
+        else:
+            detail['comments'] = self.comment_quota.take(detail['comments'])
+        return detail
+
+    def _parse_post_detail_offline(self):
+        """현재 프레임의 page_source 를 한 번만 읽어 상세 정보 파싱 (댓글 한도는 _merge_api_comments 에서 적용)"""
+        detail = parse_article_page(self.safe_get_page_source())
+
+        print(f"        📄 내용: {len(detail['content'])}자, 댓글: {len(detail['comments'])}개 (오프라인 파싱)")
+        return detail
+
     def handle_post_detail_iframe(self):
         """게시글 세부 페이지의 iframe 처리"""
         if not self.driver:
@@ -622,7 +1068,7 @@ class CafeCrawlerMigrated:
                         for iframe in iframes:
                             if iframe.is_displayed():
                                 self.driver.switch_to.frame(iframe)
-                                self.safe_wait(self.driver, 1)
+                                wait_for_element(self.driver, ARTICLE_TITLE_SELECTORS + CONTENT_SELECTORS, timeout=1)
 
                                 # iframe ?�용 ?�인
                                 if self.verify_post_detail_page():
@@ -735,10 +1181,10 @@ class CafeCrawlerMigrated:
 
         try:
             # ?�체 ?��? ?�집 추적
-            total_comments_collected = getattr(self, '_total_comments_collected', 0)
+            total_comments_collected = self.comment_quota.collected
 
             # ?�체 ?��? ?�한 ?�인 (기본�??�정)
-            max_total_comments = getattr(Config, 'MAX_TOTAL_COMMENTS', 1000)
+            max_total_comments = self.comment_quota.limit
             if total_comments_collected >= max_total_comments:
                 print(f"        ?�️ ?�체 ?��? ?�집 ?�한 ({max_total_comments}�? ?�달")
                 return []
@@ -768,6 +1214,14 @@ class CafeCrawlerMigrated:
             remaining_quota = max_total_comments - total_comments_collected
             max_collect = min(max_comments_per_post, remaining_quota)
 
+            # 스크립트 1회 호출로 댓글·답글 전체 추출 (실패 시 요소별 추출로 폴백)
+            if getattr(Config, 'USE_BULK_COMMENTS', True):
+                bulk_comments = self._extract_comments_bulk(max_collect)
+                if bulk_comments is not None:
+                    bulk_comments = self.comment_quota.take(bulk_comments)
+                    print(f"        💬 댓글: {len(bulk_comments)}개 (스크립트 1회)")
+                    return bulk_comments
+
             for selector in comment_selectors:
                 try:
                     comment_elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
@@ -780,7 +1234,7 @@ class CafeCrawlerMigrated:
                             if collected_this_round >= max_collect:
                                 break
 
-                            comment_data = self.extract_single_comment_enhanced(comment_elem, total_comments_collected + i + 1)
+                            comment_data = self.extract_single_comment_enhanced(comment_elem, i + 1)
                             if comment_data:
                                 # 최소 길이 ?�인
                                 min_length = getattr(Config, 'COMMENT_CONTENT_MIN_LENGTH', 5)
@@ -802,27 +1256,48 @@ class CafeCrawlerMigrated:
                 comments.extend(replies)
 
             # ?�체 ?��? 카운???�데?�트
-            self._total_comments_collected = getattr(self, '_total_comments_collected', 0) + len(comments)
+            comments = self.comment_quota.take(comments)
 
-            print(f"        ??�?{len(comments)}�??��? ?�집 ?�료 (?�체: {self._total_comments_collected}/{max_total_comments})")
+            print(f"        ??�?{len(comments)}�??��? ?�집 ?�료 (?�체: {self.comment_quota.collected}/{max_total_comments})")
             return comments
 
         except Exception as e:
             print(f"        ???��? 추출 ?�류: {e}")
             return []
 
+    def _extract_comments_bulk(self, max_collect):
+        """댓글·답글 일괄 추출 (execute_script 1회, 게시글 안에서 1부터 번호) – 스크립트 실행 실패 시 None"""
+        rows = extract_comment_tree(self.driver, limit=max_collect,
+                                    min_length=getattr(Config, 'COMMENT_CONTENT_MIN_LENGTH', 5))
+        if rows is None:
+            return None
+
+        comments = []
+        for idx, row in enumerate(rows):
+            parent = row.get('parent', -1)
+            comments.append(Comment(
+                comment_id=idx + 1,
+                author=row.get('author') or '익명',
+                content=clean_text(row.get('content', '')),
+                date=row.get('date') or '날짜 없음',
+                like_count=row.get('like_count'),
+                depth=row.get('depth') or 1,
+                parent_id=parent + 1 if 0 <= parent < idx else None
+            ))
+        return comments
+
     def extract_single_comment_enhanced(self, comment_element, comment_id):
         """개별 ?��? ?�보 추출 (1000�??�집 최적??"""
         try:
-            comment_data = {
-                'comment_id': comment_id,
-                'author': '',
-                'content': '',
-                'date': '',
-                'like_count': 0,
-                'depth': 1,
-                'parent_id': None
-            }
+            comment_data = Comment(
+                comment_id=comment_id,
+                author='',
+                content='',
+                date='',
+                like_count=0,
+                depth=1,
+                parent_id=None
+            )
 
             # ?��? ?�성??추출 (?�장???�택??
             author_selectors = [
@@ -893,9 +1368,8 @@ class CafeCrawlerMigrated:
                     like_elem = comment_element.find_element(By.CSS_SELECTOR, selector)
                     like_text = self.clean_text(like_elem.text)
                     if like_text:
-                        # ?�자�?추출
-                        like_numbers = ''.join(filter(str.isdigit, like_text))
-                        comment_data['like_count'] = int(like_numbers) if like_numbers else 0
+                        # 숫자는 Comment 가 한 번만 변환
+                        comment_data['like_count'] = like_text
                         break
                 except:
                     continue
@@ -964,15 +1438,15 @@ class CafeCrawlerMigrated:
     def extract_single_reply(self, reply_element, reply_index):
         """개별 ?�?��? ?�보 추출"""
         try:
-            reply_data = {
-                'comment_id': f"reply_{reply_index}",
-                'author': '',
-                'content': '',
-                'date': '',
-                'like_count': 0,
-                'depth': 2,
-                'parent_id': None
-            }
+            reply_data = Comment(
+                comment_id=f"reply_{reply_index}",
+                author='',
+                content='',
+                date='',
+                like_count=0,
+                depth=2,
+                parent_id=None
+            )
 
             # 답글 작성자 선택자
             author_selectors = [
@@ -1045,11 +1519,11 @@ class CafeCrawlerMigrated:
                 alt = img.get_attribute("alt") or ""
 
                 if src and 'http' in src:
-                    images.append({
-                        'url': src,
-                        'alt': self.clean_text(alt),
-                        'size': f"{img.size['width']}x{img.size['height']}"
-                    })
+                    images.append(Image(
+                        url=src,
+                        alt=self.clean_text(alt),
+                        size=f"{img.size['width']}x{img.size['height']}"
+                    ))
 
             return images[:10]  # 최�? 10개까지
 
@@ -1077,10 +1551,10 @@ class CafeCrawlerMigrated:
                         text = self.clean_text(elem.text)
 
                         if href and text:
-                            attachments.append({
-                                'name': text,
-                                'url': href
-                            })
+                            attachments.append(Attachment(
+                                name=text,
+                                url=href
+                            ))
                 except:
                     continue
 
@@ -1301,7 +1775,7 @@ class CafeCrawlerMigrated:
             # 1?�계: 카페 ?�속 �?기본 분석
             print(f"?�� 1?�계: 카페 ?�속 �?구조 분석")
             self.driver.get(cafe_url)
-            self.safe_wait(self.driver, 3)
+            wait_for_frame(self.driver, "cafe_main", timeout=3)
 
             # 로그???�인
             if not self.check_login_status():
@@ -1328,6 +1802,13 @@ class CafeCrawlerMigrated:
             board_results = self.explore_all_boards_individually(exploration_results['all_boards'])
             exploration_results.update(board_results)
 
+            # SQLite 저장소에 게시판·게시글 저장 (스트리밍 중이면 본문은 출력 파일에 있음)
+            store = self.get_store()
+            if store is not None:
+                store.save_boards(board_results)
+                store.save_posts(exploration_results['search_results'].get('all_posts', []))
+                print(f"🗄️ SQLite 저장 완료: {store.path}")
+
             # 6?�계: ?�계 �?분석
             print(f"?�� 6?�계: 종합 ?�계 ?�성")
             exploration_results['statistics'] = self.generate_exploration_statistics(exploration_results)
@@ -1481,7 +1962,7 @@ class CafeCrawlerMigrated:
                             search_results['all_posts'].extend(result['posts'])
 
             # 중복 ?�거
-            search_results['all_posts'] = self.deduplicate_posts(search_results['all_posts'])
+            search_results['all_posts'] = self._stream_posts(self.deduplicate_posts(search_results['all_posts']))
             search_results['failed_searches'] = search_results['total_searches'] - search_results['successful_searches']
 
             print(f"        ??검???�료: {len(search_results['all_posts'])}�?게시글 발견")
@@ -1508,34 +1989,33 @@ class CafeCrawlerMigrated:
                 'total_comments': 0
             }
 
+            # 드라이버 풀이 있으면 게시판을 병렬로 탐색 (결과는 게시판 순서 유지)
+            pool = self.get_driver_pool() if len(boards) > 1 else None
+            # 작업자가 같은 증분 상태 파일을 쓰도록 풀 시작 전에 로드
+            self._incremental_state()
+            if pool:
+                explored = pool.map(
+                    lambda driver, item: self._pool_worker(driver).explore_board_journaled(item[1], item[0], len(boards)),
+                    list(enumerate(boards))
+                )
+            else:
+                explored = None
+
             for i, board in enumerate(boards):
                 try:
                     board_name = board.get('name', f'Board_{i+1}')
-                    board_url = board.get('url', '')
 
-                    print(f"        ?�� {i+1}/{len(boards)}: {board_name}")
+                    if explored is not None:
+                        board_info = explored[i]
+                    else:
+                        board_info = self.explore_board_journaled(board, i, len(boards))
+                        if board_info:
+                            # ?�무 빠른 ?�청 방�?
+                            self.adaptive_delay()
 
-                    if not board_url:
-                        print(f"            ?�️ URL ?�음, 건너?�기")
+                    if not board_info:
                         continue
 
-                    # 게시?�으�??�동
-                    self.driver.get(board_url)
-                    self.safe_wait(self.driver, 2)
-
-                    # 게시글 추출
-                    board_posts = self.extract_board_posts(board)
-
-                    # ?�계 계산
-                    board_info = {
-                        'board_info': board,
-                        'posts': board_posts,
-                        'post_count': len(board_posts),
-                        'comment_count': sum(len(post.get('comments', [])) for post in board_posts),
-                        'last_activity': self.get_board_last_activity(board_posts),
-                        'activity_score': self.calculate_board_activity_score(board_posts)
-                    }
-
                     board_results['board_results'][board_name] = board_info
 
                     # ?�동??분류
@@ -1550,9 +2030,6 @@ class CafeCrawlerMigrated:
 
                     print(f"            ??게시글: {board_info['post_count']}�? ?��?: {board_info['comment_count']}�?)
 
-                    # ?�무 빠른 ?�청 방�?
-                    self.adaptive_delay()
-
                 except Exception as e:
                     print(f"            ??게시???�색 ?�류: {e}")
                     continue
@@ -1567,6 +2044,48 @@ class CafeCrawlerMigrated:
             print(f"    ??개별 게시???�색 ?�류: {e}")
             return {'board_results': {}, 'total_posts': 0, 'total_comments': 0}
 
+    def explore_board_journaled(self, board, index, total):
+        """explore_single_board + 체크포인트 (이미 끝난 게시판은 저장된 결과 사용)"""
+        unit = f"board:{board.get('url') or board.get('name', index)}"
+        return self._journaled(unit, lambda: self.explore_single_board(board, index, total))
+
+    def explore_single_board(self, board, index, total):
+        """게시판 하나로 이동하여 게시글과 활동 통계 수집 (URL 없으면 None)"""
+        board_name = board.get('name', f'Board_{index+1}')
+        board_url = board.get('url', '')
+
+        print(f"        📋 {index+1}/{total}: {board_name}")
+
+        if not board_url:
+            print(f"            ⚠️ URL 없음, 건너뛰기")
+            return None
+
+        # 게시판으로 이동
+        self.driver.get(board_url)
+        wait_for_frame(self.driver, "cafe_main", timeout=2)
+
+        # 게시글 추출 (증분 모드: 이 게시판에서 이전 실행 이후 올라온 글만)
+        menu_id = self._board_menu_id(board)
+        board_posts = self._skip_seen_posts(self.extract_board_posts(board), menu_id=menu_id)
+        self._record_crawl_state(board_posts, menu_id=menu_id)
+
+        return {
+            'board_info': board,
+            'post_count': len(board_posts),
+            'comment_count': sum(len(post.get('comments', [])) for post in board_posts),
+            'last_activity': self.get_board_last_activity(board_posts),
+            'activity_score': self.calculate_board_activity_score(board_posts),
+            'posts': self._stream_posts(board_posts)
+        }
+
+    @staticmethod
+    def _board_menu_id(board):
+        """게시판 menu_id (레코드에 없으면 URL 의 menuid / menus/<id>) – 모르면 None"""
+        if board.get('menu_id'):
+            return str(board['menu_id'])
+        match = re.search(r'(?:menuid=|/menus/)(\d+)', board.get('url', ''), re.IGNORECASE)
+        return match.group(1) if match else None
+
     def extract_board_posts(self, board):
         """게시?�에??게시글 추출"""
         try:
@@ -1890,12 +2409,23 @@ class CafeCrawlerMigrated:
     def collect_search_results(self, keyword, max_pages):
         """검??결과 ?�집"""
         try:
+            list_url = self._current_list_url()
+            if self._is_paged_list_url(list_url):
+                return self.collect_pages_by_url(
+                    list_url, max_pages, lambda crawler: crawler.extract_search_result_posts(keyword),
+                    state_key=board_key(keyword=keyword)
+                )
+
             all_posts = []
             for page in range(max_pages):
                 posts = self.extract_search_result_posts(keyword)
                 if not posts:
                     break
+                posts, reached_seen = self._filter_seen_page(posts, board_key(keyword=keyword))
                 all_posts.extend(posts)
+                if reached_seen:
+                    print(f"  ⏹️ 이전 실행에서 수집한 게시글에 도달 (페이지 {page + 1})")
+                    break
                 if not self._go_to_next_page():
                     break
             return all_posts
@@ -1914,6 +2444,17 @@ class CafeCrawlerMigrated:
         except:
             return None
 
+    def _learn_club_id(self, cafe_url):
+        """카페 첫 화면의 clubid 를 카페명과 함께 기록 – 카페명/번호 형태 URL 도 같은 article_key 로 정규화"""
+        try:
+            match = re.search(r'clubid=(\d+)', self.driver.page_source or '', re.IGNORECASE)
+        except Exception:
+            return None
+        if not match:
+            return None
+        register_cafe_id(cafe_name_of(cafe_url), match.group(1))
+        return int(match.group(1))
+
     def extract_search_result_posts(self, keyword=None):
         """검??결과?�서 게시글 추출"""
         try:
@@ -2068,25 +2609,16 @@ class CafeCrawlerMigrated:
             return False
 
     def adaptive_delay(self):
-        """?�응???�레??(?�버 부??고려)"""
+        """적응형 딜레이 - 페이지 로딩을 기다리고, 로딩 실패만 공용 속도 제한기(AIMD)에 반영
+
+        직접 잠들지 않고, 다음 이동(driver.get/클릭)이 토큰 버킷에서 대기한다.
+        성공한 이동의 응답 시간은 throttle_driver 가 driver.get 마다 이미 기록하므로
+        여기서 다시 기록하지 않는다 (증가폭이 두 배가 됨).
+        """
         try:
-            base_delay = 1.0  # 기본 ?�레??
-            # ?�이지 로딩 ?�간 측정
-            start_time = time.time()
             self.wait_for_page_load()
-            load_time = time.time() - start_time
-
-            # 로딩 ?�간???�른 ?�응???�레??            if load_time > 3:
-                # 로딩???�래 걸리�???�??�레??                delay = base_delay * 1.5
-            elif load_time < 1:
-                # 로딩??빠르�?기본 ?�레??                delay = base_delay
-            else:
-                # 중간 ?�도�??�간 �??�레??                delay = base_delay * 1.2
-
-            time.sleep(delay)
-
-        except Exception as e:
-            # ?�류 ??기본 ?�레??            time.sleep(1.0)
+        except Exception:
+            get_rate_limiter().record(self.safe_get_current_url(), ok=False)
 
     def safe_find_elements(self, by, value):
         """?�전???�소 찾기"""
@@ -2124,6 +2656,23 @@ class CafeCrawlerMigrated:
         except:
             return False
 
+    def safe_wait(self, driver, seconds):
+        """페이지 준비 대기 (준비되면 즉시 반환, seconds 는 최대 대기 시간)"""
+        safe_wait(driver, seconds)
+
+    def _navigation_snapshot(self):
+        """클릭 전 상태 (현재 URL, 첫 번째 목록 행) 기록 후 요청 예산 확보
+
+        클릭도 서버 요청을 일으키므로 driver.get 과 같은 토큰 버킷을 거친다.
+        """
+        try:
+            old_url = self.driver.current_url
+            marker = wait_for_element(self.driver, POST_SELECTORS, timeout=0)
+        except Exception:
+            old_url, marker = "", None
+        polite_delay(old_url)
+        return old_url, marker
+
     def safe_execute_script(self, script):
         """?�전???�크립트 ?�행"""
         try:
@@ -2206,7 +2755,7 @@ class CafeCrawlerMigrated:
                     view_btn = self.driver.find_element(By.CSS_SELECTOR, selector)
                     if view_btn.is_displayed():
                         view_btn.click()
-                        time.sleep(1)
+                        wait_for_rows_stable(self.driver, timeout=1)
                         print(f"        ??리스??보기�??�환: {selector}")
                         break
                 except:
@@ -2240,9 +2789,10 @@ class CafeCrawlerMigrated:
                             continue
 
                     if max_option:
+                        old_url, marker = self._navigation_snapshot()
                         select.select_by_value(str(max_value))
                         print(f"        ???�이지???�시 개수: {max_value}개로 ?�정")
-                        time.sleep(2)
+                        wait_for_navigation(self.driver, old_url, marker, timeout=2)
                         break
 
                 except:
@@ -2288,9 +2838,123 @@ class CafeCrawlerMigrated:
         except Exception as e:
             pass  # 로딩 ?��??�류??무시?�고 진행
 
+    def _current_list_url(self):
+        """현재 목록/검색 페이지 URL (cafe_main iframe 이 있으면 그 src)"""
+        url = self.safe_execute_script(
+            "var f = document.getElementById('cafe_main'); return f ? f.src : document.location.href;"
+        )
+        return url or self.safe_get_current_url()
+
+    @staticmethod
+    def _is_paged_list_url(url):
+        """page 파라미터로 페이지를 지정할 수 있는 목록/검색 URL 인지"""
+        if not url:
+            return False
+        return get_page_param(url) is not None or 'ArticleList' in url or 'ArticleSearchList' in url
+
+    def goto_page(self, list_url, page):
+        """목록 URL 의 page 번째 페이지로 직접 이동하고 목록 행 수 반환"""
+        if not self.safe_driver_get(set_page_param(list_url, page)):
+            return 0
+        return wait_for_rows_stable(self.driver, timeout=5)
+
+    def _page_exists(self, list_url, page):
+        """page 번째 페이지가 실제로 있는지 (마지막 페이지를 넘으면 행이 없거나 다른 번호가 표시됨)
+
+        목록 행이 있어야 하고, 번호 영역이 있으면 현재 번호가 page 여야 한다 (현재
+        번호를 읽지 못하면 page 가 표시된 번호 범위 안이거나 다음 묶음이 있어야 함).
+        """
+        if self.goto_page(list_url, page) <= 0:
+            return False
+        pager = read_pager(self.driver)
+        if pager is None:
+            return True
+        if pager['current']:
+            return pager['current'] == page
+        return page <= pager['max'] or pager['more']
+
+    def _jump_to_next_page(self):
+        """URL 의 page 파라미터로 다음 페이지 이동 (URL 방식을 쓸 수 없으면 None)"""
+        list_url = self._current_list_url()
+        if not self._is_paged_list_url(list_url):
+            return None
+
+        next_page = (get_page_param(list_url) or 1) + 1
+        moved = self._page_exists(list_url, next_page)
+        if moved:
+            print(f"        ➡️ 페이지 {next_page} 로 URL 이동")
+        return moved
+
+    def find_last_page(self, list_url, upper):
+        """마지막 페이지 번호 (번호 영역을 한 번 읽고, 다음 묶음이 있으면 이진 탐색)"""
+        pager = read_pager(self.driver)
+        if not pager:
+            # 번호 영역을 읽지 못함 – 상한까지 열어 보고 빈 페이지에서 중단
+            return upper
+
+        last_seen = max(pager['max'], pager['current'])
+        if last_seen >= upper:
+            return upper
+        if not pager['more']:
+            return last_seen
+
+        # lo 는 존재하는 페이지, hi 는 존재하지 않는 페이지
+        lo, hi = last_seen, upper + 1
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if self._page_exists(list_url, mid):
+                lo = mid
+            else:
+                hi = mid
+        return lo
+
+    def collect_pages_by_url(self, list_url, max_pages, extract=None, state_key=None):
+        """page 파라미터로 1..K 페이지를 직접 열어 게시글 수집 (드라이버 풀이 있으면 병렬)
+
+        증분 모드에서 state_key 를 주면 이전 실행의 게시글에 닿는 페이지에서
+        멈춰야 하므로 마지막 페이지를 찾지 않고 1 페이지부터 순서대로 연다.
+        """
+        if extract is None:
+            extract = lambda crawler: crawler._extract_posts_from_current_page()
+
+        incremental = bool(state_key) and self._incremental_state() is not None
+        last_page = max_pages if incremental else self.find_last_page(list_url, max_pages)
+        pages = list(range(1, last_page + 1))
+        print(f"  📄 URL 페이지 이동으로 {len(pages)}페이지 수집")
+
+        def fetch(crawler, page):
+            if not crawler.goto_page(list_url, page):
+                return []
+            return extract(crawler) or []
+
+        pool = self.get_driver_pool() if len(pages) > 1 and not incremental else None
+        if pool:
+            page_posts = pool.map(lambda driver, page: fetch(self._pool_worker(driver), page), pages)
+        else:
+            page_posts = []
+            for page in pages:
+                posts = fetch(self, page)
+                if not posts:
+                    break
+                posts, reached_seen = self._filter_seen_page(posts, state_key)
+                page_posts.append(posts)
+                if reached_seen:
+                    print(f"  ⏹️ 이전 실행에서 수집한 게시글에 도달 (페이지 {page})")
+                    break
+
+        results = []
+        for posts in page_posts:
+            results.extend(posts or [])
+        return results
+
     def smart_next_page(self):
         """?�마???�음 ?�이지 ?�동"""
         try:
+            # URL 의 page 파라미터로 바로 이동 (목록/검색 URL 인 경우 클릭 탐색 불필요)
+            jumped = self._jump_to_next_page()
+            if jumped is not None:
+                return jumped
+
             # ?�양??"?�음 ?�이지" ?�턴??            next_patterns = [
                 # ?�반?�인 ?�턴
                 ".next", ".page-next", ".btn-next",
@@ -2317,9 +2981,10 @@ class CafeCrawlerMigrated:
                         if element.is_displayed() and element.is_enabled():
                             # ?�릭 가?�한지 ?�인
                             if 'disabled' not in element.get_attribute('class').lower():
+                                old_url, marker = self._navigation_snapshot()
                                 element.click()
                                 print(f"        ?�️ ?�음 ?�이지 ?�동 ?�공: {pattern}")
-                                time.sleep(2)
+                                wait_for_navigation(self.driver, old_url, marker, timeout=5)
                                 return True
                 except:
                     continue
@@ -2346,8 +3011,7 @@ class CafeCrawlerMigrated:
                     next_page = current_page + 1
                     page_selectors = [
                         f"a[href*='page={next_page}']",
-                        f"//a[text()='{next_page}']",
-                        f".pagination a:contains('{next_page}')"
+                        f"//a[text()='{next_page}']"
                     ]
 
                     for selector in page_selectors:
@@ -2358,9 +3022,10 @@ class CafeCrawlerMigrated:
                                 element = self.driver.find_element(By.CSS_SELECTOR, selector)
 
                             if element.is_displayed():
+                                old_url, marker = self._navigation_snapshot()
                                 element.click()
                                 print(f"        ?�️ ?�이지 {next_page}�??�동 ?�공")
-                                time.sleep(2)
+                                wait_for_navigation(self.driver, old_url, marker, timeout=5)
                                 return True
                         except:
                             pass
@@ -2563,49 +3228,27 @@ class CafeCrawlerMigrated:
     # Phase 7D: 검??�??�워??처리 메서??(10�?
     # =====================================================================
 
+    def build_keyword_matcher(self, keywords):
+        """실행 키워드 전체(+변형어)로 매처를 한 번만 생성"""
+        variations = self.get_keyword_variations if getattr(Config, 'KEYWORD_VARIATIONS', False) else None
+        self.keyword_matcher = KeywordMatcher(keywords, variations) if keywords else None
+        return self.keyword_matcher
+
     def check_keyword_match(self, title, content, keyword):
-        """?�워??매칭 ?�인 (?�상??버전)"""
+        """키워드 매칭 확인 – 실행 전체 키워드 매처로 제목/본문을 한 번만 훑음"""
         try:
             if not keyword or not title:
                 return False
 
-            # ?�스???�규??            title_clean = clean_text(title).lower()
-            keyword_clean = keyword.lower().strip()
-
-            # ?�버�??�보 (가?�씩�?출력)
-            if random.randint(1, 10) == 1:  # 10% ?�률�??�버�?출력
-                print(f"        ?�� ?�워??매칭 ?�버�?")
-                print(f"          ?�목: '{title_clean[:50]}...'")
-                print(f"          ?�워?? '{keyword_clean}'")
-
-            # 1. ?�확???�워??매칭
-            if keyword_clean in title_clean:
-                return True
-
-            # 2. 부�?매칭 (공백 ?�거)
-            title_no_space = title_clean.replace(" ", "")
-            keyword_no_space = keyword_clean.replace(" ", "")
-            if keyword_no_space in title_no_space:
-                return True
-
-            # 3. ?�워??변???�인
-            if hasattr(Config, 'KEYWORD_VARIATIONS') and Config.KEYWORD_VARIATIONS:
-                variations = self.get_keyword_variations(keyword)
-                for variation in variations:
-                    variation_clean = variation.lower()
-                    if variation_clean in title_clean:
-                        return True
-
-            # 4. ?�용?�서???�인 (?�는 경우)
-            if content:
-                content_clean = clean_text(content).lower()
-                if keyword_clean in content_clean:
-                    return True
+            matcher = self.keyword_matcher
+            if matcher is None or keyword not in matcher:
+                # crawl_cafe 밖에서 호출되었거나 새 키워드면 포함해서 다시 생성
+                matcher = self.build_keyword_matcher(list(matcher.keywords if matcher else ()) + [keyword])
 
-            return False
+            return matcher.matches(title, content, keyword)
 
         except Exception as e:
-            print(f"        ???�워??매칭 ?�류: {e}")
+            print(f"        ⚠️ 키워드 매칭 오류: {e}")
             return False
 
     def get_keyword_variations(self, keyword):
@@ -2668,10 +3311,16 @@ class CafeCrawlerMigrated:
         all_posts = []
         total_collected = 0
 
+        # 키워드별 매칭/태깅에 쓸 매처와 유사 게시글 색인은 실행마다 한 번만 생성
+        self.build_keyword_matcher(keywords)
+        self.near_dup_index = NearDuplicateIndex()
+        self.get_frontier()
+
         try:
             print(f"?�� 카페 ?�속 �?..")
             self.safe_driver_get(cafe_url)
-            safe_wait(self.driver, 3)
+            wait_for_frame(self.driver, "cafe_main", timeout=3)
+            self._learn_club_id(cafe_url)
 
             # 로그???�인
             if not self.driver:
@@ -2679,13 +3328,20 @@ class CafeCrawlerMigrated:
                 return []
 
             # ?�워?�별 검???�행
-            if keywords:
+            pool = self.get_driver_pool() if keywords and len(keywords) > 1 else None
+            if pool:
+                all_posts = self._crawl_keywords_pooled(pool, cafe_url, keywords)
+                total_collected = len(all_posts)
+            elif keywords:
                 for i, keyword in enumerate(keywords, 1):
                     print(f"\n?�� ?�워??{i}/{len(keywords)}: '{keyword}' 검???�작")
                     print("-" * 50)
 
                     # ?�워??검??게시글 ?�집
-                    keyword_posts = self.search_and_collect_posts(keyword)
+                    keyword_posts = self._journaled(
+                        f"keyword:{keyword}",
+                        lambda: self._stream_posts(self.search_and_collect_posts(keyword)))
+                    self._record_crawl_state(keyword_posts, keyword)
 
                     if keyword_posts:
                         print(f"??'{keyword}' 검??결과: {len(keyword_posts)}�?게시글 ?�집")
@@ -2701,14 +3357,15 @@ class CafeCrawlerMigrated:
             else:
                 # ?�워???�이 ?�체 최신 게시글 ?�집
                 print(f"?�� ?�체 최신 게시글 ?�집 모드")
-                all_posts = self.collect_recent_posts()
+                all_posts = self._journaled("recent", self.collect_recent_posts)
                 total_collected = len(all_posts)
 
+            with_content, with_comments, image_count = self._collection_summary(all_posts)
             print(f"\n?�� 최종 ?�집 결과:")
             print(f"   ?�� �?게시글 ?? {total_collected}�?)
-            print(f"   ?�� ?�용 ?�함: {sum(1 for post in all_posts if post.get('full_content'))}")
-            print(f"   ?�� ?��? ?�함: {sum(1 for post in all_posts if post.get('comments'))}")
-            print(f"   ?���??��?지 ?�함: {sum(len(post.get('images', [])) for post in all_posts)}")
+            print(f"   ?�� ?�용 ?�함: {with_content}")
+            print(f"   ?�� ?��? ?�함: {with_comments}")
+            print(f"   ?���??��?지 ?�함: {image_count}")
 
             # ?�집???�이???�??            self.posts_data = all_posts
 
@@ -2718,6 +3375,35 @@ class CafeCrawlerMigrated:
             print(f"???�롤�?�??�류 발생: {e}")
             return all_posts
 
+    def _crawl_keywords_pooled(self, pool, cafe_url, keywords):
+        """키워드를 드라이버 풀에 나눠 검색 (결과는 키워드 순서로 병합)"""
+        print(f"\n🚗 키워드 {len(keywords)}개를 드라이버 {len(pool.drivers)}개로 병렬 검색")
+
+        def search(driver, keyword):
+            worker = self._pool_worker(driver)
+
+            def collect():
+                worker.safe_driver_get(cafe_url)
+                wait_for_frame(driver, "cafe_main", timeout=3)
+                return worker._stream_posts(worker.search_and_collect_posts(keyword))
+
+            return worker._journaled(f"keyword:{keyword}", collect)
+
+        all_posts = []
+        for keyword, keyword_posts in zip(keywords, pool.map(search, keywords)):
+            self._record_crawl_state(keyword_posts, keyword)
+            if keyword_posts:
+                print(f"✅ '{keyword}' 검색 결과: {len(keyword_posts)}개 게시글 수집")
+                all_posts.extend(keyword_posts)
+            else:
+                print(f"⚠️ '{keyword}' 검색 결과 없음")
+
+        if len(all_posts) > Config.MAX_TOTAL_POSTS:
+            print(f"🎯 목표 수집량 {Config.MAX_TOTAL_POSTS}개 달성!")
+            all_posts = all_posts[:Config.MAX_TOTAL_POSTS]
+
+        return all_posts
+
     def search_and_collect_posts(self, keyword):
         """?�워?�로 검?�하??게시글 ?�집 (고급 ?�중 검???�용)"""
         try:
@@ -2761,6 +3447,42 @@ class CafeCrawlerMigrated:
 
     def enhance_posts_with_details(self, posts, keyword):
         """게시글 ?�세 ?�보 강화 (?�용, ?��?, ?��?지 ??"""
+        # 증분 크롤링: 이전 실행에서 이미 수집한 게시글은 다시 받지 않음
+        posts = self._skip_seen_posts(posts, keyword)
+        posts = self._skip_near_duplicates(posts)
+        if self.journal is None and self.post_sink is None:
+            return self._fetch_claimed(posts, keyword)
+
+        # 체크포인트: 이 작업 단위에서 상세 수집을 마친 게시글은 저널에서 복원
+        unit = self._journal_unit or "posts"
+        restored = [self.journal.fetched(unit, post) for post in posts] if self.journal is not None else []
+        pending = [post for post, saved in zip(posts, restored) if saved is None] if restored else posts
+        restored = [saved for saved in restored if saved is not None]
+        if restored:
+            print(f"    ♻️ 체크포인트에서 복원: {len(restored)}개 (새로 수집 {len(pending)}개)")
+
+        # 순차 수집은 게시글마다 이미 내보냈으므로 비동기 수집 결과만 여기서 기록됨
+        fetched = self._stream_posts(self._fetch_claimed(pending, keyword) if pending else [])
+        if self.journal is not None:
+            self.journal.record_posts(unit, fetched)
+        return (restored + fetched)[:Config.MAX_TOTAL_POSTS]
+
+    def _fetch_post_details(self, posts, keyword):
+        """상세 페이지 수집 (비동기 → 드라이버 풀 → 순차 순으로 가능한 방식 사용)"""
+        # 비동기 상세 수집 (aiohttp 설치 시): 동시 요청 + 호스트별 속도 제한
+        if getattr(Config, 'USE_ASYNC_DETAILS', False) and async_fetcher_available():
+            try:
+                cookies = self.session_bridge.cookie_dict() if self.session_bridge else None
+                return enhance_posts_async(posts, keyword, cookies=cookies,
+                                           comment_quota=self.comment_quota)
+            except Exception as e:
+                print(f"    ⚠️ 비동기 상세 수집 실패, 순차 수집으로 전환: {e}")
+
+        # 드라이버 풀이 있으면 상세 페이지를 나눠서 수집
+        pool = self.get_driver_pool() if len(posts) > 1 else None
+        if pool:
+            return self._enhance_posts_pooled(pool, posts, keyword)
+
         try:
             print(f"    ?�� ?�세 ?�보 ?�집 �?.. (�?{len(posts)}�?")
             enhanced_posts = []
@@ -2794,6 +3516,8 @@ class CafeCrawlerMigrated:
                     post['collection_time'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
                     post['enhanced'] = True
 
+                    post = self._emit_post(post)
+                    self._journal_post(post)
                     enhanced_posts.append(post)
 
                     # 진행�??�시
@@ -2817,6 +3541,28 @@ class CafeCrawlerMigrated:
             print(f"    ???�세 ?�보 ?�집 ?�류: {e}")
             return posts
 
+    def _enhance_posts_pooled(self, pool, posts, keyword):
+        """상세 페이지를 드라이버 풀로 수집 (게시글 순서 유지, 댓글 번호는 공유 CommentQuota 가 발급)"""
+        posts = posts[:Config.MAX_TOTAL_POSTS]
+        print(f"    🚗 상세 정보 병렬 수집: {len(posts)}개 (드라이버 {len(pool.drivers)}개)")
+
+        def enhance(driver, post):
+            worker = self._pool_worker(driver)
+            worker._claims_held = True
+            return worker.enhance_posts_with_details([post], keyword)[0]
+
+        enhanced_posts = []
+        for post, result in zip(posts, pool.map(enhance, posts)):
+            if result is None:
+                post['keyword'] = keyword
+                post['collection_time'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                post['enhanced'] = False
+                result = post
+            enhanced_posts.append(result)
+
+        print(f"    ✅ 상세 정보 병렬 수집 완료: {len(enhanced_posts)}개")
+        return enhanced_posts
+
     def fallback_basic_search(self, keyword):
         """기본 검??방식 (백업?? - ?�세 ?�보 ?�함"""
         try:
@@ -2858,7 +3604,6 @@ class CafeCrawlerMigrated:
                 return False
 
             self.safe_driver_get(search_url)
-            time.sleep(2)
 
             # ?�이지 로딩 ?��?            self.wait_for_page_load()
 
@@ -2876,6 +3621,7 @@ class CafeCrawlerMigrated:
         """최신 게시글 ?�집 (?�워???�이)"""
         posts = []
         current_page = 1
+        state = self._incremental_state()
 
         try:
             print(f"?�� 최신 게시글 ?�집 ?�작...")
@@ -2883,6 +3629,15 @@ class CafeCrawlerMigrated:
             # 카페 메인 ?�이지???�체글 ?�이지�??�동
             self.navigate_to_all_posts()
 
+            # 체크포인트: 마지막으로 끝낸 목록 페이지 다음부터 이어서 수집
+            last_page = self.journal.last_page("recent") if self.journal is not None else 0
+            if last_page:
+                list_url = self._current_list_url()
+                if self._is_paged_list_url(list_url) and self.goto_page(list_url, last_page + 1):
+                    posts = self.journal.unit_posts("recent")
+                    current_page = last_page + 1
+                    print(f"    ♻️ 체크포인트에서 이어서 수집: 페이지 {current_page}부터 (복원 {len(posts)}개)")
+
             while current_page <= Config.MAX_PAGES and len(posts) < Config.MAX_TOTAL_POSTS:
                 print(f"    ?�� ?�이지 {current_page} ?�집 �?..")
 
@@ -2892,15 +3647,32 @@ class CafeCrawlerMigrated:
                     print(f"    ?�️ ?�이지 {current_page}?�서 게시글??찾을 ???�습?�다.")
                     break
 
+                # 증분 크롤링: 이전 실행에서 본 게시글 번호에 닿으면 이 페이지까지만 수집
+                reached_seen = False
+                if state is not None:
+                    page_posts, reached_seen = state.filter_new(self._state_club_id(), board_key(), page_posts)
+                    if not page_posts:
+                        print(f"    ⏹️ 이전 실행에서 수집한 게시글에 도달 (페이지 {current_page})")
+                        break
+
+                collected_before = len(posts)
+
                 # ?�세 ?�보 ?�집 (?�요??
                 if Config.EXTRACT_FULL_CONTENT or Config.EXTRACT_COMMENTS:
                     detailed_posts = self.enhance_posts_with_details(page_posts, keyword=None)
                     posts.extend(detailed_posts)
                 else:
-                    posts.extend(page_posts)
+                    posts.extend(self._stream_posts(page_posts))
+
+                if self.journal is not None:
+                    self.journal.record_page("recent", current_page, posts[collected_before:])
 
                 print(f"    ???�이지 {current_page}: {len(page_posts)}�?게시글 ?�집 (�?{len(posts)}�?")
 
+                if reached_seen:
+                    print(f"    ⏹️ 이전 실행에서 수집한 게시글에 도달 (페이지 {current_page})")
+                    break
+
                 # ?�음 ?�이지�??�동
                 if not self.go_to_next_page():
                     print(f"    ?�️ 마�?�??�이지 ?�달")
@@ -2913,7 +3685,9 @@ class CafeCrawlerMigrated:
                     print(f"    ?�� 목표 ?�집??{Config.MAX_TOTAL_POSTS}�??�성!")
                     break
 
-            return posts[:Config.MAX_TOTAL_POSTS]
+            posts = posts[:Config.MAX_TOTAL_POSTS]
+            self._record_crawl_state(posts)
+            return posts
 
         except Exception as e:
             print(f"??최신 게시글 ?�집 �??�류: {e}")
@@ -2922,7 +3696,10 @@ class CafeCrawlerMigrated:
     def extract_posts(self):
         """?�재 ?�이지?�서 게시글 목록 추출"""
         try:
-            posts = []
+            posts = self._extract_posts_bulk()[:Config.MAX_POSTS_PER_PAGE]
+            if posts:
+                print(f"      ⚡ 일괄 추출: {len(posts)}개 게시글")
+                return posts
 
             # 기존 게시글 추출 로직 ?�용
             post_elements = self.find_post_elements()
@@ -3119,7 +3896,7 @@ class CafeCrawlerMigrated:
 
             if page_posts:
                 for post in page_posts:
-                    if isinstance(post, dict):
+                    if isinstance(post, Mapping):
                         # 메�??�이??추�?
                         post['search_strategy'] = strategy
                         post['search_keyword'] = keyword
@@ -3144,35 +3921,14 @@ class CafeCrawlerMigrated:
             return []
 
     def remove_duplicate_posts(self, posts):
-        """중복 게시글 ?�거"""
+        """중복 게시글 제거 – 게시글 번호 + 유사 게시글 (near_dup, 실행 전체 색인)"""
         try:
             if not posts:
                 return posts
-
-            seen_urls = set()
-            seen_titles = set()
-            unique_posts = []
-
-            for post in posts:
-                if not isinstance(post, dict):
-                    continue
-
-                post_url = post.get('url', '')
-                post_title = post.get('title', '')
-
-                # URL 기반 중복 ?�거
-                if post_url and post_url not in seen_urls:
-                    seen_urls.add(post_url)
-                    unique_posts.append(post)
-                # ?�목 기반 중복 ?�거 (URL???�거???�른 경우)
-                elif post_title and post_title not in seen_titles:
-                    seen_titles.add(post_title)
-                    unique_posts.append(post)
-
-            return unique_posts
+            return self._dedupe_posts(posts)
 
         except Exception as e:
-            print(f"??중복 ?�거 ?�류: {e}")
+            print(f"    ⚠️ 중복 제거 오류: {e}")
             return posts
 
     def apply_quality_filter(self, posts):
@@ -3184,7 +3940,7 @@ class CafeCrawlerMigrated:
             filtered_posts = []
 
             for post in posts:
-                if isinstance(post, dict) and self.passes_quality_check(post):
+                if isinstance(post, Mapping) and self.passes_quality_check(post):
                     filtered_posts.append(post)
 
             return filtered_posts
@@ -3196,7 +3952,7 @@ class CafeCrawlerMigrated:
     def passes_quality_check(self, post):
         """게시글 ?�질 검??""
         try:
-            if not isinstance(post, dict):
+            if not isinstance(post, Mapping):
                 return False
 
             title = post.get('title', '')
@@ -3243,7 +3999,7 @@ class CafeCrawlerMigrated:
             for i, element in enumerate(post_elements):
                 try:
                     post_info = self.extract_single_post_info(element, i)
-                    if post_info and isinstance(post_info, dict):
+                    if post_info and isinstance(post_info, Mapping):
                         if keyword:
                             title = post_info.get('title', '')
                             content = post_info.get('content', '')
@@ -3557,7 +4313,7 @@ class CafeCrawlerMigrated:
 
     def build_advanced_search_url(self, keyword, search_by=1, sort_by='date',
                                  date_filter='all', media_filter='all',
-                                 include_words='', exclude_words='', exact_phrase=''):
+                                 include_words='', exclude_words='', exact_phrase='', page=1):
         """고급 검??URL 구성"""
         try:
             import urllib.parse
@@ -3587,7 +4343,7 @@ class CafeCrawlerMigrated:
                 'search.searchdate': date_filter,
                 'search.media': media_filter,
                 'search.searchType': 'post',
-                'search.page.currentpage': 1
+                'search.page.currentpage': page
             }
 
             # URL 구성
@@ -4038,14 +4794,14 @@ class CafeCrawlerMigrated:
             if not href or not text or len(text) < 2:
                 return None
 
-            board_info = {
-                'name': text,
-                'url': href,
-                'board_type': 'unknown',
-                'is_hidden': False,
-                'menu_id': '',
-                'description': ''
-            }
+            board_info = Board(
+                name=text,
+                url=href,
+                board_type='unknown',
+                is_hidden=False,
+                menu_id='',
+                description=''
+            )
 
             # menu_id 추출 ?�도
             if 'menuid=' in href:
@@ -4063,7 +4819,7 @@ class CafeCrawlerMigrated:
     def is_valid_board_link(self, board_info):
         """게시??링크 ?�효??검??""
         try:
-            if not board_info or not isinstance(board_info, dict):
+            if not board_info or not isinstance(board_info, Mapping):
                 return False
 
             name = board_info.get('name', '')
@@ -4099,29 +4855,14 @@ class CafeCrawlerMigrated:
             return False
 
     def deduplicate_posts(self, posts):
-        """게시글 중복 ?�거"""
+        """중복 게시글 제거 – 게시글 번호 + 유사 게시글 (near_dup, 실행 전체 색인)"""
         try:
-            seen_urls = set()
-            seen_titles = set()
-            unique_posts = []
-
-            for post in posts:
-                post_url = post.get('url', '')
-                post_title = post.get('title', '')
-
-                # URL 기반 중복 ?�거
-                if post_url and post_url not in seen_urls:
-                    seen_urls.add(post_url)
-                    unique_posts.append(post)
-                # ?�목 기반 중복 ?�거 (URL???�거???�른 경우)
-                elif post_title and post_title not in seen_titles:
-                    seen_titles.add(post_title)
-                    unique_posts.append(post)
-
-            return unique_posts
+            if not posts:
+                return posts
+            return self._dedupe_posts(posts)
 
         except Exception as e:
-            print(f"    ??중복 ?�거 ?�류: {e}")
+            print(f"    ⚠️ 중복 제거 오류: {e}")
             return posts
 
     def save_results_to_excel(self, results, filename_prefix="complete_exploration"):
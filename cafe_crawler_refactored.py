@@ -20,6 +20,7 @@ from datetime import datetime
 # 기존 모듈들 임포트
 from config import Config
 from utils import clean_text, safe_wait, get_timestamp, print_progress, extract_post_number
+from utils.page_scripts import extract_board_rows
 from driver import create_driver
 from exporter import CafeDataExporter
 
@@ -572,12 +573,18 @@ class RefactoredNaverCafeCrawler:
         posts = []
 
         try:
-            # 게시글 요소 찾기
-            post_elements = self.find_post_elements()
+            # 한 번의 스크립트 호출로 목록 전체 추출, 실패 시 요소별 추출
+            bulk_posts = self.extract_posts_bulk()
+            if bulk_posts:
+                post_infos = bulk_posts
+            else:
+                post_infos = (
+                    self.extract_single_post_info(element, i)
+                    for i, element in enumerate(self.find_post_elements())
+                )
 
-            for i, element in enumerate(post_elements):
+            for i, post_info in enumerate(post_infos):
                 try:
-                    post_info = self.extract_single_post_info(element, i)
                     if post_info and isinstance(post_info, dict):
                         # 키워드 매칭 확인
                         if keyword:
@@ -596,6 +603,34 @@ class RefactoredNaverCafeCrawler:
 
         return posts
 
+    def extract_posts_bulk(self) -> List[Dict]:
+        """게시글 목록 일괄 추출 (execute_script 1회)"""
+        if not getattr(Config, 'USE_BULK_EXTRACTION', True):
+            return []
+
+        rows = extract_board_rows(self.driver)
+        if not rows:
+            return []
+
+        posts = []
+        for row in rows:
+            title = clean_text(row.get('title', ''))
+            url = row.get('url', '')
+            if not title or not url:
+                continue
+            if "read" not in url and "article" not in url.lower():
+                continue
+            posts.append({
+                'index': len(posts) + 1,
+                'title': title,
+                'url': url,
+                'author': row.get('author', ''),
+                'date': row.get('date', ''),
+                'views': row.get('views', ''),
+                'likes': row.get('likes', '')
+            })
+        return posts
+
     def find_post_elements(self) -> List:
         """게시글 요소 찾기 (안전 버전)"""
         patterns = [
@@ -0,0 +1,244 @@
+"""checkpoint.py
+장시간 크롤링(complete_crawl.bat)용 체크포인트 저널.
+
+완료한 작업 단위(키워드 검색, 게시판, 목록 페이지)와 상세 수집을 마친 게시글을
+추가 전용(append-only) JSONL 파일에 한 줄씩 기록한다. 크래시·캡차·Ctrl-C 로
+중단된 뒤 --resume 으로 다시 실행하면 저널을 재생하여 끝난 작업은 건너뛰고,
+수집해 둔 게시글은 다시 받지 않고 복원한다.
+
+레코드 형식 (한 줄에 하나)
+-------------------------
+{"t": "post", "unit": "keyword:채용", "key": <article_key>, "post": {...}}
+{"t": "page", "unit": "recent", "page": 3}
+{"t": "done", "unit": "keyword:채용", "posts": 120}
+{"t": "done", "unit": "board:<url>", "data": {...}}
+{"t": "meta", "key": "stream_file", "value": "output/cafe_posts_....jsonl"}
+
+Usage
+-----
+from checkpoint import CrawlJournal
+
+journal = CrawlJournal(resume=True)
+if not journal.is_done("keyword:채용"):
+    posts = crawl("채용")
+    journal.mark_done("keyword:채용", posts)
+"""
+# Disclaimer: use at your own risk. The authors take no responsibility for misuse.
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from config import Config
+from records import to_plain
+from utils import article_key
+
+__all__ = ["default_journal_path", "post_key", "CrawlJournal"]
+
+JOURNAL_FILENAME = "crawl_checkpoint.jsonl"
+#: 작업 단위 사이에서 fsync 없이 쌓아 두는 최대 게시글 기록 수
+FSYNC_EVERY = 50
+#: 기록 즉시 디스크까지 동기화하는 레코드 (작업 단위 경계)
+SYNC_KINDS = frozenset({"page", "done", "meta"})
+
+
+def default_journal_path() -> str:
+    """Config.CHECKPOINT_FILE 또는 출력 폴더의 crawl_checkpoint.jsonl"""
+    path = getattr(Config, 'CHECKPOINT_FILE', None)
+    if path:
+        return path
+    return os.path.join(getattr(Config, 'OUTPUT_DIR', 'output'), JOURNAL_FILENAME)
+
+
+def post_key(post: Dict[str, Any]) -> Union[int, str]:
+    """저널에서 게시글을 식별하는 키
+
+    utils.article_key – URL 형식이 달라도 같은 글이면 같은 정수. URL 이 없으면
+    제목|작성자.
+    """
+    url = post.get('url')
+    if url:
+        return article_key(url)
+    return f"{post.get('title', '')}|{post.get('author', '')}"
+
+
+class CrawlJournal:
+    """추가 전용 JSONL 체크포인트 저널"""
+
+    def __init__(self, path: Optional[str] = None, resume: bool = False):
+        """
+        Parameters
+        ----------
+        path : str | None
+            저널 파일 경로. None 이면 default_journal_path().
+        resume : bool
+            True 면 기존 저널을 재생해 이어서 기록한다. False 면 기존 저널을
+            .bak 으로 옮겨 두고 새로 시작한다 (실수로 --resume 을 빠뜨려도 보존).
+        """
+        self.path = path or default_journal_path()
+        self._lock = threading.Lock()
+        self._posts: Dict[Tuple[str, Union[int, str]], Dict[str, Any]] = {}
+        self._unit_keys: Dict[str, List[Union[int, str]]] = {}
+        self._pages: Dict[str, int] = {}
+        self._done: Dict[str, Any] = {}
+        self._meta: Dict[str, Any] = {}
+        self._pending_newline = False
+        self._fsync_every = max(int(getattr(Config, 'CHECKPOINT_FSYNC_EVERY', FSYNC_EVERY)), 1)
+        self._unsynced = 0
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        if resume:
+            self._replay()
+        elif os.path.exists(self.path):
+            os.replace(self.path, f"{self.path}.bak")
+
+        self._file = open(self.path, "a", encoding="utf-8")
+        if self._pending_newline:
+            self._file.write("\n")
+
+    # ------------------------------------------------------------------
+    # persistence
+    # ------------------------------------------------------------------
+
+    def _replay(self):
+        """기존 저널을 읽어 메모리 색인 복원 (중단으로 잘린 마지막 줄은 무시)"""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return
+
+        # 중단으로 잘린 마지막 줄 뒤에 이어 쓰지 않도록 줄바꿈부터 추가
+        self._pending_newline = bool(lines) and not lines[-1].endswith("\n")
+
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            self._apply(record)
+
+        if self._done or self._posts:
+            print(f"    ♻️ 체크포인트 복원: 완료 작업 {len(self._done)}개, 게시글 {len(self._posts)}개")
+
+    def _apply(self, record: Dict[str, Any]):
+        kind, unit = record.get("t"), record.get("unit", "")
+        if kind == "post":
+            key = record["key"]
+            if (unit, key) not in self._posts:
+                self._unit_keys.setdefault(unit, []).append(key)
+            self._posts[(unit, key)] = record["post"]
+        elif kind == "page":
+            self._pages[unit] = max(self._pages.get(unit, 0), record["page"])
+        elif kind == "done":
+            self._done[unit] = record.get("data") if "data" in record else None
+        elif kind == "meta":
+            self._meta[record["key"]] = record.get("value")
+
+    def _write(self, record: Dict[str, Any]):
+        """레코드 한 줄 추가 후 플러시
+
+        매 줄 OS 버퍼까지는 플러시하므로 프로세스가 죽어도 남는다. fsync 는 작업
+        단위 경계(page/done/meta) 와 게시글 FSYNC_EVERY 건마다만 한다.
+        """
+        line = json.dumps(record, ensure_ascii=False, default=to_plain)
+        with self._lock:
+            self._apply(record)
+            if self._file.closed:
+                return
+            self._file.write(line + "\n")
+            self._file.flush()
+            self._unsynced += 1
+            if record.get("t") in SYNC_KINDS or self._unsynced >= self._fsync_every:
+                self._sync()
+
+    def _sync(self):
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.flush()
+                if self._unsynced:
+                    self._sync()
+                self._file.close()
+
+    def discard(self):
+        """정상 종료 후 저널 삭제 (다음 실행은 처음부터)"""
+        self.close()
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+    # ------------------------------------------------------------------
+    # posts
+    # ------------------------------------------------------------------
+
+    def record_post(self, unit: str, post: Dict[str, Any]):
+        """수집을 마친 게시글 기록 (같은 작업 단위에 이미 있으면 무시)"""
+        key = post_key(post)
+        if (unit, key) in self._posts:
+            return
+        self._write({"t": "post", "unit": unit, "key": key, "post": post})
+
+    def record_posts(self, unit: str, posts: Iterable[Dict[str, Any]]):
+        for post in posts:
+            self.record_post(unit, post)
+
+    def fetched(self, unit: str, post: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """이 작업 단위에서 이미 상세 수집을 마친 게시글 (없으면 None)"""
+        saved = self._posts.get((unit, post_key(post)))
+        return saved if saved and saved.get('enhanced') else None
+
+    def unit_posts(self, unit: str) -> List[Dict[str, Any]]:
+        """작업 단위에 기록된 게시글 (기록 순서)"""
+        return [self._posts[(unit, key)] for key in self._unit_keys.get(unit, [])]
+
+    # ------------------------------------------------------------------
+    # work units
+    # ------------------------------------------------------------------
+
+    def is_done(self, unit: str) -> bool:
+        return unit in self._done
+
+    def mark_done(self, unit: str, result: Any = None):
+        """작업 단위 완료 기록 – 게시글 목록이면 게시글을, 그 밖에는 결과 자체를 저장"""
+        if isinstance(result, list):
+            self.record_posts(unit, result)
+            self._write({"t": "done", "unit": unit, "posts": len(result)})
+        else:
+            self._write({"t": "done", "unit": unit, "data": result})
+
+    def unit_result(self, unit: str) -> Any:
+        """완료된 작업 단위의 저장된 결과 (mark_done 에 넘긴 값과 같은 형태)"""
+        data = self._done.get(unit)
+        return data if data is not None else self.unit_posts(unit)
+
+    def record_page(self, unit: str, page: int, posts: Iterable[Dict[str, Any]] = ()):
+        """목록 page 번째 페이지까지 처리 완료 기록"""
+        self.record_posts(unit, posts)
+        self._write({"t": "page", "unit": unit, "page": page})
+
+    def last_page(self, unit: str) -> int:
+        """마지막으로 처리를 마친 목록 페이지 (없으면 0)"""
+        return self._pages.get(unit, 0)
+
+    # ------------------------------------------------------------------
+    # run metadata
+    # ------------------------------------------------------------------
+
+    def set_meta(self, key: str, value: Any):
+        """실행 정보 기록 (예: 스트리밍 출력 파일 경로 – 재개 시 같은 파일에 이어 씀)"""
+        if self._meta.get(key) != value:
+            self._write({"t": "meta", "key": key, "value": value})
+
+    def meta(self, key: str, default: Any = None) -> Any:
+        return self._meta.get(key, default)
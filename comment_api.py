@@ -0,0 +1,219 @@
+"""comment_api.py
+댓글 API 수집기 – 게시글의 댓글 전체를 JSON 페이지 단위로 받아 답글 트리로 정리.
+
+extract_comments 는 화면(DOM) 에 렌더링된 댓글만 읽고 MAX_COMMENTS_PER_POST 에서
+멈추며, 답글은 페이지 전체를 한 번 더 훑어 찾는다. 이 모듈은 카페 댓글 API 를
+HTTP 세션(SessionBridge) 으로 페이지마다 요청해
+
+- 페이지를 받는 대로 댓글을 한 건씩 흘려보내고 (generator)
+- refId(부모 댓글 번호) 로 depth / parent_id 를 한 번의 순회로 채운다.
+
+API 주소는 Config.COMMENT_API_URL 로 바꿀 수 있어 로컬 테스트 서버에도 붙일 수
+있다 ({club_id}, {article_id}, {page} 자리 표시자).
+
+Usage
+-----
+from comment_api import CommentFetcher
+
+fetcher = CommentFetcher(crawler.session_bridge)
+for comment in fetcher.iter_comments(club_id, article_id):
+    ...
+comments = fetcher.fetch_post_comments(post_url, start_id=1)
+"""
+# Disclaimer: use at your own risk. The authors take no responsibility for misuse.
+
+from __future__ import annotations
+
+import threading
+from datetime import datetime
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from config import Config
+from crawler import create_session
+from records import Comment
+from utils import article_ref, clean_text
+from utils.article_url import PSEUDO_CLUB_BASE
+
+__all__ = ["DEFAULT_COMMENT_API_URL", "comment_api_url", "parse_comment_page",
+           "build_comment_tree", "CommentQuota", "CommentFetcher"]
+
+DEFAULT_COMMENT_API_URL = (
+    "https://apis.naver.com/cafe-web/cafe-articleapi/v2/cafes/{club_id}/articles/{article_id}"
+    "/comments/pages/{page}?requestFrom=A&orderBy=asc"
+)
+#: 게시글 하나에서 요청하는 최대 페이지 수
+MAX_PAGES = 100
+API_HEADERS = {"Referer": "https://cafe.naver.com/", "Accept": "application/json"}
+
+
+def comment_api_url(club_id: int, article_id: int, page: int, template: Optional[str] = None) -> str:
+    template = template or getattr(Config, 'COMMENT_API_URL', None) or DEFAULT_COMMENT_API_URL
+    return template.format(club_id=club_id, article_id=article_id, page=page)
+
+
+def parse_comment_page(payload: Any) -> Tuple[List[Dict[str, Any]], Optional[bool]]:
+    """API 응답 → (댓글 항목 목록, 다음 페이지 여부 – 응답에 없으면 None)
+
+    {"result": {"comments": {"items": [...]}}} 와 그보다 얕은 형태를 모두 받는다.
+    """
+    node = payload.get("result", payload) if isinstance(payload, dict) else payload
+    comments = node.get("comments", node) if isinstance(node, dict) else node
+    items = comments.get("items", []) if isinstance(comments, dict) else comments
+    if not isinstance(items, list):
+        items = []
+
+    has_next = None
+    for holder in (comments, node):
+        if isinstance(holder, dict):
+            if "hasNext" in holder:
+                has_next = bool(holder["hasNext"])
+                break
+            if "isLastPage" in holder:
+                has_next = not holder["isLastPage"]
+                break
+    return [item for item in items if isinstance(item, dict)], has_next
+
+
+def _date(value: Any) -> str:
+    """epoch 밀리초 → 카페 화면과 같은 'YYYY.MM.DD. HH:MM' (문자열은 그대로)"""
+    if isinstance(value, (int, float)) and value > 0:
+        return datetime.fromtimestamp(value / 1000).strftime('%Y.%m.%d. %H:%M')
+    return str(value) if value else '날짜 없음'
+
+
+def _author(item: Dict[str, Any]) -> str:
+    writer = item.get("writer")
+    if isinstance(writer, dict):
+        return writer.get("nick") or writer.get("nickname") or '익명'
+    return item.get("nick") or item.get("author") or '익명'
+
+
+def build_comment_tree(items: Iterable[Dict[str, Any]], start_id: int = 1,
+                       min_length: int = 0) -> Iterator[Comment]:
+    """API 항목 → Comment (한 번 순회, 입력 순서 유지)
+
+    답글(refId ≠ id) 은 이미 나온 부모 댓글의 comment_id 를 parent_id 로,
+    부모 depth + 1 을 depth 로 받는다. 삭제됐거나 min_length 보다 짧은 댓글은
+    내보내지 않으며, 그 답글의 parent_id 는 None 이다.
+    """
+    emitted: Dict[Any, Optional[Comment]] = {}
+    next_id = start_id
+    for item in items:
+        api_id = item.get("id")
+        ref_id = item.get("refId")
+        is_reply = bool(item.get("isRef")) or (ref_id is not None and ref_id != api_id)
+        parent = emitted.get(ref_id) if is_reply else None
+
+        content = clean_text(item.get("content") or "")
+        if item.get("isDeleted") or not content or len(content) < min_length:
+            emitted[api_id] = None
+            continue
+
+        comment = Comment(
+            comment_id=next_id,
+            author=_author(item),
+            content=content,
+            date=_date(item.get("updateDate") or item.get("date")),
+            like_count=item.get("likeCount") or item.get("likeItCount") or 0,
+            depth=parent.depth + 1 if parent is not None else (2 if is_reply else 1),
+            parent_id=parent.comment_id if parent is not None else None
+        )
+        emitted[api_id] = comment
+        next_id += 1
+        yield comment
+
+
+class CommentQuota:
+    """실행 전체 댓글 수 한도 + 댓글 번호 발급 (드라이버 풀 작업자와 공유, 스레드 안전)
+
+    게시글마다 1부터 번호를 매긴 댓글을 take() 에 넘기면 남은 한도만큼 자른 뒤
+    실행 전체에서 겹치지 않는 번호로 다시 매긴다 (parent_id 도 함께).
+    """
+
+    def __init__(self, limit: Optional[int] = None):
+        self.limit = limit if limit is not None else getattr(Config, 'MAX_TOTAL_COMMENTS', 1000)
+        self.collected = 0
+        self._lock = threading.Lock()
+
+    def remaining(self) -> int:
+        with self._lock:
+            return max(self.limit - self.collected, 0)
+
+    def take(self, comments: Iterable[Comment]) -> List[Comment]:
+        """한도 안의 댓글만 남겨 번호를 다시 매기고 반환"""
+        with self._lock:
+            granted = list(comments)[:max(self.limit - self.collected, 0)]
+            offset = self.collected
+            self.collected += len(granted)
+
+        new_ids = {}
+        for idx, comment in enumerate(granted, offset + 1):
+            new_ids[comment.get('comment_id')] = idx
+            comment['comment_id'] = idx
+            if comment.get('parent_id') is not None:
+                comment['parent_id'] = new_ids.get(comment['parent_id'])
+        return granted
+
+
+class CommentFetcher:
+    """댓글 API 페이지 요청 + 답글 트리 구성"""
+
+    def __init__(self, http=None, url_template: Optional[str] = None,
+                 max_pages: Optional[int] = None):
+        """
+        Parameters
+        ----------
+        http : SessionBridge | requests.Session | None
+            get(url, **kwargs) → Response 를 제공하는 객체. SessionBridge 를
+            넘기면 세션 만료 시 브라우저에서 쿠키를 갱신한다. None 이면
+            crawler.create_session() (비로그인).
+        url_template : str | None
+            API 주소 (기본: Config.COMMENT_API_URL 또는 DEFAULT_COMMENT_API_URL)
+        max_pages : int | None
+            게시글당 최대 페이지 수 (기본: Config.COMMENT_API_MAX_PAGES)
+        """
+        self.http = http if http is not None else create_session()
+        self.url_template = url_template
+        self.max_pages = max_pages or getattr(Config, 'COMMENT_API_MAX_PAGES', MAX_PAGES)
+
+    def _get_json(self, url: str) -> Any:
+        response = self.http.get(url, headers=API_HEADERS)
+        response.raise_for_status()
+        return response.json()
+
+    def pages(self, club_id: int, article_id: int) -> Iterator[List[Dict[str, Any]]]:
+        """댓글 항목을 페이지마다 돌려줌
+
+        빈 페이지, 이미 받은 항목만 있는 페이지(마지막 페이지를 반복하는 응답),
+        hasNext=False 중 하나를 만나면 멈춘다.
+        """
+        seen = set()
+        for page in range(1, self.max_pages + 1):
+            items, has_next = parse_comment_page(
+                self._get_json(comment_api_url(club_id, article_id, page, self.url_template))
+            )
+            new_items = [item for item in items if item.get("id") is None or item.get("id") not in seen]
+            if not new_items:
+                return
+            seen.update(item.get("id") for item in new_items)
+            yield new_items
+            if has_next is False:
+                return
+
+    def iter_comments(self, club_id: int, article_id: int, start_id: int = 1,
+                      limit: Optional[int] = None, min_length: Optional[int] = None) -> Iterator[Comment]:
+        """게시글 댓글 전체를 순서대로 한 건씩 (limit 건에서 멈추면 남은 페이지는 요청하지 않음)"""
+        if min_length is None:
+            min_length = getattr(Config, 'COMMENT_CONTENT_MIN_LENGTH', 5)
+        items = (item for page in self.pages(club_id, article_id) for item in page)
+        comments = build_comment_tree(items, start_id=start_id, min_length=min_length)
+        return islice(comments, limit) if limit is not None else comments
+
+    def fetch_post_comments(self, post_url: str, start_id: int = 1,
+                            limit: Optional[int] = None) -> Optional[List[Comment]]:
+        """게시글 URL 의 댓글 목록 – clubid 를 알 수 없는 URL 이면 None"""
+        ref = article_ref(post_url)
+        if ref is None or not ref[0] or ref[0] >= PSEUDO_CLUB_BASE:
+            return None
+        return list(self.iter_comments(ref[0], ref[1], start_id=start_id, limit=limit))
@@ -37,6 +37,16 @@ if /i not "%confirm%"=="y" (
     exit /b 0
 )
 
+echo.
+
+:: 중단된 이전 실행이 있으면 체크포인트에서 이어서 진행
+set "RESUME_ARG="
+if not exist "output\crawl_checkpoint.jsonl" goto start_crawl
+set /p "resume=💾 중단된 이전 크롤링이 있습니다. 이어서 진행하시겠습니까? (Y/n): "
+if /i not "%resume%"=="n" set "RESUME_ARG=--resume"
+
+:start_crawl
+
 echo.
 echo 🚀 완전 크롤링을 시작합니다...
 echo ================================================
@@ -47,7 +57,7 @@ echo.
 echo y
 echo 2
 echo y
-) | python -u main.py
+) | python -u main.py --checkpoint %RESUME_ARG%
 
 if %errorlevel% equ 0 (
     echo.
@@ -0,0 +1,152 @@
+"""crawl_state.py
+증분 크롤링용 상태 저장소.
+
+카페(club) + 게시판(menu) 별로 지금까지 본 가장 큰 articleid(high-water mark)를
+JSON 파일에 기록한다. 다음 실행에서는 목록을 최신순으로 내려가다가 이미 본
+게시글 번호에 닿는 순간 페이지 탐색을 멈추고, 새 게시글만 상세 수집한다.
+
+Usage
+-----
+from crawl_state import CrawlState
+
+state = CrawlState()
+new_posts, reached_seen = state.filter_new(club_id, menu_id, page_posts)
+...
+state.update(club_id, menu_id, new_posts)
+state.save()
+"""
+# Disclaimer: use at your own risk. The authors take no responsibility for misuse.
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from utils.article_url import article_ref
+
+try:
+    from config import Config
+except ImportError:  # crawler.py 단독 실행 – 아래 getattr 기본값 사용
+    Config = None
+
+__all__ = ["ALL_POSTS", "default_state_path", "board_key", "article_id_of", "CrawlState"]
+
+#: menu 자리에 쓰는 전체글 목록 키
+ALL_POSTS = "all"
+STATE_FILENAME = "crawl_state.json"
+
+
+def default_state_path() -> str:
+    """Config.CRAWL_STATE_FILE 또는 출력 폴더의 crawl_state.json"""
+    path = getattr(Config, 'CRAWL_STATE_FILE', None)
+    if path:
+        return path
+    return os.path.join(getattr(Config, 'OUTPUT_DIR', 'output'), STATE_FILENAME)
+
+
+def board_key(menu_id=None, keyword: Optional[str] = None) -> str:
+    """상태 키의 게시판 부분 – 최신순 키워드 검색은 검색어별로 따로 기록"""
+    if keyword:
+        return f"search:{keyword}"
+    return str(menu_id) if menu_id else ALL_POSTS
+
+
+def article_id_of(post: Dict[str, Any]) -> Optional[int]:
+    """게시글 dict 의 articleid (URL 에서 추출, 없으면 None)"""
+    article_id = post.get('article_id')
+    if not article_id:
+        ref = article_ref(post.get('url', ''))
+        return ref[1] if ref else None
+    try:
+        return int(article_id)
+    except (TypeError, ValueError):
+        return None
+
+
+class CrawlState:
+    """club + menu 별 high-water mark 저장소 (JSON 파일)"""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or default_state_path()
+        self._lock = threading.Lock()
+        self._boards: Dict[str, Dict[str, Any]] = {}
+        self.load()
+
+    @staticmethod
+    def key(club_id, menu_id=None) -> str:
+        return f"{club_id}:{menu_id or ALL_POSTS}"
+
+    # ------------------------------------------------------------------
+    # persistence
+    # ------------------------------------------------------------------
+
+    def load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                self._boards = json.load(f).get("boards", {})
+        except FileNotFoundError:
+            self._boards = {}
+        except (OSError, ValueError) as e:
+            print(f"    ⚠️ 크롤링 상태 파일을 읽을 수 없어 새로 시작: {e}")
+            self._boards = {}
+
+    def save(self):
+        """임시 파일에 쓴 뒤 교체 (중간에 중단돼도 기존 상태 보존)"""
+        with self._lock:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"boards": self._boards}, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+
+    # ------------------------------------------------------------------
+    # high-water marks
+    # ------------------------------------------------------------------
+
+    def high_water(self, club_id, menu_id=None) -> int:
+        """이전 실행까지 본 가장 큰 articleid (처음이면 0)"""
+        return self._boards.get(self.key(club_id, menu_id), {}).get("max_article_id", 0)
+
+    def filter_new(self, club_id, menu_id,
+                   posts: Iterable[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], bool]:
+        """새 게시글만 남기고, 이미 본 번호에 도달했는지 함께 반환
+
+        articleid 를 알 수 없는 게시글은 새 게시글로 취급한다.
+        공지처럼 상단에 고정된 오래된 글 때문에 멈추지 않도록, 도달 여부는
+        새 게시글 뒤에 이미 본 게시글이 나오거나 페이지 전체가 이미 본
+        게시글일 때만 참이 된다.
+        """
+        mark = self.high_water(club_id, menu_id)
+        new_posts: List[Dict[str, Any]] = []
+        seen_any = seen_after_new = False
+        for post in posts:
+            article_id = article_id_of(post)
+            if article_id is None or article_id > mark:
+                new_posts.append(post)
+            else:
+                seen_any = True
+                seen_after_new = seen_after_new or bool(new_posts)
+        return new_posts, seen_after_new or (seen_any and not new_posts)
+
+    def update(self, club_id, menu_id, posts: Iterable[Dict[str, Any]],
+               failed: Iterable[Dict[str, Any]] = ()) -> int:
+        """수집한 게시글로 high-water mark 갱신 후 새 값 반환
+
+        상세 수집에 실패한 게시글(failed)이 있으면 다음 실행에서 다시 가져오도록
+        mark 를 그 번호 아래로 제한한다.
+        """
+        ids = [article_id for article_id in map(article_id_of, posts) if article_id]
+        failed_ids = [article_id for article_id in map(article_id_of, failed) if article_id]
+        if failed_ids:
+            ids = [article_id for article_id in ids if article_id < min(failed_ids)]
+        with self._lock:
+            entry = self._boards.setdefault(self.key(club_id, menu_id), {"max_article_id": 0})
+            if ids:
+                entry["max_article_id"] = max(entry["max_article_id"], max(ids))
+            entry["updated"] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            return entry["max_article_id"]
@@ -1,10 +1,245 @@
 # Disclaimer: use at your own risk. The authors take no responsibility for misuse.
+"""Browserless crawl mode for public Naver Cafes.
+
+Every request goes through one shared ``requests.Session`` with a tuned
+connection pool, keep-alive, compressed transfer and retries, so list,
+search and article pages are fetched without paying for a new TCP+TLS
+handshake or a browser round-trip each time. Every attempt, retries
+included, takes a token from a per-host ``utils.rate_limiter`` bucket, so
+parallel workers cannot exceed the politeness budget.
+
+Sessions from ``create_session()`` share the browser's limiter
+(``RATE_LIMIT_PER_HOST``, 1 req/s by default), which is what the Selenium
+side wants. ``crawl()`` uses its own limiter at ``DEFAULT_RATE`` (or
+``--rate``): the workers overlap network latency but together never exceed
+that rate. Parsing is delegated to ``page_parser`` so results have the same
+shape as the Selenium crawler.
+
+Only ``requests`` and ``beautifulsoup4`` are required. Without ``config.py``
+or Selenium the dependency-free helpers in ``utils`` are loaded straight from
+their files, incremental mode is unavailable and pages are parsed with the
+basic title/body selectors.
+"""
+import argparse
+import importlib.util
+import os
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
 import requests
+from requests.adapters import HTTPAdapter
+
 from bs4 import BeautifulSoup
 
 
-def fetch_article(club_id: str, article_id: str) -> dict:
+def _load_utils_module(name: str):
+    """Import ``utils/<name>.py`` without running ``utils/__init__``.
+
+    The module is registered under its package name so later
+    ``from utils.<name> import ...`` statements reuse the same instance.
+    """
+    full_name = f"utils.{name}"
+    module = sys.modules.get(full_name)
+    if module is None:
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "utils", f"{name}.py")
+        spec = importlib.util.spec_from_file_location(full_name, path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[full_name] = module
+        spec.loader.exec_module(module)
+    return module
+
+
+try:
+    import utils  # noqa: F401  (utils/__init__ imports selenium)
+except ImportError:
+    for _name in ("article_url", "rate_limiter"):
+        _load_utils_module(_name)
+
+from utils.rate_limiter import RateLimiter, get_rate_limiter
+
+try:
+    from crawl_state import CrawlState, board_key
+except ImportError:  # config.py missing
+    CrawlState = board_key = None
+
+try:
+    from page_parser import parse_article_page, parse_post_list
+except ImportError:  # config.py or selenium missing
+    parse_article_page = parse_post_list = None
+
+try:
+    # requests only decodes "br" when a brotli implementation is installed
+    import brotli  # noqa: F401
+    _ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    _ACCEPT_ENCODING = "gzip, deflate"
+
+BASE_URL = "https://cafe.naver.com/"
+ARTICLE_URL = BASE_URL + "ArticleRead.nhn"
+LIST_URL = BASE_URL + "ArticleList.nhn"
+SEARCH_URL = BASE_URL + "ArticleSearchList.nhn"
+
+#: (connect, read) timeout in seconds
+DEFAULT_TIMEOUT = (5, 15)
+#: connections kept alive per host; also the default worker count
+POOL_SIZE = 16
+#: requests per second per host for crawl() (its own limiter, not the browser's)
+DEFAULT_RATE = 4.0
+#: retries per request for connection errors and BACKOFF_STATUS responses
+MAX_RETRIES = 3
+BACKOFF_FACTOR = 0.5
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/120.0.0.0 Safari/537.36"
+)
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+#: statuses that make the rate limiter back off
+BACKOFF_STATUS = (429, 500, 502, 503, 504)
+
+
+def _retry_delay(response: Optional[requests.Response], attempt: int) -> float:
+    """Retry-After seconds when the server sent them, else exponential backoff."""
+    retry_after = response.headers.get("Retry-After", "") if response is not None else ""
+    if retry_after.isdigit():
+        return float(retry_after)
+    return BACKOFF_FACTOR * (2 ** attempt)
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """HTTPAdapter that takes a limiter token for every attempt, retries included.
+
+    Retries live here rather than in urllib3's ``Retry`` so that they are
+    throttled and reported to the limiter like any other request.
+    """
+
+    def __init__(self, limiter: Optional[RateLimiter] = None,
+                 retries: int = MAX_RETRIES, **kwargs):
+        self.limiter = limiter
+        self.retries = retries
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        limiter = self.limiter or get_rate_limiter()
+        retryable = request.method in ("GET", "HEAD")
+        attempt = 0
+        while True:
+            limiter.acquire(request.url)
+            start = time.monotonic()
+            try:
+                response = super().send(request, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                limiter.record(request.url, ok=False)
+                if not retryable or attempt >= self.retries:
+                    raise
+                response = None
+            else:
+                ok = response.status_code not in BACKOFF_STATUS
+                limiter.record(request.url, ok=ok, elapsed=time.monotonic() - start)
+                if ok or not retryable or attempt >= self.retries:
+                    return response
+                response.close()
+            time.sleep(_retry_delay(response, attempt))
+            attempt += 1
+
+
+def create_session(pool_size: int = POOL_SIZE,
+                   limiter: Optional[RateLimiter] = None) -> requests.Session:
+    """Return a new session with pooled keep-alive connections and retries.
+
+    ``limiter`` defaults to the process-wide limiter shared with the browser.
+    """
+    adapter = RateLimitedAdapter(limiter=limiter, pool_connections=4, pool_maxsize=pool_size)
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({
+        "User-Agent": USER_AGENT,
+        "Accept": "text/html,application/xhtml+xml,application/json;q=0.9,*/*;q=0.8",
+        "Accept-Language": "ko-KR,ko;q=0.9,en;q=0.8",
+        "Accept-Encoding": _ACCEPT_ENCODING,
+        "Connection": "keep-alive",
+        "Referer": BASE_URL,
+    })
+    return session
+
+
+def get_session() -> requests.Session:
+    """Return the process-wide shared session, creating it on first use."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = create_session()
+    return _session
+
+
+def fetch_html(url: str, params: Optional[dict] = None,
+               session: Optional[requests.Session] = None) -> str:
+    """GET ``url`` through the shared session and return the decoded body."""
+    response = (session or get_session()).get(url, params=params, timeout=DEFAULT_TIMEOUT)
+    response.raise_for_status()
+    return response_text(response)
+
+
+def response_text(response: requests.Response) -> str:
+    """Decode a response body, sniffing the charset when none was declared."""
+    # Older cafe pages are served as MS949 without a charset header
+    if not response.encoding or response.encoding.lower() == "iso-8859-1":
+        response.encoding = response.apparent_encoding
+    return response.text
+
+
+def _parse_article_basic(html: str) -> dict:
+    """Title and body only, for installs without ``page_parser``."""
+    soup = BeautifulSoup(html, "html.parser")
+    title_elem = soup.select_one("div.tit-box span.b")
+    content_elem = soup.select_one("#tbody")
+    return {
+        "title": title_elem.get_text(strip=True) if title_elem else "",
+        "content": content_elem.get_text(strip=True) if content_elem else "",
+        "comments": [],
+        "images": [],
+        "attachments": [],
+    }
+
+
+def _parse_post_list_basic(html: str) -> List[Dict]:
+    """Article links of a list/search page, for installs without ``page_parser``."""
+    soup = BeautifulSoup(html, "html.parser")
+    posts, seen = [], set()
+    for link in soup.select("a[href*='articleid=']"):
+        url = requests.compat.urljoin(BASE_URL, link["href"])
+        title = link.get_text(strip=True)
+        if title and url not in seen:
+            seen.add(url)
+            posts.append({"title": title, "url": url, "author": "", "date": "",
+                          "views": 0, "likes": 0, "content": ""})
+    return posts
+
+
+def _parse_article(html: str) -> dict:
+    return (parse_article_page or _parse_article_basic)(html)
+
+
+def _parse_list(html: str) -> List[Dict]:
+    return (parse_post_list or _parse_post_list_basic)(html)
+
+
+def article_url(club_id: str, article_id: str) -> str:
+    """Build the canonical ArticleRead URL for an article."""
+    return f"{ARTICLE_URL}?clubid={club_id}&articleid={article_id}"
+
+
+def fetch_article(club_id: str, article_id: str,
+                  session: Optional[requests.Session] = None) -> dict:
     """Fetch an article from Naver Cafe using club_id and article_id.
 
     Parameters
@@ -13,39 +248,188 @@ def fetch_article(club_id: str, article_id: str) -> dict:
         Naver Cafe club ID.
     article_id : str
         Article ID within the cafe.
+    session : requests.Session, optional
+        Session to use instead of the shared one.
 
     Returns
     -------
     dict
-        A dictionary containing the article URL, title, and text content.
+        A dictionary containing the article URL, title, and text content,
+        plus comments, images and attachments when enabled in Config.
     """
-    url = (
-        "https://cafe.naver.com/ArticleRead.nhn?"
-        f"clubid={club_id}&articleid={article_id}"
-    )
-    response = requests.get(url)
-    response.raise_for_status()
-    soup = BeautifulSoup(response.text, "html.parser")
+    url = article_url(club_id, article_id)
+    article = _parse_article(fetch_html(url, session=session))
+    article["url"] = url
+    return article
 
-    title_elem = soup.select_one("div.tit-box span.b")
-    content_elem = soup.select_one("#tbody")
 
-    return {
-        "url": url,
-        "title": title_elem.get_text(strip=True) if title_elem else "",
-        "content": content_elem.get_text(strip=True) if content_elem else "",
+def fetch_article_list(club_id: str, menu_id: Optional[str] = None, page: int = 1,
+                       per_page: int = 50,
+                       session: Optional[requests.Session] = None) -> List[Dict]:
+    """Fetch one page of a board (or the all-posts list when menu_id is None)."""
+    params = {
+        "search.clubid": club_id,
+        "search.boardtype": "L",
+        "search.page": page,
+        "userDisplay": per_page,
     }
+    if menu_id:
+        params["search.menuid"] = menu_id
+    return _parse_list(fetch_html(LIST_URL, params=params, session=session))
+
+
+def search_articles(club_id: str, query: str, page: int = 1, search_by: int = 1,
+                    sort_by: str = "date",
+                    session: Optional[requests.Session] = None) -> List[Dict]:
+    """Fetch one page of cafe search results for ``query``."""
+    params = {
+        "search.clubid": club_id,
+        "search.query": query,
+        "search.searchBy": search_by,
+        "search.sortBy": sort_by,
+        "search.searchdate": "all",
+        "search.page": page,
+    }
+    return _parse_list(fetch_html(SEARCH_URL, params=params, session=session))
+
+
+def _attach_details(post: dict, session: requests.Session) -> dict:
+    try:
+        detail = _parse_article(fetch_html(post["url"], session=session))
+        post["full_content"] = detail["content"]
+        post["comments"] = detail["comments"]
+        post["comment_count"] = len(detail["comments"])
+        post["images"] = detail["images"]
+        post["attachments"] = detail["attachments"]
+        post["enhanced"] = True
+    except requests.RequestException as e:
+        print(f"  ⚠️ detail fetch failed: {post['url']} ({e})")
+        post["enhanced"] = False
+    return post
+
+
+def crawl(club_id: str, keywords: Optional[List[str]] = None, menu_id: Optional[str] = None,
+          max_pages: int = 5, with_details: bool = True, workers: int = POOL_SIZE,
+          state: Optional["CrawlState"] = None, rate: Optional[float] = None) -> List[Dict]:
+    """Crawl list/search pages and, optionally, every article body over HTTP.
+
+    Parameters
+    ----------
+    club_id : str
+        Naver Cafe club ID.
+    keywords : list[str], optional
+        Search keywords. When omitted the board (or all-posts list) is walked.
+    menu_id : str, optional
+        Board menu ID used when no keywords are given.
+    max_pages : int
+        Maximum list/search pages per keyword.
+    with_details : bool
+        Fetch article bodies, comments, images and attachments.
+    workers : int
+        Concurrent article fetches; capped by the connection pool size.
+        Workers only overlap latency: all of them share one limiter.
+    state : CrawlState, optional
+        Incremental mode: only articles above the stored high-water mark are
+        collected, listing stops at the first page that reaches already-seen
+        IDs, and the marks are advanced and saved afterwards.
+    rate : float, optional
+        Requests per second per host (default ``DEFAULT_RATE``). This limiter
+        is separate from the one the browser uses.
+
+    Returns
+    -------
+    list[dict]
+        Post dicts in the same shape as CafeCrawlerMigrated.crawl_cafe.
+    """
+    limiter = RateLimiter(rate=rate or DEFAULT_RATE, burst=max(min(workers, POOL_SIZE), 1))
+    session = create_session(pool_size=max(workers, 1), limiter=limiter)
+    posts: List[Dict] = []
+    seen_urls = set()
+
+    for keyword in (keywords or [None]):
+        key = board_key(menu_id, keyword) if state is not None else None
+        for page in range(1, max_pages + 1):
+            try:
+                if keyword:
+                    page_posts = search_articles(club_id, keyword, page=page, session=session)
+                else:
+                    page_posts = fetch_article_list(club_id, menu_id, page=page, session=session)
+            except requests.RequestException as e:
+                print(f"  ⚠️ page {page} fetch failed: {e}")
+                break
+
+            new_posts = [p for p in page_posts if p["url"] not in seen_urls]
+            if not new_posts:
+                break
+            reached_seen = False
+            if state is not None:
+                new_posts, reached_seen = state.filter_new(club_id, key, new_posts)
+            for post in new_posts:
+                seen_urls.add(post["url"])
+                post["keyword"] = keyword or ""
+            posts.extend(new_posts)
+            if reached_seen:
+                print(f"  ⏹️ reached articles collected in a previous run (page {page})")
+                break
+
+    if with_details and posts:
+        with ThreadPoolExecutor(max_workers=max(workers, 1)) as pool:
+            posts = list(pool.map(lambda post: _attach_details(post, session), posts))
+
+    if state is not None:
+        for keyword in (keywords or [None]):
+            group = [p for p in posts if p["keyword"] == (keyword or "")]
+            failed = [p for p in group if with_details and not p.get("enhanced")]
+            state.update(club_id, board_key(menu_id, keyword), group, failed=failed)
+        state.save()
+
+    return posts
 
 
 def main(argv: list[str]) -> None:
-    if len(argv) != 3:
-        print("Usage: python crawler.py <club_id> <article_id>")
-        raise SystemExit(1)
-
-    club_id, article_id = argv[1], argv[2]
-    article = fetch_article(club_id, article_id)
-    print(article["title"])
-    print(article["content"])
+    parser = argparse.ArgumentParser(
+        prog="crawler.py",
+        description="Browserless Naver Cafe crawler for public cafes",
+    )
+    parser.add_argument("club_id")
+    parser.add_argument("article_id", nargs="?",
+                        help="print a single article and exit")
+    parser.add_argument("--keyword", "-k", help="comma separated search keywords")
+    parser.add_argument("--menu", help="board menu id to walk when no keyword is given")
+    parser.add_argument("--max-pages", "-p", type=int, default=5)
+    parser.add_argument("--workers", "-w", type=int, default=POOL_SIZE)
+    parser.add_argument("--rate", type=float,
+                        help=f"max requests per second per host, shared by all workers "
+                             f"(default {DEFAULT_RATE})")
+    parser.add_argument("--no-details", action="store_true",
+                        help="collect list rows only")
+    parser.add_argument("--output", "-o", help="save results as xlsx via CafeDataExporter")
+    parser.add_argument("--incremental", "-i", action="store_true",
+                        help="only collect articles newer than the previous run")
+    args = parser.parse_args(argv[1:])
+
+    if args.incremental and CrawlState is None:
+        parser.error("--incremental needs config.py (crawl_state)")
+
+    if args.article_id:
+        article = fetch_article(args.club_id, args.article_id)
+        print(article["title"])
+        print(article["content"])
+        return
+
+    keywords = [k.strip() for k in (args.keyword or "").split(",") if k.strip()]
+    posts = crawl(args.club_id, keywords or None, menu_id=args.menu,
+                  max_pages=args.max_pages, with_details=not args.no_details,
+                  workers=args.workers, state=CrawlState() if args.incremental else None,
+                  rate=args.rate)
+    print(f"{len(posts)} posts collected")
+
+    if args.output:
+        from exporter import CafeDataExporter
+        CafeDataExporter.save_all(posts, args.output)
+    else:
+        for post in posts:
+            print(f"{post['date']}\t{post['author']}\t{post['title']}\t{post['url']}")
 
 
 if __name__ == "__main__":
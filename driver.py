@@ -7,19 +7,30 @@ The factory takes care of:
   • Choosing an available browser (Chrome → Edge fallback)
   • Applying the project-wide Config options (HEADLESS, WINDOW_SIZE, user-agent …)
   • Hiding automation fingerprints where possible
+  • Opt-in "lean" mode that blocks images, media, fonts, CSS and trackers
+    (off by default: login and captcha pages need their styles to be usable)
+  • Caching driver binaries per installed browser version, so later runs
+    skip the webdriver-manager lookup entirely
+  • Routing driver.get through the shared per-host rate limiter
 
 Usage
 -----
 from driver import create_driver
 
 driver = create_driver()  # returns an initialised WebDriver or None
+driver = create_driver(lean=True, load_images=True)  # lean, but keep images
 """
 # Disclaimer: use at your own risk. The authors take no responsibility for misuse.
 
 from __future__ import annotations
 
+import json
+import os
+import re
+import subprocess
 import sys
-from typing import Optional
+from pathlib import Path
+from typing import Callable, Optional
 
 from selenium import webdriver
 from selenium.common.exceptions import WebDriverException
@@ -37,10 +48,31 @@ except ImportError:  # pragma: no cover – Edge deps not installed
     EdgeService = None  # type: ignore
 
 from config import Config
+from utils.rate_limiter import throttle_driver
 
 __all__ = ["create_driver"]
 
 
+def _ext_patterns(*extensions: str) -> list:
+    """CDP URL patterns for each extension, with and without a query string."""
+    return [pattern for ext in extensions for pattern in (f"*.{ext}", f"*.{ext}?*")]
+
+
+# URL patterns blocked via CDP in lean mode – we only need DOM text
+_BLOCKED_MEDIA = _ext_patterns(
+    "mp4", "webm", "m3u8", "mp3",
+    "woff", "woff2", "ttf", "otf", "eot",
+    "css",
+)
+_BLOCKED_IMAGES = _ext_patterns("png", "jpg", "jpeg", "gif", "webp", "svg", "ico", "bmp")
+_BLOCKED_TRACKERS = [
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*googlesyndication.com*", "*facebook.net*",
+    "*adcr.naver.com*", "*siape.veta.naver.com*", "*tivan.naver.com*",
+    "*lcs.naver.com*", "*nlog.naver.com*", "*wcs.naver.net*",
+]
+
+
 # ---------------------------------------------------------------------------
 # _helpers
 # ---------------------------------------------------------------------------
@@ -59,17 +91,169 @@ def _apply_common_options(options, *, headless: bool):
     options.add_experimental_option("useAutomationExtension", False)
 
 
+def _apply_lean_options(options, *, load_images: bool):
+    """Trim the browser down to what DOM-text scraping needs."""
+    for flag in (
+        "--disable-extensions",
+        "--disable-gpu",
+        "--disable-background-networking",
+        "--disable-background-timer-throttling",
+        "--disable-component-update",
+        "--disable-default-apps",
+        "--disable-sync",
+        "--disable-notifications",
+        "--metrics-recording-only",
+        "--mute-audio",
+        "--no-first-run",
+    ):
+        options.add_argument(flag)
+
+    # 2 = block; images stay on when EXTRACT_IMAGES needs real dimensions
+    prefs = {
+        "profile.managed_default_content_settings.notifications": 2,
+        "profile.managed_default_content_settings.geolocation": 2,
+        "profile.managed_default_content_settings.media_stream": 2,
+        "profile.managed_default_content_settings.plugins": 2,
+        "profile.managed_default_content_settings.popups": 2,
+    }
+    if not load_images:
+        prefs["profile.managed_default_content_settings.images"] = 2
+    options.add_experimental_option("prefs", prefs)
+
+
+def _block_resources(driver, *, load_images: bool) -> None:
+    """Block heavy sub-resources and trackers at the network layer via CDP."""
+    patterns = _BLOCKED_MEDIA + _BLOCKED_TRACKERS
+    if not load_images:
+        patterns = patterns + _BLOCKED_IMAGES
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+    except Exception as e:
+        # CDP is Chromium-only; prefs still apply if this fails
+        print(f"리소스 차단 설정 실패 (무시): {e}")
+
+
+# ---------------------------------------------------------------------------
+# driver binary cache
+# ---------------------------------------------------------------------------
+
+_VERSION_RE = re.compile(r"(\d+\.\d+\.\d+(?:\.\d+)?)")
+
+# (registry key, version value) per browser on Windows
+_WIN_REGISTRY = {
+    "chrome": (r"Software\Google\Chrome\BLBeacon", "version"),
+    "edge": (r"Software\Microsoft\Edge\BLBeacon", "version"),
+}
+_POSIX_BINARIES = {
+    "chrome": [
+        "google-chrome", "google-chrome-stable", "chromium", "chromium-browser",
+        "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+    ],
+    "edge": [
+        "microsoft-edge", "microsoft-edge-stable",
+        "/Applications/Microsoft Edge.app/Contents/MacOS/Microsoft Edge",
+    ],
+}
+
+
+def _cache_dir() -> Path:
+    default = Path.home() / ".navercafecrawler" / "drivers"
+    return Path(getattr(Config, "DRIVER_CACHE_DIR", default))
+
+
+def _browser_version(browser: str) -> Optional[str]:
+    """Installed browser version, detected locally without any network call."""
+    if sys.platform.startswith("win"):
+        try:
+            import winreg
+            key_path, value_name = _WIN_REGISTRY[browser]
+            for hive in (winreg.HKEY_CURRENT_USER, winreg.HKEY_LOCAL_MACHINE):
+                try:
+                    with winreg.OpenKey(hive, key_path) as key:
+                        return str(winreg.QueryValueEx(key, value_name)[0])
+                except OSError:
+                    continue
+        except ImportError:
+            pass
+        return None
+
+    for binary in _POSIX_BINARIES[browser]:
+        try:
+            output = subprocess.run([binary, "--version"], capture_output=True,
+                                    text=True, timeout=5).stdout
+        except (OSError, subprocess.SubprocessError):
+            continue
+        match = _VERSION_RE.search(output)
+        if match:
+            return match.group(1)
+    return None
+
+
+def _load_cache_index(path: Path) -> dict:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _resolve_driver_path(browser: str, install: Callable[[], str]) -> str:
+    """Return a driver binary for the installed *browser*, reusing a cached one.
+
+    The cache is keyed by ``<browser>:<major.minor.build>`` so a browser update
+    triggers exactly one fresh ``install()`` (webdriver-manager lookup).
+    """
+    version = _browser_version(browser)
+    if not version or not getattr(Config, "DRIVER_CACHE", True):
+        return install()
+
+    cache_key = f"{browser}:{'.'.join(version.split('.')[:3])}"
+    index_path = _cache_dir() / "index.json"
+    index = _load_cache_index(index_path)
+
+    cached = index.get(cache_key)
+    if cached and os.path.isfile(cached):
+        print(f"캐시된 드라이버 사용: {cache_key}")
+        return cached
+
+    driver_path = install()
+    index[cache_key] = driver_path
+    try:
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(index_path, "w", encoding="utf-8") as f:
+            json.dump(index, f, indent=2)
+    except OSError as e:
+        print(f"드라이버 캐시 저장 실패 (무시): {e}")
+    return driver_path
+
+
+def _lean_settings(lean: Optional[bool], load_images: Optional[bool]):
+    if lean is None:
+        lean = getattr(Config, "LEAN_BROWSER", False)
+    if load_images is None:
+        load_images = getattr(Config, "LEAN_LOAD_IMAGES", getattr(Config, "EXTRACT_IMAGES", False))
+    return lean, load_images
+
+
 # ---------------------------------------------------------------------------
 # factory
 # ---------------------------------------------------------------------------
 
-def create_driver() -> Optional[webdriver.Remote]:
+def create_driver(lean: Optional[bool] = None,
+                  load_images: Optional[bool] = None) -> Optional[webdriver.Remote]:
     """Return an initialised Selenium *WebDriver* or *None* if no browser is available.
 
     The factory first tries Chrome because it provides the most stable support
     for Selenium. If Chrome isn't available, it falls back to Microsoft Edge
     (which is Chromium-based under the hood).
+
+    *lean* (default ``Config.LEAN_BROWSER``, off) blocks images, media, fonts,
+    CSS and tracking scripts. Leave it off when logging in or solving a
+    captcha by hand, since those pages are unusable without CSS. *load_images* (default ``Config.EXTRACT_IMAGES``)
+    keeps images enabled in lean mode so extracted sizes stay meaningful.
     """
+    lean, load_images = _lean_settings(lean, load_images)
 
     # ---------------------------------------------------------------------
     # 1️⃣  Try Chrome first
@@ -78,6 +262,8 @@ def create_driver() -> Optional[webdriver.Remote]:
         print("Chrome 브라우저 설정 시도 중…")
         chrome_options = ChromeOptions()
         _apply_common_options(chrome_options, headless=Config.HEADLESS)
+        if lean:
+            _apply_lean_options(chrome_options, load_images=load_images)
 
         # Spoof User-Agent – this reduces the chance of being blocked
         chrome_options.add_argument(
@@ -87,13 +273,15 @@ def create_driver() -> Optional[webdriver.Remote]:
             "Chrome/120.0.0.0 Safari/537.36"
         )
 
-        service = ChromeService(ChromeDriverManager().install())
+        service = ChromeService(_resolve_driver_path("chrome", lambda: ChromeDriverManager().install()))
         driver = webdriver.Chrome(service=service, options=chrome_options)
+        if lean:
+            _block_resources(driver, load_images=load_images)
 
         # Remove Selenium webdriver flag
         driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
         print("✅ Chrome 드라이버 설정 완료")
-        return driver
+        return throttle_driver(driver)
 
     except Exception as chrome_error:
         print(f"Chrome 설정 실패: {chrome_error}")
@@ -109,6 +297,8 @@ def create_driver() -> Optional[webdriver.Remote]:
             print("Edge 브라우저 설정 시도 중…")
             edge_options = EdgeOptions()
             _apply_common_options(edge_options, headless=Config.HEADLESS)
+            if lean:
+                _apply_lean_options(edge_options, load_images=load_images)
 
             edge_options.add_argument(
                 "--user-agent="
@@ -117,11 +307,13 @@ def create_driver() -> Optional[webdriver.Remote]:
                 "Chrome/120.0.0.0 Safari/537.36 Edg/120.0.0.0"
             )
 
-            service = EdgeService(EdgeChromiumDriverManager().install())
+            service = EdgeService(_resolve_driver_path("edge", lambda: EdgeChromiumDriverManager().install()))
             driver = webdriver.Edge(service=service, options=edge_options)
+            if lean:
+                _block_resources(driver, load_images=load_images)
             driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
             print("✅ Edge 드라이버 설정 완료")
-            return driver
+            return throttle_driver(driver)
         except Exception as e:
             edge_error = e
             print(f"Edge 설정 실패: {edge_error}")
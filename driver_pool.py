@@ -0,0 +1,173 @@
+"""driver_pool.py
+병렬 크롤링용 WebDriver 풀.
+
+CafeCrawlerMigrated 는 self.driver 하나로 키워드 → 게시판 → 상세 페이지를
+순차 처리한다. 이 모듈은 driver.create_driver 로 N 개의 브라우저를 미리 띄우고
+로그인된 브라우저의 쿠키를 복사해 둔 뒤, 작업 큐에서 항목을 하나씩 꺼내
+비어 있는 드라이버에 배정한다.
+
+- 풀 크기는 Config.MAX_PARALLEL_DRIVERS (서버 부하 고려 상한) 를 넘지 않는다.
+- 결과는 입력 순서 그대로 반환한다.
+
+Usage
+-----
+from driver_pool import DriverPool
+
+with DriverPool(size=3, cookies=driver.get_cookies()) as pool:
+    results = pool.map(lambda drv, url: drv.get(url) or drv.title, urls)
+"""
+# Disclaimer: use at your own risk. The authors take no responsibility for misuse.
+
+from __future__ import annotations
+
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from config import Config
+from driver import create_driver
+
+__all__ = ["pool_size", "DriverPool"]
+
+COOKIE_DOMAIN = "naver.com"
+# 쿠키를 심기 위해 먼저 방문하는 페이지 (도메인이 같아야 add_cookie 가 허용됨)
+COOKIE_PAGES = ("https://www.naver.com", "https://cafe.naver.com")
+
+
+def pool_size(requested: Optional[int] = None) -> int:
+    """설정된 풀 크기를 서버 부하 상한으로 자른 값 (최소 1)"""
+    if requested is None:
+        requested = getattr(Config, 'DRIVER_POOL_SIZE', 1)
+    cap = getattr(Config, 'MAX_PARALLEL_DRIVERS', 4)
+    return max(1, min(int(requested), int(cap)))
+
+
+class DriverPool:
+    """미리 띄워 둔 WebDriver 들을 작업 큐로 나눠 쓰는 풀"""
+
+    def __init__(self, size: Optional[int] = None, cookies: Optional[List[Dict[str, Any]]] = None,
+                 factory: Callable[[], Any] = create_driver):
+        """
+        Parameters
+        ----------
+        size : int | None
+            브라우저 수. None 이면 Config.DRIVER_POOL_SIZE (상한 적용).
+        cookies : list[dict] | None
+            로그인된 브라우저의 driver.get_cookies() 결과. 모든 드라이버에 복사된다.
+        factory : callable
+            드라이버 생성 함수 (기본 driver.create_driver).
+        """
+        self.size = pool_size(size)
+        self.cookies = cookies or []
+        self.factory = factory
+        self.drivers: List[Any] = []
+        self._idle: "queue.Queue[Any]" = queue.Queue()
+
+    # ------------------------------------------------------------------
+    # lifecycle
+    # ------------------------------------------------------------------
+
+    def start(self) -> int:
+        """드라이버를 병렬로 생성하고 쿠키를 적용 (생성된 드라이버 수 반환)"""
+        if self.drivers:
+            return len(self.drivers)
+
+        print(f"    🚗 드라이버 풀 준비 중... ({self.size}개)")
+        with ThreadPoolExecutor(max_workers=self.size) as executor:
+            created = list(executor.map(lambda _: self._create_one(), range(self.size)))
+
+        for driver in created:
+            if driver is not None:
+                self.drivers.append(driver)
+                self._idle.put(driver)
+
+        print(f"    ✅ 드라이버 풀 준비 완료: {len(self.drivers)}/{self.size}개")
+        return len(self.drivers)
+
+    def _create_one(self):
+        try:
+            driver = self.factory()
+        except Exception as e:
+            print(f"    ⚠️ 풀 드라이버 생성 실패: {e}")
+            return None
+        if driver is not None and self.cookies:
+            self.apply_cookies(driver, self.cookies)
+        return driver
+
+    @staticmethod
+    def apply_cookies(driver, cookies: List[Dict[str, Any]]) -> int:
+        """로그인 쿠키를 드라이버에 복사 (적용된 쿠키 수 반환 – 쿠키마다 한 번만 셈)"""
+        applied = set()
+        for page in COOKIE_PAGES:
+            try:
+                driver.get(page)
+            except Exception:
+                continue
+            for cookie in cookies:
+                if not cookie.get("domain", "").lstrip(".").endswith(COOKIE_DOMAIN):
+                    continue
+                key = (cookie.get("name"), cookie.get("domain"), cookie.get("path", "/"))
+                if key in applied:
+                    continue
+                # sameSite/expiry 형식 차이로 add_cookie 가 거부되는 것을 방지
+                cookie = {k: v for k, v in cookie.items() if k not in ("sameSite", "expiry")}
+                try:
+                    driver.add_cookie(cookie)
+                    applied.add(key)
+                except Exception:
+                    # 현재 페이지와 도메인이 다른 쿠키 – 다음 페이지에서 적용
+                    continue
+        return len(applied)
+
+    def close(self):
+        """모든 드라이버 종료"""
+        for driver in self.drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+        self.drivers = []
+        self._idle = queue.Queue()
+
+    def __enter__(self) -> "DriverPool":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    # ------------------------------------------------------------------
+    # dispatch
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def acquire(self):
+        """비어 있는 드라이버 하나를 빌려 쓰고 반납"""
+        driver = self._idle.get()
+        try:
+            yield driver
+        finally:
+            self._idle.put(driver)
+
+    def map(self, func: Callable[[Any, Any], Any], items: Iterable[Any]) -> List[Any]:
+        """func(driver, item) 을 풀에서 실행하고 입력 순서대로 결과 반환
+
+        작업 하나가 예외를 던지면 해당 항목의 결과는 None 이 된다.
+        """
+        items = list(items)
+        if not items:
+            return []
+        if not self.drivers and not self.start():
+            raise RuntimeError("드라이버 풀을 시작할 수 없습니다")
+
+        def run(item):
+            with self.acquire() as driver:
+                try:
+                    return func(driver, item)
+                except Exception as e:
+                    print(f"    ⚠️ 풀 작업 실패: {e}")
+                    return None
+
+        with ThreadPoolExecutor(max_workers=len(self.drivers)) as executor:
+            return list(executor.map(run, items))
@@ -4,6 +4,17 @@
 NaverCafeCrawler 가 수집한 posts
 data 를 엑셀로 내보내는 로직을 독립시켰다.
 기존 save_to_excel 의 기능을 거의 그대로 유지한다.
+
+openpyxl write_only 워크북에 게시글을 한 건씩 흘려 쓰므로 게시글 수가 많아도
+시트 전체를 DataFrame 으로 만들지 않는다. 열 너비는 시트마다 앞부분 표본
+(SAMPLE_ROWS 행) 으로 정한 뒤 나머지 행은 바로 기록한다.
+
+Config.EXPORT_FORMAT = "parquet" 이면 같은 진입점(save_all)이 엑셀 대신
+posts / comments / images / statistics Parquet 테이블을 폴더 하나에 저장한다
+(pyarrow 필요). 모든 테이블은 post_key 열로 연결된다.
+
+내보내기 전에 게시글 번호가 같거나 본문이 거의 같은 게시글(재게시, 여러
+게시판에 올린 같은 공고)은 near_dup 색인으로 걸러낸다 (Config.EXPORT_DEDUP).
 """
 # Disclaimer: use at your own risk. The authors take no responsibility for misuse.
 
@@ -11,26 +22,200 @@ from __future__ import annotations
 
 import os
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
-import pandas as pd
+from openpyxl import Workbook
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+from openpyxl.utils import get_column_letter
+
+try:
+    # pyarrow 는 선택 의존성 – Parquet 내보내기에서만 사용
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover – pyarrow 미설치
+    pa = pq = None  # type: ignore
 
 from config import Config
+from near_dup import NearDuplicateIndex, drop_near_duplicates
+from utils import article_key, parse_count, unpack_article_key
 
 __all__ = ["CafeDataExporter"]
 
+#: 열 너비 계산에 쓰는 시트별 앞부분 행 수 (메모리 상한)
+SAMPLE_ROWS = 200
+MAX_COLUMN_WIDTH = 50
+
+POST_HEADERS = [
+    "번호", "제목", "작성자", "날짜", "조회수", "키워드", "매칭키워드", "URL", "수집시간",
+    "내용길이", "댓글수", "이미지수", "첨부파일수", "내용미리보기",
+]
+COMMENT_HEADERS = ["게시글번호", "게시글제목", "댓글번호", "댓글작성자", "댓글내용", "댓글날짜", "게시글URL"]
+IMAGE_HEADERS = ["게시글번호", "게시글제목", "이미지번호", "이미지URL", "이미지설명", "이미지크기", "게시글URL"]
+STATISTICS_HEADERS = ["항목", "값", "설명"]
+
+#: Parquet 파일에 한 번에 기록하는 행 수 (메모리 상한)
+PARQUET_BATCH_ROWS = 5000
+PARQUET_TABLES = ("posts", "comments", "images")
+
+
+
+def post_key(post: Dict[str, Any]) -> int:
+    """테이블 간 연결 키 – utils.article_key (URL 형식이 달라도 같은 글이면 같은 값)
+
+    번호를 알 수 없는 URL 은 URL 해시(음수) 를 쓴다.
+    """
+    return article_key(post.get("url", ""))
+
+
+def _to_timestamp(value: Any) -> Optional[datetime]:
+    try:
+        return datetime.strptime(value, "%Y-%m-%d %H:%M:%S")
+    except (TypeError, ValueError):
+        return None
+
+
+def _parquet_schemas() -> Dict[str, "pa.Schema"]:
+    return {
+        "posts": pa.schema([
+            ("post_key", pa.int64()),
+            ("club_id", pa.int64()),
+            ("article_id", pa.int64()),
+            ("title", pa.string()),
+            ("author", pa.string()),
+            ("date", pa.string()),
+            ("views", pa.int64()),
+            ("likes", pa.int64()),
+            ("keyword", pa.string()),
+            ("matched_keywords", pa.list_(pa.string())),
+            ("board_name", pa.string()),
+            ("url", pa.string()),
+            ("collection_time", pa.timestamp("s")),
+            ("enhanced", pa.bool_()),
+            ("content_length", pa.int32()),
+            ("comment_count", pa.int32()),
+            ("image_count", pa.int32()),
+            ("attachment_count", pa.int32()),
+            ("full_content", pa.string()),
+        ]),
+        "comments": pa.schema([
+            ("post_key", pa.int64()),
+            ("comment_id", pa.int64()),
+            ("parent_id", pa.int64()),
+            ("depth", pa.int8()),
+            ("author", pa.string()),
+            ("content", pa.string()),
+            ("date", pa.string()),
+            ("like_count", pa.int32()),
+        ]),
+        "images": pa.schema([
+            ("post_key", pa.int64()),
+            ("image_index", pa.int32()),
+            ("url", pa.string()),
+            ("alt", pa.string()),
+            ("size", pa.string()),
+        ]),
+        "statistics": pa.schema([
+            ("total_posts", pa.int64()),
+            ("total_comments", pa.int64()),
+            ("total_images", pa.int64()),
+            ("avg_comments", pa.float64()),
+            ("avg_images", pa.float64()),
+            ("generated_at", pa.timestamp("s")),
+        ]),
+    }
+
+
+class _ParquetStream:
+    """Parquet 파일에 행을 PARQUET_BATCH_ROWS 개씩 묶어 기록"""
+
+    def __init__(self, path: str, schema: "pa.Schema", compression: str):
+        self.schema = schema
+        self.writer = pq.ParquetWriter(path, schema, compression=compression)
+        self.rows = 0
+        self._buffer: List[Dict[str, Any]] = []
+
+    def append(self, row: Dict[str, Any]):
+        self._buffer.append(row)
+        self.rows += 1
+        if len(self._buffer) >= PARQUET_BATCH_ROWS:
+            self._flush()
+
+    def _flush(self):
+        if self._buffer:
+            self.writer.write_batch(pa.RecordBatch.from_pylist(self._buffer, schema=self.schema))
+            self._buffer = []
+
+    def close(self) -> int:
+        self._flush()
+        self.writer.close()
+        return self.rows
+
+
+def _cell(value: Any) -> Any:
+    """엑셀에 쓸 수 없는 제어 문자 제거"""
+    if isinstance(value, str):
+        return ILLEGAL_CHARACTERS_RE.sub("", value)
+    return value
+
+
+class _SheetStream:
+    """write_only 시트에 행을 순서대로 추가한다.
+
+    write_only 시트는 첫 행을 쓰기 전에 열 너비를 정해야 하므로, 앞부분
+    SAMPLE_ROWS 행만 모아 너비를 계산한 뒤 한꺼번에 내보내고 이후 행은 바로 쓴다.
+    """
+
+    def __init__(self, workbook: Workbook, title: str, headers: List[str]):
+        self.workbook = workbook
+        self.worksheet = workbook.create_sheet(title)
+        self.headers = headers
+        self.rows = 0
+        self._sample: Optional[List[List[Any]]] = []
+        self._widths = [len(str(header)) for header in headers]
+
+    def append(self, row: Dict[str, Any]):
+        values = [_cell(row.get(header, "")) for header in self.headers]
+        self.rows += 1
+        if self._sample is None:
+            self.worksheet.append(values)
+            return
+
+        self._sample.append(values)
+        for idx, value in enumerate(values):
+            self._widths[idx] = max(self._widths[idx], len(str(value)))
+        if len(self._sample) >= SAMPLE_ROWS:
+            self._flush()
+
+    def _flush(self):
+        for idx, width in enumerate(self._widths, 1):
+            self.worksheet.column_dimensions[get_column_letter(idx)].width = min(width + 2, MAX_COLUMN_WIDTH)
+        self.worksheet.append(self.headers)
+        for values in self._sample:
+            self.worksheet.append(values)
+        self._sample = None
+
+    def close(self, keep_empty: bool = False) -> int:
+        """남은 표본을 기록하고 행 수 반환 (행이 없으면 시트 제거)"""
+        if not self.rows and not keep_empty:
+            self.workbook.remove(self.worksheet)
+            return 0
+        if self._sample is not None:
+            self._flush()
+        return self.rows
+
 
 class CafeDataExporter:
     """posts_data(list[dict]) 를 다양한 시트로 엑셀 파일에 저장한다."""
 
     @staticmethod
-    def save_all(posts_data: List[Dict[str, Any]], filename: str | None = None) -> str | bool:
+    def save_all(posts_data: Iterable[Dict[str, Any]], filename: str | None = None) -> str | bool:
         """주요 진입점.
 
         Parameters
         ----------
-        posts_data : list[dict]
-            크롤러가 수집한 게시글/댓글/이미지 정보를 담은 list.
+        posts_data : Iterable[dict]
+            크롤러가 수집한 게시글/댓글/이미지 정보. list 뿐 아니라
+            post_sink.read_posts 같은 이터레이터도 받으며, 한 번만 순회한다.
         filename : str | None
             사용자가 지정한 파일명; None 이면 자동으로 timestamp 를 붙인다.
 
@@ -39,7 +224,12 @@ class CafeDataExporter:
         str | bool
             저장된 파일 전체 경로. 실패하면 False.
         """
-        if not posts_data:
+        if getattr(Config, 'EXPORT_FORMAT', 'xlsx') == "parquet":
+            return CafeDataExporter.save_parquet(posts_data, filename)
+
+        posts, dedup_index = CafeDataExporter._unique_posts(posts_data)
+        first = next(posts, None)
+        if first is None:
             print("❌ 저장할 데이터가 없습니다.")
             return False
 
@@ -53,13 +243,33 @@ class CafeDataExporter:
             filepath = os.path.join(Config.OUTPUT_DIR, filename)
 
             print(f"💾 엑셀 파일 저장 중: {filepath}")
-            print(f"📊 저장 데이터: {len(posts_data)}개 게시글")
+            if isinstance(posts_data, list):
+                print(f"📊 저장 데이터: {len(posts_data)}개 게시글")
+
+            workbook = Workbook(write_only=True)
+            post_headers = POST_HEADERS + (["전체내용"] if Config.EXTRACT_FULL_CONTENT else [])
+            sheets = {
+                "posts": _SheetStream(workbook, "게시글정보", post_headers),
+                "comments": _SheetStream(workbook, "댓글정보", COMMENT_HEADERS),
+                "images": _SheetStream(workbook, "이미지정보", IMAGE_HEADERS),
+            }
+            totals = {"posts": 0, "comments": 0, "images": 0}
 
-            with pd.ExcelWriter(filepath, engine="openpyxl") as writer:
-                CafeDataExporter._save_posts_sheet(writer, posts_data)
-                CafeDataExporter._save_comments_sheet(writer, posts_data)
-                CafeDataExporter._save_images_sheet(writer, posts_data)
-                CafeDataExporter._save_statistics_sheet(writer, posts_data)
+            for idx, post in enumerate(CafeDataExporter._chain(first, posts), 1):
+                sheets["posts"].append(CafeDataExporter._post_row(idx, post))
+                for row in CafeDataExporter._comment_rows(idx, post):
+                    sheets["comments"].append(row)
+                for row in CafeDataExporter._image_rows(idx, post):
+                    sheets["images"].append(row)
+                totals["posts"] += 1
+                totals["comments"] += len(post.get("comments") or [])
+                totals["images"] += len(post.get("images") or [])
+
+            CafeDataExporter._report_duplicates(dedup_index)
+            CafeDataExporter._report_sheets(sheets)
+            CafeDataExporter._save_statistics_sheet(workbook, totals)
+
+            workbook.save(filepath)
 
             print(f"✅ 저장 완료: {filepath}")
             print(f"📁 파일 크기: {os.path.getsize(filepath) / 1024 / 1024:.2f} MB")
@@ -68,96 +278,243 @@ class CafeDataExporter:
             print(f"❌ 엑셀 저장 중 오류 발생: {e}")
             return False
 
+    @staticmethod
+    def save_parquet(posts_data: Iterable[Dict[str, Any]], filename: str | None = None) -> str | bool:
+        """posts / comments / images / statistics 를 Parquet 테이블로 저장.
+
+        Parameters
+        ----------
+        posts_data : Iterable[dict]
+            save_all 과 같은 게시글 목록 (한 번만 순회).
+        filename : str | None
+            결과 폴더 이름 (확장자는 무시); None 이면 timestamp 를 붙인다.
+
+        Returns
+        -------
+        str | bool
+            테이블 파일이 들어 있는 폴더 경로. 실패하면 False.
+        """
+        if pa is None:
+            print("❌ Parquet 저장에는 pyarrow 가 필요합니다: pip install pyarrow")
+            return False
+
+        posts, dedup_index = CafeDataExporter._unique_posts(posts_data)
+        first = next(posts, None)
+        if first is None:
+            print("❌ 저장할 데이터가 없습니다.")
+            return False
+
+        try:
+            if not filename:
+                timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+                filename = f"cafe_posts_{timestamp}"
+
+            directory = os.path.join(Config.OUTPUT_DIR, os.path.splitext(filename)[0])
+            os.makedirs(directory, exist_ok=True)
+            compression = getattr(Config, 'PARQUET_COMPRESSION', 'zstd')
+            schemas = _parquet_schemas()
+
+            print(f"💾 Parquet 저장 중: {directory} (압축: {compression})")
+
+            streams = {
+                name: _ParquetStream(os.path.join(directory, f"{name}.parquet"), schemas[name], compression)
+                for name in PARQUET_TABLES
+            }
+            totals = {"posts": 0, "comments": 0, "images": 0}
+            for name, row in CafeDataExporter._table_rows(CafeDataExporter._chain(first, posts), totals):
+                streams[name].append(row)
+            CafeDataExporter._report_duplicates(dedup_index)
+            for name, stream in streams.items():
+                print(f"    ✅ {name}.parquet 저장 완료: {stream.close()}행")
+
+            statistics = pa.Table.from_pylist([CafeDataExporter._statistics_row(totals)], schema=schemas["statistics"])
+            pq.write_table(statistics, os.path.join(directory, "statistics.parquet"), compression=compression)
+            print("    ✅ statistics.parquet 저장 완료")
+
+            print(f"✅ 저장 완료: {directory}")
+            return directory
+        except Exception as e:
+            print(f"❌ Parquet 저장 중 오류 발생: {e}")
+            return False
+
+    @staticmethod
+    def to_arrow(posts_data: Iterable[Dict[str, Any]]) -> Dict[str, "pa.Table"]:
+        """파일 없이 분석용 Arrow 테이블로 변환 (save_parquet 과 같은 스키마)"""
+        if pa is None:
+            raise ImportError("to_arrow 에는 pyarrow 가 필요합니다: pip install pyarrow")
+
+        schemas = _parquet_schemas()
+        rows: Dict[str, List[Dict[str, Any]]] = {name: [] for name in PARQUET_TABLES}
+        totals = {"posts": 0, "comments": 0, "images": 0}
+        for name, row in CafeDataExporter._table_rows(posts_data or [], totals):
+            rows[name].append(row)
+
+        tables = {name: pa.Table.from_pylist(rows[name], schema=schemas[name]) for name in PARQUET_TABLES}
+        tables["statistics"] = pa.Table.from_pylist([CafeDataExporter._statistics_row(totals)],
+                                                    schema=schemas["statistics"])
+        return tables
+
     # ------------------------------------------------------------------
     # 내부 헬퍼
     # ------------------------------------------------------------------
 
     @staticmethod
-    def _save_posts_sheet(writer, posts_data: List[Dict[str, Any]]):
-        rows = []
-        for idx, post in enumerate(posts_data, 1):
-            row = {
-                "번호": idx,
-                "제목": post.get("title", ""),
-                "작성자": post.get("author", ""),
-                "날짜": post.get("date", ""),
-                "조회수": post.get("views", ""),
-                "키워드": post.get("keyword", ""),
-                "URL": post.get("url", ""),
-                "수집시간": post.get("collection_time", ""),
-                "내용길이": len(post.get("full_content", "")),
-                "댓글수": len(post.get("comments", [])),
-                "이미지수": len(post.get("images", [])),
-                "첨부파일수": len(post.get("attachments", [])),
-                "내용미리보기": (post.get("full_content", "") or post.get("content", ""))[:100]
-                + ("..." if len(post.get("full_content", "") or post.get("content", "")) > 100 else ""),
+    def _table_rows(posts: Iterable[Dict[str, Any]],
+                    totals: Dict[str, int]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """게시글마다 (테이블 이름, 행) 을 순서대로 생성하고 totals 를 갱신"""
+        for post in posts:
+            key = post_key(post)
+            ref = unpack_article_key(key)
+            comments = post.get("comments") or []
+            images = post.get("images") or []
+            full_content = post.get("full_content", "") or ""
+            totals["posts"] += 1
+            totals["comments"] += len(comments)
+            totals["images"] += len(images)
+
+            yield "posts", {
+                "post_key": key,
+                "club_id": ref[0] if ref else None,
+                "article_id": ref[1] if ref else None,
+                "title": post.get("title", ""),
+                "author": post.get("author", ""),
+                "date": post.get("date", ""),
+                "views": parse_count(post.get("views")),
+                "likes": parse_count(post.get("likes")),
+                "keyword": post.get("keyword"),
+                "matched_keywords": post.get("matched_keywords") or None,
+                "board_name": post.get("board_name"),
+                "url": post.get("url", ""),
+                "collection_time": _to_timestamp(post.get("collection_time")),
+                "enhanced": post.get("enhanced"),
+                "content_length": len(full_content),
+                "comment_count": len(comments),
+                "image_count": len(images),
+                "attachment_count": len(post.get("attachments") or []),
+                "full_content": full_content or None,
+            }
+            for comment in comments:
+                yield "comments", {
+                    "post_key": key,
+                    "comment_id": parse_count(comment.get("comment_id", comment.get("index"))),
+                    "parent_id": parse_count(comment.get("parent_id")),
+                    "depth": parse_count(comment.get("depth")),
+                    "author": comment.get("author", ""),
+                    "content": comment.get("content", ""),
+                    "date": comment.get("date", ""),
+                    "like_count": parse_count(comment.get("like_count")),
+                }
+            for img_idx, image in enumerate(images, 1):
+                yield "images", {
+                    "post_key": key,
+                    "image_index": img_idx,
+                    "url": image.get("url", ""),
+                    "alt": image.get("alt", ""),
+                    "size": image.get("size", ""),
+                }
+
+    @staticmethod
+    def _statistics_row(totals: Dict[str, int]) -> Dict[str, Any]:
+        total_posts = totals["posts"]
+        return {
+            "total_posts": total_posts,
+            "total_comments": totals["comments"],
+            "total_images": totals["images"],
+            "avg_comments": totals["comments"] / total_posts if total_posts else 0.0,
+            "avg_images": totals["images"] / total_posts if total_posts else 0.0,
+            "generated_at": datetime.now().replace(microsecond=0),
+        }
+
+    @staticmethod
+    def _unique_posts(posts_data) -> Tuple[Iterator[Dict[str, Any]], Optional[NearDuplicateIndex]]:
+        """번호 중복·유사 게시글을 걸러 내는 이터레이터 (EXPORT_DEDUP 이 꺼져 있으면 그대로)"""
+        if not getattr(Config, 'EXPORT_DEDUP', True):
+            return iter(posts_data or []), None
+        index = NearDuplicateIndex()
+        return drop_near_duplicates(posts_data or [], index), index
+
+    @staticmethod
+    def _report_duplicates(index: Optional[NearDuplicateIndex]):
+        if index is not None and index.stats["duplicates"]:
+            print(f"    🧬 유사 게시글 {index.stats['duplicates']}개 제외 (재게시/다중 게시판)")
+
+    @staticmethod
+    def _chain(first, rest):
+        yield first
+        yield from rest
+
+    @staticmethod
+    def _post_row(idx: int, post: Dict[str, Any]) -> Dict[str, Any]:
+        content = post.get("full_content", "") or post.get("content", "")
+        row = {
+            "번호": idx,
+            "제목": post.get("title", ""),
+            "작성자": post.get("author", ""),
+            "날짜": post.get("date", ""),
+            "조회수": post.get("views", ""),
+            "키워드": post.get("keyword", ""),
+            "매칭키워드": ", ".join(post.get("matched_keywords") or []),
+            "URL": post.get("url", ""),
+            "수집시간": post.get("collection_time", ""),
+            "내용길이": len(post.get("full_content", "") or ""),
+            "댓글수": len(post.get("comments") or []),
+            "이미지수": len(post.get("images") or []),
+            "첨부파일수": len(post.get("attachments") or []),
+            "내용미리보기": content[:100] + ("..." if len(content) > 100 else ""),
+        }
+        if Config.EXTRACT_FULL_CONTENT and post.get("full_content"):
+            row["전체내용"] = post.get("full_content", "")
+        return row
+
+    @staticmethod
+    def _comment_rows(post_idx: int, post: Dict[str, Any]):
+        title = post.get("title", f"게시글 {post_idx}")
+        for comment in post.get("comments") or []:
+            yield {
+                "게시글번호": post_idx,
+                "게시글제목": title[:50] + ("..." if len(title) > 50 else ""),
+                "댓글번호": comment.get("index", ""),
+                "댓글작성자": comment.get("author", ""),
+                "댓글내용": comment.get("content", ""),
+                "댓글날짜": comment.get("date", ""),
+                "게시글URL": post.get("url", ""),
             }
-            if Config.EXTRACT_FULL_CONTENT and post.get("full_content"):
-                row["전체내용"] = post.get("full_content", "")
-            rows.append(row)
 
-        if not rows:
-            return
-        df = pd.DataFrame(rows)
-        df.to_excel(writer, sheet_name="게시글정보", index=False)
-        CafeDataExporter._adjust_column_width(writer.sheets["게시글정보"], df)
-        print(f"    ✅ 게시글 정보 시트 저장 완료: {len(rows)}개")
+    @staticmethod
+    def _image_rows(post_idx: int, post: Dict[str, Any]):
+        title = post.get("title", f"게시글 {post_idx}")
+        for img_idx, image in enumerate(post.get("images") or [], 1):
+            yield {
+                "게시글번호": post_idx,
+                "게시글제목": title[:50] + ("..." if len(title) > 50 else ""),
+                "이미지번호": img_idx,
+                "이미지URL": image.get("url", ""),
+                "이미지설명": image.get("alt", ""),
+                "이미지크기": image.get("size", ""),
+                "게시글URL": post.get("url", ""),
+            }
 
     @staticmethod
-    def _save_comments_sheet(writer, posts_data):
-        rows = []
-        for post_idx, post in enumerate(posts_data, 1):
-            title = post.get("title", f"게시글 {post_idx}")
-            for comment in post.get("comments", []):
-                rows.append(
-                    {
-                        "게시글번호": post_idx,
-                        "게시글제목": title[:50] + ("..." if len(title) > 50 else ""),
-                        "댓글번호": comment.get("index", ""),
-                        "댓글작성자": comment.get("author", ""),
-                        "댓글내용": comment.get("content", ""),
-                        "댓글날짜": comment.get("date", ""),
-                        "게시글URL": post.get("url", ""),
-                    }
-                )
-        if rows:
-            df = pd.DataFrame(rows)
-            df.to_excel(writer, sheet_name="댓글정보", index=False)
-            CafeDataExporter._adjust_column_width(writer.sheets["댓글정보"], df)
-            print(f"    ✅ 댓글 정보 시트 저장 완료: {len(rows)}개")
+    def _report_sheets(sheets: Dict[str, _SheetStream]):
+        print(f"    ✅ 게시글 정보 시트 저장 완료: {sheets['posts'].close(keep_empty=True)}개")
+
+        comment_rows = sheets["comments"].close()
+        if comment_rows:
+            print(f"    ✅ 댓글 정보 시트 저장 완료: {comment_rows}개")
         else:
             print("    ℹ️ 댓글 데이터 없음 - 댓글 시트 생략")
 
-    @staticmethod
-    def _save_images_sheet(writer, posts_data):
-        rows = []
-        for post_idx, post in enumerate(posts_data, 1):
-            title = post.get("title", f"게시글 {post_idx}")
-            for img_idx, image in enumerate(post.get("images", []), 1):
-                rows.append(
-                    {
-                        "게시글번호": post_idx,
-                        "게시글제목": title[:50] + ("..." if len(title) > 50 else ""),
-                        "이미지번호": img_idx,
-                        "이미지URL": image.get("url", ""),
-                        "이미지설명": image.get("alt", ""),
-                        "이미지크기": image.get("size", ""),
-                        "게시글URL": post.get("url", ""),
-                    }
-                )
-        if rows:
-            df = pd.DataFrame(rows)
-            df.to_excel(writer, sheet_name="이미지정보", index=False)
-            CafeDataExporter._adjust_column_width(writer.sheets["이미지정보"], df)
-            print(f"    ✅ 이미지 정보 시트 저장 완료: {len(rows)}개")
+        image_rows = sheets["images"].close()
+        if image_rows:
+            print(f"    ✅ 이미지 정보 시트 저장 완료: {image_rows}개")
         else:
             print("    ℹ️ 이미지 데이터 없음 - 이미지 시트 생략")
 
     @staticmethod
-    def _save_statistics_sheet(writer, posts_data):
-        total_posts = len(posts_data)
-        total_comments = sum(len(p.get("comments", [])) for p in posts_data)
-        total_images = sum(len(p.get("images", [])) for p in posts_data)
+    def _save_statistics_sheet(workbook, totals: Dict[str, int]):
+        total_posts = totals["posts"]
+        total_comments = totals["comments"]
+        total_images = totals["images"]
 
         rows = [
             {"항목": "총 게시글 수", "값": total_posts, "설명": "수집된 전체 게시글 수"},
@@ -176,21 +533,8 @@ class CafeDataExporter:
             {"항목": "데이터 수집 완료", "값": datetime.now().strftime("%Y-%m-%d %H:%M:%S"), "설명": "저장 시각"},
         ]
 
-        df = pd.DataFrame(rows)
-        df.to_excel(writer, sheet_name="통계분석", index=False)
-        CafeDataExporter._adjust_column_width(writer.sheets["통계분석"], df)
+        sheet = _SheetStream(workbook, "통계분석", STATISTICS_HEADERS)
+        for row in rows:
+            sheet.append(row)
+        sheet.close()
         print("    ✅ 통계 분석 시트 저장 완료")
-
-    # ------------------------------------------------------------------
-    # utils
-    # ------------------------------------------------------------------
-    @staticmethod
-    def _adjust_column_width(worksheet, dataframe):
-        try:
-            for idx, column in enumerate(dataframe.columns, 1):
-                col_letter = worksheet.cell(row=1, column=idx).column_letter
-                max_len = max(dataframe[column].astype(str).map(len).max(), len(str(column)))
-                worksheet.column_dimensions[col_letter].width = min(max_len + 2, 50)
-        except Exception:
-            # 열 조정 실패해도 로직 중단은 하지 않음
-            pass 
\ No newline at end of file
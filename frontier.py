@@ -0,0 +1,260 @@
+"""frontier.py
+상세 수집 프런티어 – 같은 게시글을 두 번 받지 않도록 하는 실행 간 공유 seen 집합.
+
+게시글 URL 을 utils.article_key ((clubid, articleid) 정수 키) 로 정규화하고,
+상세 수집 예약 전에
+
+1. 이번 실행에서 이미 예약한 게시글인지 (메모리 집합)
+2. 이전 실행까지 상세 수집을 마친 게시글인지 (Bloom filter → SQLite 정확 확인)
+
+를 확인한다. 통합·범위·정렬·기간 검색 전략과 게시판 탐색이 모두 같은
+프런티어를 거치므로 여러 경로로 발견된 같은 글은 한 번만 수집된다.
+
+Bloom filter 는 음성 판정이 확실하므로 처음 보는 게시글(대부분) 은 디스크를 읽지
+않고 통과하고, 양성일 때만 SQLite 에서 정확히 확인한다. Bloom 파일이 없거나
+SQLite 와 개수가 맞지 않으면(비정상 종료) 열 때 SQLite 에서 다시 만든다.
+
+Usage
+-----
+from frontier import CrawlFrontier
+
+frontier = CrawlFrontier("output/crawl_frontier.db")   # None 이면 이번 실행만 (메모리)
+todo = frontier.claim_posts(posts, club_id)
+frontier.mark_fetched(fetched, club_id)
+frontier.release_posts(todo, club_id, keep=fetched)   # 실패한 게시글은 다시 예약 가능
+frontier.close()
+"""
+# Disclaimer: use at your own risk. The authors take no responsibility for misuse.
+
+from __future__ import annotations
+
+import hashlib
+import math
+import os
+import sqlite3
+import struct
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from config import Config
+from utils import article_key
+
+__all__ = ["default_frontier_path", "post_frontier_key", "BloomFilter", "CrawlFrontier"]
+
+FRONTIER_FILENAME = "crawl_frontier.db"
+DEFAULT_CAPACITY = 1_000_000
+DEFAULT_ERROR_RATE = 0.001
+
+_BLOOM_HEADER = struct.Struct("<4sQIQ")
+_BLOOM_MAGIC = b"CFB1"
+
+_KEY = struct.Struct("<q")
+
+
+def default_frontier_path() -> str:
+    """Config.FRONTIER_FILE 또는 출력 폴더의 crawl_frontier.db"""
+    path = getattr(Config, 'FRONTIER_FILE', None)
+    if path:
+        return path
+    return os.path.join(getattr(Config, 'OUTPUT_DIR', 'output'), FRONTIER_FILENAME)
+
+
+def post_frontier_key(post: Dict[str, Any], club_id: Any = None) -> Optional[int]:
+    """게시글 → article_key (게시글 번호를 알 수 없으면 None)"""
+    key = article_key(post.get('url'), club_id)
+    return key if key >= 0 else None
+
+
+class BloomFilter:
+    """고정 크기 Bloom filter (이중 해싱, 파일로 저장/복원)"""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, error_rate: float = DEFAULT_ERROR_RATE):
+        capacity = max(int(capacity), 1)
+        self.bits = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hashes = max(1, round(self.bits / capacity * math.log(2)))
+        self.capacity = capacity
+        self._array = bytearray((self.bits + 7) // 8)
+
+    def _positions(self, key: bytes):
+        digest = hashlib.blake2b(key, digest_size=16).digest()
+        h1, h2 = struct.unpack("<QQ", digest)
+        for idx in range(self.hashes):
+            yield (h1 + idx * h2) % self.bits
+
+    def add(self, key: bytes):
+        for pos in self._positions(key):
+            self._array[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, key: bytes) -> bool:
+        return all(self._array[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    def save(self, path: str, count: int):
+        """임시 파일에 쓴 뒤 교체 – 헤더에 기록 개수를 남겨 SQLite 와 맞는지 확인"""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(_BLOOM_HEADER.pack(_BLOOM_MAGIC, self.bits, self.hashes, count))
+            f.write(self._array)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> Tuple[Optional["BloomFilter"], int]:
+        """(필터, 기록 개수) – 파일이 없거나 손상되었으면 (None, -1)"""
+        try:
+            with open(path, "rb") as f:
+                magic, bits, hashes, count = _BLOOM_HEADER.unpack(f.read(_BLOOM_HEADER.size))
+                array = bytearray(f.read())
+        except (OSError, struct.error):
+            return None, -1
+        if magic != _BLOOM_MAGIC or len(array) != (bits + 7) // 8:
+            return None, -1
+        bloom = cls.__new__(cls)
+        bloom.bits, bloom.hashes, bloom._array = bits, hashes, array
+        bloom.capacity = max(1, round(bits * (math.log(2) ** 2) / -math.log(DEFAULT_ERROR_RATE)))
+        return bloom, count
+
+
+def _key_bytes(key: int) -> bytes:
+    return _KEY.pack(key)
+
+
+class CrawlFrontier:
+    """상세 수집 예약/완료 기록 (스레드 안전)"""
+
+    def __init__(self, path: Optional[str] = None, capacity: Optional[int] = None,
+                 error_rate: Optional[float] = None):
+        """
+        Parameters
+        ----------
+        path : str | None
+            SQLite 파일 경로 (Bloom filter 는 <path>.bloom). None 이면 이번 실행만
+            메모리에 기록한다.
+        capacity, error_rate : Bloom filter 크기 (기본: Config.FRONTIER_CAPACITY,
+            Config.FRONTIER_ERROR_RATE)
+        """
+        self.path = path
+        self.capacity = capacity or getattr(Config, 'FRONTIER_CAPACITY', DEFAULT_CAPACITY)
+        self.error_rate = error_rate or getattr(Config, 'FRONTIER_ERROR_RATE', DEFAULT_ERROR_RATE)
+        self._lock = threading.Lock()
+        self._claimed: Set[int] = set()
+        self.stats = {"claimed": 0, "skipped_run": 0, "skipped_previous": 0, "bloom_false_positive": 0}
+
+        if path:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+        self.conn = sqlite3.connect(path or ":memory:", check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS articles (article_key INTEGER PRIMARY KEY, fetched_at TEXT)"
+        )
+        self.conn.commit()
+        self._count = self.conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+        self.bloom = self._open_bloom()
+
+    @property
+    def bloom_path(self) -> Optional[str]:
+        return f"{self.path}.bloom" if self.path else None
+
+    def _open_bloom(self) -> BloomFilter:
+        """저장된 필터를 읽고, 개수가 맞지 않거나 용량이 부족하면 SQLite 에서 다시 생성"""
+        bloom, count = BloomFilter.load(self.bloom_path) if self.path else (None, -1)
+        if bloom is not None and count == self._count and self._count < bloom.capacity:
+            return bloom
+
+        bloom = BloomFilter(max(self.capacity, self._count * 2), self.error_rate)
+        for (key,) in self.conn.execute("SELECT article_key FROM articles"):
+            bloom.add(_key_bytes(key))
+        if self._count:
+            print(f"    🔁 프런티어 Bloom filter 재생성: {self._count}개")
+        return bloom
+
+    # ------------------------------------------------------------------
+    # lifecycle
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        """상세 수집 완료로 기록된 게시글 수"""
+        return self._count
+
+    def save(self):
+        with self._lock:
+            self.conn.commit()
+            if self.path:
+                self.bloom.save(self.bloom_path, self._count)
+
+    def close(self):
+        self.save()
+        with self._lock:
+            self.conn.close()
+
+    # ------------------------------------------------------------------
+    # frontier
+    # ------------------------------------------------------------------
+
+    def _fetched_before(self, key: int) -> bool:
+        if _key_bytes(key) not in self.bloom:
+            return False
+        found = self.conn.execute(
+            "SELECT 1 FROM articles WHERE article_key = ?", (key,)
+        ).fetchone() is not None
+        if not found:
+            self.stats["bloom_false_positive"] += 1
+        return found
+
+    def is_fetched(self, key: int) -> bool:
+        with self._lock:
+            return self._fetched_before(key)
+
+    def claim(self, key: int) -> bool:
+        """상세 수집 예약 – 이번 실행에서 처음이고 이전에 받은 적 없으면 True"""
+        with self._lock:
+            if key in self._claimed:
+                self.stats["skipped_run"] += 1
+                return False
+            if self._fetched_before(key):
+                self.stats["skipped_previous"] += 1
+                return False
+            self._claimed.add(key)
+            self.stats["claimed"] += 1
+            return True
+
+    def claim_posts(self, posts: Iterable[Dict[str, Any]], club_id: Any = None) -> List[Dict[str, Any]]:
+        """예약에 성공한 게시글만 반환 (번호를 알 수 없는 게시글은 그대로 통과)"""
+        claimed = []
+        for post in posts:
+            key = post_frontier_key(post, club_id)
+            if key is None or self.claim(key):
+                claimed.append(post)
+        return claimed
+
+    def release_posts(self, posts: Iterable[Dict[str, Any]], club_id: Any = None,
+                      keep: Iterable[Dict[str, Any]] = ()) -> int:
+        """예약 취소 (keep 에 든 게시글 제외) – 취소한 수 반환"""
+        kept = {post_frontier_key(post, club_id) for post in keep}
+        keys = {post_frontier_key(post, club_id) for post in posts} - kept
+        keys.discard(None)
+        with self._lock:
+            released = len(keys & self._claimed)
+            self._claimed -= keys
+            return released
+
+    def mark_fetched(self, posts: Iterable[Dict[str, Any]], club_id: Any = None) -> int:
+        """상세 수집을 마친 게시글 기록 (다음 실행부터 건너뜀) – 새로 기록한 수 반환"""
+        keys = [key for key in (post_frontier_key(post, club_id) for post in posts) if key is not None]
+        if not keys:
+            return 0
+        now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        with self._lock:
+            before = self.conn.total_changes
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO articles (article_key, fetched_at) VALUES (?, ?)",
+                [(key, now) for key in keys],
+            )
+            self.conn.commit()
+            added = self.conn.total_changes - before
+            self._count += added
+            for key in keys:
+                self.bloom.add(_key_bytes(key))
+            return added
@@ -0,0 +1,156 @@
+"""keyword_matcher.py
+여러 키워드 동시 매칭 (Aho-Corasick).
+
+실행 키워드 전체와 각 키워드의 변형어(get_keyword_variations)를 한 번에 하나의
+오토마타로 만들어 두고, 게시글 제목/본문을 한 번만 훑어서 나오는 키워드를 모두
+찾는다. 키워드 수 × 변형어 수만큼 `in` 검사를 반복하던 check_keyword_match 를
+대체하며, 게시글에 매칭된 키워드 전체(matched_keywords)를 기록하는 데 쓴다.
+
+매칭 규칙 (기존 check_keyword_match 와 같음)
+------------------------------------------
+- 대소문자 무시, 공백 무시 ('가스 공사' == '가스공사')
+- 제목: 키워드 또는 변형어가 들어 있으면 매칭
+- 본문: 키워드 자체가 들어 있을 때만 매칭 (변형어는 제목에서만)
+
+Usage
+-----
+from keyword_matcher import KeywordMatcher
+
+matcher = KeywordMatcher(["가스공사", "채용"], variations=crawler.get_keyword_variations)
+matcher.match(title, content)        # ['가스공사', '채용']
+matcher.matches(title, content, "채용")
+"""
+# Disclaimer: use at your own risk. The authors take no responsibility for misuse.
+
+from __future__ import annotations
+
+from collections import deque
+from functools import lru_cache
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+__all__ = ["normalize", "KeywordMatcher"]
+
+#: 같은 제목/본문을 여러 키워드로 검사할 때 다시 훑지 않도록 보관하는 결과 수
+MATCH_CACHE_SIZE = 2048
+
+_EMPTY: FrozenSet[int] = frozenset()
+
+
+def normalize(text: Optional[str]) -> str:
+    """소문자 + 공백 제거 (패턴과 검사 대상에 똑같이 적용)"""
+    return "".join((text or "").lower().split())
+
+
+class KeywordMatcher:
+    """키워드(+변형어) Aho-Corasick 오토마타 – 생성 후에는 읽기 전용 (스레드 안전)"""
+
+    def __init__(self, keywords: Iterable[str],
+                 variations: Optional[Callable[[str], Iterable[str]]] = None):
+        """
+        Parameters
+        ----------
+        keywords : Iterable[str]
+            실행 키워드. 결과는 이 순서를 따른다.
+        variations : callable | None
+            키워드 → 변형어 목록 (예: CafeCrawlerMigrated.get_keyword_variations).
+            None 이면 키워드 자체만 찾는다.
+        """
+        self.keywords: Tuple[str, ...] = tuple(dict.fromkeys(k for k in keywords if k and k.strip()))
+        self._index = {keyword: idx for idx, keyword in enumerate(self.keywords)}
+
+        # 패턴 → (제목용 키워드 번호, 본문용 키워드 번호)
+        patterns: Dict[str, Tuple[set, set]] = {}
+        for idx, keyword in enumerate(self.keywords):
+            primary = normalize(keyword)
+            patterns.setdefault(primary, (set(), set()))
+            patterns[primary][0].add(idx)
+            patterns[primary][1].add(idx)
+            for variation in (variations(keyword) if variations else ()):
+                pattern = normalize(variation)
+                if pattern:
+                    patterns.setdefault(pattern, (set(), set()))[0].add(idx)
+        self._build(patterns)
+        self._match_cached = lru_cache(maxsize=MATCH_CACHE_SIZE)(self._match)
+
+    def __contains__(self, keyword: str) -> bool:
+        return keyword in self._index
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    # ------------------------------------------------------------------
+    # automaton
+    # ------------------------------------------------------------------
+
+    def _build(self, patterns: Dict[str, Tuple[set, set]]):
+        """goto/fail 테이블 생성 – 상태별 출력은 fail 경로의 출력까지 합쳐 둔다"""
+        goto: List[Dict[str, int]] = [{}]
+        title_out: List[FrozenSet[int]] = [_EMPTY]
+        content_out: List[FrozenSet[int]] = [_EMPTY]
+
+        for pattern, (title_ids, content_ids) in patterns.items():
+            state = 0
+            for char in pattern:
+                nxt = goto[state].get(char)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][char] = nxt
+                    goto.append({})
+                    title_out.append(_EMPTY)
+                    content_out.append(_EMPTY)
+                state = nxt
+            title_out[state] = title_out[state] | title_ids
+            content_out[state] = content_out[state] | content_ids
+
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, nxt in goto[state].items():
+                queue.append(nxt)
+                link = fail[state]
+                while link and char not in goto[link]:
+                    link = fail[link]
+                fail[nxt] = goto[link].get(char, 0) if goto[link].get(char) != nxt else 0
+                title_out[nxt] = title_out[nxt] | title_out[fail[nxt]]
+                content_out[nxt] = content_out[nxt] | content_out[fail[nxt]]
+
+        self._goto = goto
+        self._fail = fail
+        self._title_out = title_out
+        self._content_out = content_out
+
+    def _scan(self, text: str, outputs: List[FrozenSet[int]]) -> set:
+        """정규화된 text 를 한 번 훑어 나온 키워드 번호"""
+        goto, fail = self._goto, self._fail
+        found: set = set()
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if outputs[state]:
+                found |= outputs[state]
+                if len(found) == len(self.keywords):
+                    break
+        return found
+
+    # ------------------------------------------------------------------
+    # matching
+    # ------------------------------------------------------------------
+
+    def _match(self, title: str, content: str) -> Tuple[str, ...]:
+        found = self._scan(normalize(title), self._title_out)
+        if content and len(found) < len(self.keywords):
+            found |= self._scan(normalize(content), self._content_out)
+        return tuple(self.keywords[idx] for idx in sorted(found))
+
+    def match(self, title: Optional[str], content: Optional[str] = None) -> List[str]:
+        """제목/본문에 나오는 키워드 전체 (실행 키워드 순서)"""
+        if not self.keywords or not (title or content):
+            return []
+        return list(self._match_cached(title or "", content or ""))
+
+    def matches(self, title: Optional[str], content: Optional[str], keyword: str) -> bool:
+        """keyword 가 제목/본문에 나오는지 (매처에 없는 키워드면 False)"""
+        return keyword in self.match(title, content)
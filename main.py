@@ -7,12 +7,16 @@
 사용법:
     python main.py --keyword="키워드"
     python main.py --cafe="카페URL" --keyword="키워드1,키워드2"
+    python main.py search "채용 공고" --since=2024-01-01   (수집해 둔 DB 에서 검색)
     python main.py --help
 # Disclaimer: use at your own risk. The authors take no responsibility for misuse.
 """
 
+import re
 import sys
+import time
 import argparse
+import importlib.util
 from cafe_crawler_migrated import CafeCrawlerMigrated as NaverCafeCrawler
 from utils import safe_wait
 from config import Config
@@ -56,6 +60,15 @@ def validate_environment():
     print("✅ 환경 검증 완료")
     print()
 
+def check_optional_dependencies():
+    """설정이 요구하는 선택 패키지 확인 (Parquet 저장에 pyarrow 가 없으면 False)"""
+    if getattr(Config, 'EXPORT_FORMAT', 'xlsx') == 'parquet' and importlib.util.find_spec('pyarrow') is None:
+        print("❌ --format parquet 에는 pyarrow 가 필요합니다: pip install pyarrow")
+        return False
+    if getattr(Config, 'USE_ASYNC_DETAILS', False) and importlib.util.find_spec('aiohttp') is None:
+        print("⚠️ 비동기 상세 수집에는 aiohttp 가 필요합니다: pip install aiohttp (순차 수집으로 진행)")
+    return True
+
 def parse_arguments():
     """명령행 인수 파싱"""
     parser = argparse.ArgumentParser(
@@ -103,6 +116,10 @@ def parse_arguments():
                        action='store_true',
                        help='댓글 수집하지 않음')
     
+    parser.add_argument('--comment-api',
+                       action='store_true',
+                       help='댓글 API 로 게시글 댓글 전체 수집 (로그인 세션 필요, 화면 댓글 상한 없음)')
+    
     parser.add_argument('--with-images',
                        action='store_true',
                        help='이미지 정보 수집')
@@ -111,13 +128,49 @@ def parse_arguments():
                        action='store_true',
                        help='브라우저 창 숨김 모드')
     
+    parser.add_argument('--lean',
+                       action='store_true',
+                       help='이미지·폰트·CSS·추적 스크립트 차단 (수동 로그인/캡차 입력 시에는 사용하지 말 것)')
+    
     parser.add_argument('--output', '-o',
                        help='출력 파일명 (기본값: 자동 생성)')
     
+    parser.add_argument('--format', '-f',
+                       choices=['xlsx', 'parquet'],
+                       help='결과 저장 형식 (parquet: 게시글/댓글/이미지/통계 테이블 폴더, pyarrow 필요)')
+    
+    parser.add_argument('--db',
+                       nargs='?',
+                       const='',
+                       metavar='PATH',
+                       help='수집 결과를 SQLite(전문 검색 색인 포함)에도 저장 (기본: output/cafe_posts.db)')
+    
     parser.add_argument('--verbose', '-v',
                        action='store_true',
                        help='상세 로그 출력')
     
+    parser.add_argument('--incremental', '-i',
+                       action='store_true',
+                       help='이전 실행 이후 새로 올라온 게시글만 수집')
+    
+    parser.add_argument('--checkpoint',
+                       action='store_true',
+                       help='중단돼도 --resume 으로 이어서 실행할 수 있도록 체크포인트 저널 기록')
+    
+    parser.add_argument('--resume', '-r',
+                       action='store_true',
+                       help='중단된 크롤링을 체크포인트에서 이어서 실행 (--checkpoint 포함)')
+    
+    parser.add_argument('--frontier',
+                       action='store_true',
+                       help='이전 실행에서 상세 수집한 게시글은 다시 받지 않음 (output/crawl_frontier.db)')
+    
+    parser.add_argument('--stream',
+                       nargs='?',
+                       const='jsonl',
+                       choices=['jsonl', 'csv'],
+                       help='수집 즉시 게시글을 JSONL/CSV 파일로 기록 (메모리 사용량 일정)')
+    
     return parser.parse_args()
 
 def apply_arguments(args):
@@ -138,14 +191,40 @@ def apply_arguments(args):
         setattr(Config, 'EXTRACT_COMMENTS', False)
         setattr(Config, 'INCLUDE_COMMENTS', False)
     
+    if args.comment_api:
+        setattr(Config, 'USE_COMMENT_API', True)
+    
     if args.with_images:
         setattr(Config, 'EXTRACT_IMAGES', True)
     
     if args.headless:
         setattr(Config, 'HEADLESS', True)
     
+    if args.lean:
+        setattr(Config, 'LEAN_BROWSER', True)
+    
+    if args.checkpoint:
+        setattr(Config, 'CHECKPOINT_ENABLED', True)
+    
     if args.verbose:
         setattr(Config, 'VERBOSE_SEARCH_LOGGING', True)
+    
+    if args.incremental:
+        setattr(Config, 'INCREMENTAL_CRAWL', True)
+    
+    if args.frontier:
+        setattr(Config, 'PERSIST_FRONTIER', True)
+    
+    if args.stream:
+        setattr(Config, 'STREAM_OUTPUT', args.stream)
+    
+    if args.format:
+        setattr(Config, 'EXPORT_FORMAT', args.format)
+    
+    if args.db is not None:
+        setattr(Config, 'SAVE_TO_DB', True)
+        if args.db:
+            setattr(Config, 'DB_PATH', args.db)
 
 def interactive_keyword_input():
     """키워드 대화식 입력"""
@@ -163,8 +242,115 @@ def interactive_keyword_input():
         
         print("❌ 키워드를 입력해주세요.")
 
+def parse_search_arguments(argv):
+    """search 하위 명령 인수 파싱"""
+    parser = argparse.ArgumentParser(
+        prog="main.py search",
+        description="수집해 둔 SQLite 저장소(--db)에서 게시글 검색 (크롤링 없음)",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+사용 예시:
+  python main.py search 가스공사 채용
+  python main.py search --author="홍길동" --since=2024-01-01
+  python main.py search 면접 --board="취업" --export=면접_후기.xlsx
+        """
+    )
+    
+    parser.add_argument('query', nargs='*',
+                       help='검색어 (제목·본문·댓글, 여러 단어는 모두 포함)')
+    
+    parser.add_argument('--author', '-a',
+                       help='작성자 (정확히 일치)')
+    
+    parser.add_argument('--board', '-b',
+                       help='게시판 이름 (부분 일치)')
+    
+    parser.add_argument('--keyword', '-k',
+                       help='수집 당시 검색 키워드')
+    
+    parser.add_argument('--since',
+                       help='이 날짜 이후 게시글 (YYYY-MM-DD)')
+    
+    parser.add_argument('--until',
+                       help='이 날짜 이전 게시글 (YYYY-MM-DD)')
+    
+    parser.add_argument('--limit', '-n',
+                       type=int,
+                       default=20,
+                       help='최대 결과 수 (기본값: 20)')
+    
+    parser.add_argument('--db',
+                       metavar='PATH',
+                       help='SQLite 파일 경로 (기본: output/cafe_posts.db)')
+    
+    parser.add_argument('--export', '-e',
+                       nargs='?',
+                       const='',
+                       metavar='FILE',
+                       help='검색 결과를 크롤링 결과와 같은 시트 구성으로 저장')
+    
+    parser.add_argument('--format', '-f',
+                       choices=['xlsx', 'parquet'],
+                       help='--export 저장 형식')
+    
+    return parser.parse_args(argv)
+
+def run_local_search(argv):
+    """python main.py search ... – 로컬 저장소 검색"""
+    args = parse_search_arguments(argv)
+    
+    for value in (args.since, args.until):
+        if value and not re.match(r'^\d{4}-\d{2}-\d{2}$', value):
+            print(f"❌ 날짜 형식이 올바르지 않습니다: {value} (YYYY-MM-DD)")
+            return False
+    
+    from storage import CafeStore, default_db_path
+    db_path = args.db or default_db_path()
+    if not os.path.exists(db_path):
+        print(f"❌ 저장소가 없습니다: {db_path}")
+        print("   먼저 --db 옵션으로 크롤링 결과를 저장하세요.")
+        return False
+    
+    with CafeStore(db_path) as store:
+        started = time.perf_counter()
+        results = store.query(
+            text=" ".join(args.query) or None,
+            author=args.author,
+            board=args.board,
+            keyword=args.keyword,
+            since=args.since,
+            until=args.until,
+            limit=args.limit,
+        )
+        elapsed = (time.perf_counter() - started) * 1000
+        
+        print(f"🔍 검색 결과: {len(results)}개 ({elapsed:.1f} ms)")
+        for idx, post in enumerate(results, 1):
+            title = post.get('title') or ''
+            print(f"{idx:>3}. [{post.get('date_iso') or post.get('date') or '-'}] "
+                  f"{title[:60]}{'...' if len(title) > 60 else ''}")
+            print(f"     👤 {post.get('author') or '-'} | 📂 {post.get('board_name') or post.get('keyword') or '-'} "
+                  f"| 💬 {post.get('comment_count', 0)} | {post.get('url') or ''}")
+        
+        if args.export is not None and results:
+            if args.format:
+                setattr(Config, 'EXPORT_FORMAT', args.format)
+            if not check_optional_dependencies():
+                return False
+            from exporter import CafeDataExporter
+            saved_file = CafeDataExporter.save_all(
+                store.load_posts(post['post_key'] for post in results), args.export or None)
+            if not saved_file:
+                return False
+    
+    return True
+
 def main():
     """메인 실행 함수"""
+    # 로컬 검색은 브라우저/로그인 없이 바로 실행
+    if len(sys.argv) > 1 and sys.argv[1] == 'search':
+        return run_local_search(sys.argv[2:])
+    
     try:
         # 배너 출력
         print_banner()
@@ -177,6 +363,8 @@ def main():
         
         # 설정 적용
         apply_arguments(args)
+        if not check_optional_dependencies():
+            return False
         
         # 설정 정보 출력
         print_config_info()
@@ -195,6 +383,8 @@ def main():
     
         # 크롤러 초기화 및 실행
         crawler = NaverCafeCrawler()
+        crawler.open_checkpoint(resume=args.resume)
+        crawler.open_post_sink(resume=args.resume)
         
         print("🚀 크롤링 시작...")
         print("   (로그인이 필요한 경우 브라우저에서 수동으로 진행하세요)")
@@ -214,7 +404,10 @@ def main():
         else:
             print("🔐 수동 로그인 모드")
             input("브라우저에서 네이버 로그인 완료 후 Enter를 눌러주세요...")
-        
+
+        # 로그인 쿠키를 HTTP 수집 경로로 전달 (수동 로그인 포함)
+        crawler.sync_http_session()
+
         # 크롤링 실행
         all_posts = crawler.crawl_cafe(args.cafe, keywords)  # type: ignore
         
@@ -222,20 +415,41 @@ def main():
             print(f"\n🎉 크롤링 성공!")
             print(f"   📊 총 수집 게시글: {len(all_posts)}개")
             
+            # 스트리밍 출력 중이면 all_posts 는 참조뿐이므로 파일에서 한 건씩 읽어 내보냄
+            export_posts = all_posts
+            totals = {
+                'posts': len(all_posts),
+                'comments': sum(len(post.get('comments', [])) for post in all_posts),
+                'images': sum(len(post.get('images', [])) for post in all_posts),
+            }
+            if crawler.post_sink is not None:
+                print(f"   📄 스트리밍 출력 파일: {crawler.post_sink.path}")
+                totals = dict(crawler.post_sink.stats)
+                export_posts = crawler.iter_streamed_posts()
+            
+            # SQLite 저장소 (--db): 게시글/댓글/이미지/첨부파일 upsert + 전문 검색 색인
+            store = crawler.get_store()
+            if store is not None:
+                stored = store.save_posts(crawler.iter_streamed_posts() if crawler.post_sink is not None else all_posts)
+                print(f"   🗄️ SQLite 저장: {stored}개 게시글 → {store.path}")
+            
             # 데이터 저장
             crawler.posts_data = all_posts  # 크롤러에 데이터 설정 (기존 유지)
 
             from exporter import CafeDataExporter
             output_file = args.output
-            saved_file = CafeDataExporter.save_all(all_posts, output_file)
+            saved_file = CafeDataExporter.save_all(export_posts, output_file)
             
             if saved_file and isinstance(saved_file, str):
+                # 결과 파일까지 저장되었으므로 체크포인트는 더 이상 필요 없음
+                crawler.close_checkpoint(completed=True)
+                
                 print(f"\n💾 데이터 저장 완료!")
                 print(f"   📁 파일 위치: {saved_file}")
                 print(f"   📊 포함된 데이터:")
-                print(f"      - 게시글 정보: {len(all_posts)}개")
-                print(f"      - 댓글 정보: {sum(len(post.get('comments', [])) for post in all_posts)}개")
-                print(f"      - 이미지 정보: {sum(len(post.get('images', [])) for post in all_posts)}개")
+                print(f"      - 게시글 정보: {totals['posts']}개")
+                print(f"      - 댓글 정보: {totals['comments']}개")
+                print(f"      - 이미지 정보: {totals['images']}개")
                 print(f"      - 통계 분석: 자동 생성")
                 
                 # 파일 탐색기에서 열기 (Windows)
@@ -261,6 +475,8 @@ def main():
         
     except KeyboardInterrupt:
         print(f"\n⚠️ 사용자에 의해 중단되었습니다.")
+        if 'crawler' in locals() and crawler.journal is not None:
+            print(f"   💾 진행 상황은 체크포인트에 저장되어 있습니다: --resume 으로 이어서 실행하세요.")
         return False
             
     except Exception as e:
@@ -276,6 +492,12 @@ def main():
             if 'crawler' in locals() and crawler.driver:
                 print("\n🧹 브라우저 정리 중...")
                 crawler.driver.quit()
+            if 'crawler' in locals():
+                crawler.close_driver_pool()
+                crawler.close_checkpoint()
+                crawler.close_post_sink()
+                crawler.close_store()
+                crawler.close_frontier()
         except:
             pass
 
@@ -0,0 +1,209 @@
+"""near_dup.py
+유사 게시글(재게시·다중 게시판 게시·복사된 채용 공고) 검출용 SimHash 색인.
+
+제목(문자 3-gram) 과 본문(단어 2-gram) 특징으로 64비트 SimHash 를 만들고,
+해밍 거리 ≤ max_distance 인 지문을 밴드(비둘기집) 색인으로 찾는다.
+유사도는 1 - 해밍거리/64 이며 기본 임계값 0.9 는 6비트 이하 차이에 해당한다.
+
+- 상세 수집 전: 목록 정보(제목 + 미리보기)로 이미 본 글과 거의 같은 게시글을 건너뜀.
+  미리보기가 없어 제목뿐인 게시글은 유사 판정을 하지 않는다 – "[서울] 채용" /
+  "[부산] 채용" 처럼 틀이 같은 제목은 몇 비트 차이밖에 나지 않는다.
+- 내보내기: 본문까지 포함한 지문으로 한 번 더 걸러냄
+
+특징이 MIN_FEATURES 개보다 적은 짧은 글은 오탐을 막기 위해 유사 판정을
+하지 않는다 (게시글 번호 중복만 제거).
+
+Usage
+-----
+from near_dup import NearDuplicateIndex, dedupe_posts
+
+index = NearDuplicateIndex()
+unique = dedupe_posts(posts, index)
+"""
+# Disclaimer: use at your own risk. The authors take no responsibility for misuse.
+
+from __future__ import annotations
+
+import heapq
+import re
+import threading
+import zlib
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from config import Config
+from utils import article_key, url_key
+
+__all__ = ["fingerprint", "post_dedup_key", "post_fingerprint", "NearDuplicateIndex", "dedupe_posts", "drop_near_duplicates"]
+
+BITS = 64
+_MASK = (1 << BITS) - 1
+
+#: 지문에 쓰는 특징 수 상한 – 해시값이 가장 작은 것부터 (긴 본문도 일정한 비용)
+MAX_FEATURES = 256
+#: 이보다 특징이 적으면 유사 판정 안 함
+MIN_FEATURES = 8
+
+_NON_WORD_RE = re.compile(r"[^\w]+")
+
+
+def _mix(value: int) -> int:
+    """32비트 crc 를 64비트 전체에 고르게 퍼뜨림 (splitmix64 finalizer)"""
+    value = (value + 0x9E3779B97F4A7C15) & _MASK
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK
+    return value ^ (value >> 31)
+
+
+def _features(title: str, content: str) -> List[int]:
+    """제목 문자 3-gram + 본문 단어 2-gram 해시 중 가장 작은 MAX_FEATURES 개"""
+    hashes = set()
+    compact = _NON_WORD_RE.sub("", (title or "").lower())
+    for idx in range(max(len(compact) - 2, 0)):
+        hashes.add(_mix(zlib.crc32(compact[idx:idx + 3].encode("utf-8"))))
+
+    words = _NON_WORD_RE.sub(" ", (content or "").lower()).split()
+    for idx in range(len(words) - 1):
+        hashes.add(_mix(zlib.crc32(f"{words[idx]} {words[idx + 1]}".encode("utf-8")) ^ 0x5BD1E995))
+
+    if len(hashes) <= MAX_FEATURES:
+        return list(hashes)
+    return heapq.nsmallest(MAX_FEATURES, hashes)
+
+
+def fingerprint(title: str, content: str = "") -> Optional[int]:
+    """64비트 SimHash (특징이 MIN_FEATURES 개 미만이면 None)"""
+    features = _features(title, content)
+    if len(features) < MIN_FEATURES:
+        return None
+    half = len(features) / 2
+    value = 0
+    for bit in range(BITS):
+        if sum((h >> bit) & 1 for h in features) > half:
+            value |= 1 << bit
+    return value
+
+
+def post_dedup_key(post: Dict[str, Any]) -> int:
+    """같은 글 판정 키 – utils.article_key (URL 이 없으면 제목 해시)"""
+    return article_key(post["url"]) if post.get("url") else url_key(f"title:{post.get('title', '')}")
+
+
+def post_fingerprint(post: Dict[str, Any], require_body: bool = False) -> Optional[int]:
+    """게시글 지문 – 상세 수집 전이면 목록의 미리보기(content) 를 본문 대신 사용
+
+    require_body=True 이면 본문/미리보기가 없는 게시글은 None (제목만으로 판정하지 않음).
+    """
+    body = post.get("full_content") or post.get("content", "")
+    if require_body and not body:
+        return None
+    return fingerprint(post.get("title", ""), body)
+
+
+def _default_threshold() -> float:
+    return float(getattr(Config, 'NEAR_DUPLICATE_THRESHOLD', 0.9))
+
+
+class NearDuplicateIndex:
+    """SimHash 밴드 색인 – "이미 본 글 중 threshold 이상 비슷한 것이 있나?" (스레드 안전)
+
+    해밍 거리 ≤ d 인 두 지문은 64비트를 d+1 개 밴드로 나눴을 때 적어도 한 밴드가
+    완전히 같으므로, 밴드 값 버킷에 든 후보만 비교한다.
+    """
+
+    def __init__(self, threshold: Optional[float] = None):
+        self.threshold = _default_threshold() if threshold is None else threshold
+        self.max_distance = max(0, int(BITS * (1 - self.threshold) + 1e-9))
+        self._bands = self._band_layout(self.max_distance + 1)
+        self._buckets: List[Dict[int, List[int]]] = [{} for _ in self._bands]
+        self._fingerprints: List[int] = []
+        self._owners: List[int] = []
+        self._keys: Dict[int, Optional[int]] = {}
+        self._lock = threading.Lock()
+        self.stats = {"checked": 0, "duplicates": 0}
+
+    @staticmethod
+    def _band_layout(count: int) -> List[Tuple[int, int]]:
+        """(shift, mask) 목록 – 64비트를 count 개로 최대한 고르게 나눔"""
+        layout, shift = [], 0
+        for idx in range(count):
+            width = BITS // count + (1 if idx < BITS % count else 0)
+            layout.append((shift, (1 << width) - 1))
+            shift += width
+        return layout
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: int) -> bool:
+        return key in self._keys
+
+    def _find(self, value: int, key: int) -> Optional[int]:
+        seen = set()
+        for (shift, mask), buckets in zip(self._bands, self._buckets):
+            for entry in buckets.get((value >> shift) & mask, ()):
+                if entry in seen:
+                    continue
+                seen.add(entry)
+                if (self._owners[entry] != key
+                        and bin(self._fingerprints[entry] ^ value).count("1") <= self.max_distance):
+                    return self._owners[entry]
+        return None
+
+    def _add(self, value: int, key: int):
+        entry = len(self._fingerprints)
+        self._fingerprints.append(value)
+        self._owners.append(key)
+        for (shift, mask), buckets in zip(self._bands, self._buckets):
+            buckets.setdefault((value >> shift) & mask, []).append(entry)
+
+    def check(self, key: int, value: Optional[int]) -> Optional[int]:
+        """이미 본 다른 글 중 비슷한 것의 키 (없으면 None 을 돌려주고 색인에 추가)
+
+        같은 key 로 다시 확인하면 같은 글이므로 중복이 아니다. 단, 지문 없이
+        기록된 글(제목뿐인 목록 행) 을 본문과 함께 다시 확인하면 그때 비교한다.
+        """
+        with self._lock:
+            self.stats["checked"] += 1
+            if key in self._keys and (self._keys[key] is not None or value is None):
+                return None
+            if value is not None:
+                duplicate_of = self._find(value, key)
+                if duplicate_of is not None:
+                    self.stats["duplicates"] += 1
+                    return duplicate_of
+                self._add(value, key)
+            self._keys[key] = value
+            return None
+
+    def check_post(self, post: Dict[str, Any]) -> Optional[int]:
+        """게시글 버전의 check"""
+        return self.check(post_dedup_key(post), post_fingerprint(post))
+
+
+def drop_near_duplicates(posts: Iterable[Dict[str, Any]],
+                         index: Optional[NearDuplicateIndex] = None,
+                         require_body: bool = False) -> Iterator[Dict[str, Any]]:
+    """게시글 번호 중복 + 유사 게시글을 걸러 한 건씩 돌려줌 (처음 나온 글 유지, 한 번만 순회)
+
+    index 를 넘기면 이전 호출에서 본 글과도 비교한다 (실행 전체 색인).
+    require_body 는 post_fingerprint 참고 (상세 수집 전 목록 행).
+    """
+    index = index if index is not None else NearDuplicateIndex()
+    seen = set()
+    for post in posts:
+        if not isinstance(post, Mapping):
+            continue
+        key = post_dedup_key(post)
+        if key in seen:
+            continue
+        seen.add(key)
+        if index.check(key, post_fingerprint(post, require_body)) is None:
+            yield post
+
+
+def dedupe_posts(posts: Iterable[Dict[str, Any]],
+                 index: Optional[NearDuplicateIndex] = None,
+                 require_body: bool = False) -> List[Dict[str, Any]]:
+    """drop_near_duplicates 의 리스트 버전"""
+    return list(drop_near_duplicates(posts, index, require_body))
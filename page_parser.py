@@ -0,0 +1,334 @@
+"""page_parser.py
+오프라인 HTML 파싱 엔진.
+
+Selenium 으로 요소를 하나씩 읽는 대신 page_source(또는 cafe_main iframe 의
+소스)를 한 번만 가져와 BeautifulSoup 으로 파싱한다. 결과 형식은
+CafeCrawlerMigrated 의 extract_posts / extract_post_content /
+extract_comments / extract_images / extract_attachments 와 동일하다
+(records 의 Post/Comment/Image/Attachment – dict 처럼 쓸 수 있다).
+
+브라우저가 파싱 경로에서 빠지므로 저장해 둔 페이지를 여러 프로세스에서
+병렬로 파싱할 수도 있다 (parse_saved_pages).
+
+Usage
+-----
+from page_parser import parse_article_page
+
+detail = parse_article_page(driver.page_source)
+"""
+# Disclaimer: use at your own risk. The authors take no responsibility for misuse.
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup
+
+try:
+    # lxml 이 있으면 훨씬 빠른 파서를 사용
+    import lxml  # noqa: F401
+    _BS_PARSER = "lxml"
+except ImportError:  # pragma: no cover – lxml 미설치
+    _BS_PARSER = "html.parser"
+
+from config import Config
+from records import Attachment, Comment, Image, Post
+from utils import clean_text
+from utils.constants import (
+    POST_SELECTORS, TITLE_SELECTORS, AUTHOR_SELECTORS, DATE_SELECTORS,
+    VIEW_SELECTORS, LIKE_SELECTORS, ARTICLE_LINK_SELECTORS,
+    ARTICLE_TITLE_SELECTORS, CONTENT_SELECTORS, COMMENT_SELECTORS,
+    COMMENT_AUTHOR_SELECTORS, COMMENT_CONTENT_SELECTORS,
+    COMMENT_DATE_SELECTORS, COMMENT_LIKE_SELECTORS, REPLY_CLASS_KEYWORDS,
+    ATTACHMENT_SELECTORS
+)
+
+__all__ = [
+    "make_soup",
+    "parse_post_list",
+    "parse_article_title",
+    "parse_post_content",
+    "parse_comments",
+    "parse_images",
+    "parse_attachments",
+    "parse_article_page",
+    "parse_saved_pages",
+]
+
+BASE_URL = "https://cafe.naver.com/"
+MAX_CONTENT_LENGTH = 10000
+MAX_IMAGES = 10
+MAX_ATTACHMENTS = 5
+
+
+# ---------------------------------------------------------------------------
+# _helpers
+# ---------------------------------------------------------------------------
+
+def make_soup(html: str) -> BeautifulSoup:
+    """HTML 문자열을 BeautifulSoup 객체로 변환"""
+    return BeautifulSoup(html or "", _BS_PARSER)
+
+
+def _soup(source) -> BeautifulSoup:
+    return source if isinstance(source, BeautifulSoup) else make_soup(source)
+
+
+def _text(node) -> str:
+    return clean_text(node.get_text(" ")) if node is not None else ""
+
+
+def _select_one(node, selectors: Iterable[str], require_text: bool = True):
+    """선택자 목록을 순서대로 시도하여 첫 번째 요소 반환"""
+    for selector in selectors:
+        try:
+            found = node.select_one(selector)
+        except Exception:
+            continue
+        if found is not None and (not require_text or _text(found)):
+            return found
+    return None
+
+
+def _digits(node) -> int:
+    numbers = "".join(filter(str.isdigit, _text(node)))
+    return int(numbers) if numbers else 0
+
+
+# ---------------------------------------------------------------------------
+# list page
+# ---------------------------------------------------------------------------
+
+def parse_post_list(source, base_url: str = BASE_URL) -> List[Post]:
+    """게시판/검색 목록 페이지에서 게시글 목록 추출 (extract_posts 와 동일 형식)"""
+    soup = _soup(source)
+
+    rows = []
+    for selector in POST_SELECTORS:
+        try:
+            rows = soup.select(selector)
+        except Exception:
+            continue
+        if len(rows) > 1:
+            break
+
+    posts = []
+    for row in rows:
+        link = _select_one(row, TITLE_SELECTORS)
+        if link is not None and link.name != "a":
+            link = link.find("a", href=True) or link.find_parent("a", href=True)
+        if link is None or not link.get("href"):
+            link = _select_one(row, ARTICLE_LINK_SELECTORS)
+        if link is None or not link.get("href"):
+            continue
+
+        title = _text(link)
+        if not title:
+            continue
+
+        posts.append(Post(
+            title=title,
+            url=urljoin(base_url, link["href"]),
+            author=_text(_select_one(row, AUTHOR_SELECTORS)),
+            date=_text(_select_one(row, DATE_SELECTORS)),
+            views=_digits(_select_one(row, VIEW_SELECTORS)),
+            likes=_digits(_select_one(row, LIKE_SELECTORS)),
+            content=''
+        ))
+
+    return posts
+
+
+# ---------------------------------------------------------------------------
+# detail page
+# ---------------------------------------------------------------------------
+
+def parse_article_title(source) -> str:
+    """게시글 제목 추출"""
+    return _text(_select_one(_soup(source), ARTICLE_TITLE_SELECTORS))
+
+
+def parse_post_content(source) -> str:
+    """게시글 본문 추출 (extract_post_content 와 동일 규칙)"""
+    soup = _soup(source)
+    content_parts: List[str] = []
+
+    for selector in CONTENT_SELECTORS:
+        try:
+            elements = soup.select(selector)
+        except Exception:
+            continue
+
+        for element in elements:
+            text = _text(element)
+            if text and len(text) > 10:
+                if not any(text[:50] in part for part in content_parts):
+                    content_parts.append(text)
+
+        # 충분한 내용을 찾았으면 중단
+        if content_parts and sum(len(part) for part in content_parts) > 100:
+            break
+
+    full_content = "\n\n".join(content_parts)
+    if len(full_content) > MAX_CONTENT_LENGTH:
+        full_content = full_content[:MAX_CONTENT_LENGTH] + "... (내용 생략)"
+
+    return clean_text(full_content) if full_content else ""
+
+
+def parse_comments(source, start_id: int = 1,
+                   max_comments: Optional[int] = None) -> List[Comment]:
+    """댓글/대댓글 추출 (extract_comments 와 동일 형식)
+
+    대댓글의 parent_id 는 바로 앞의 일반 댓글 comment_id 로 채운다.
+    """
+    soup = _soup(source)
+    min_length = getattr(Config, 'COMMENT_CONTENT_MIN_LENGTH', 5)
+    if max_comments is None:
+        max_comments = getattr(Config, 'MAX_COMMENTS_PER_POST', 50)
+
+    elements = []
+    for selector in COMMENT_SELECTORS:
+        try:
+            elements = soup.select(selector)
+        except Exception:
+            continue
+        if elements:
+            break
+
+    comments: List[Comment] = []
+    last_parent_id = None
+    for element in elements:
+        if len(comments) >= max_comments:
+            break
+
+        content = _text(_select_one(element, COMMENT_CONTENT_SELECTORS))
+        if len(content) < min_length:
+            continue
+
+        class_name = " ".join(element.get("class") or []).lower()
+        is_reply = any(keyword in class_name for keyword in REPLY_CLASS_KEYWORDS)
+        comment_id = start_id + len(comments)
+
+        comments.append(Comment(
+            comment_id=comment_id,
+            author=_text(_select_one(element, COMMENT_AUTHOR_SELECTORS)) or '익명',
+            content=content,
+            date=_text(_select_one(element, COMMENT_DATE_SELECTORS)) or '날짜 없음',
+            like_count=_digits(_select_one(element, COMMENT_LIKE_SELECTORS)),
+            depth=2 if is_reply else 1,
+            parent_id=last_parent_id if is_reply else None
+        ))
+        if not is_reply:
+            last_parent_id = comment_id
+
+    return comments
+
+
+def parse_images(source) -> List[Image]:
+    """게시글 이미지 추출 (extract_images 와 동일 형식)
+
+    렌더링 크기는 알 수 없으므로 width/height 속성이 있을 때만 size 를 채운다.
+    """
+    images = []
+    for img in _soup(source).find_all("img"):
+        src = img.get("src") or img.get("data-src") or ""
+        if not src or "http" not in src:
+            continue
+
+        width, height = img.get("width"), img.get("height")
+        images.append(Image(
+            url=src,
+            alt=clean_text(img.get("alt") or ""),
+            size=f"{width}x{height}" if width and height else ""
+        ))
+        if len(images) >= MAX_IMAGES:
+            break
+
+    return images
+
+
+def parse_attachments(source, base_url: str = BASE_URL) -> List[Attachment]:
+    """첨부파일 추출 (extract_attachments 와 동일 형식)"""
+    soup = _soup(source)
+    attachments = []
+    for selector in ATTACHMENT_SELECTORS:
+        try:
+            elements = soup.select(selector)
+        except Exception:
+            continue
+        for element in elements:
+            href = element.get("href")
+            text = _text(element)
+            if href and text:
+                attachments.append(Attachment(name=text, url=urljoin(base_url, href)))
+
+    return attachments[:MAX_ATTACHMENTS]
+
+
+def parse_article_page(source, start_comment_id: int = 1) -> Dict[str, Any]:
+    """게시글 상세 페이지 전체 파싱 (get_post_content 반환 형식 + title)"""
+    soup = _soup(source)
+
+    comments = []
+    if getattr(Config, 'EXTRACT_COMMENTS', True) and getattr(Config, 'INCLUDE_COMMENTS', True):
+        comments = parse_comments(soup, start_id=start_comment_id)
+
+    return {
+        "title": parse_article_title(soup),
+        "content": parse_post_content(soup),
+        "comments": comments,
+        "images": parse_images(soup) if getattr(Config, 'EXTRACT_IMAGES', False) else [],
+        "attachments": parse_attachments(soup) if getattr(Config, 'EXTRACT_ATTACHMENTS', False) else []
+    }
+
+
+# ---------------------------------------------------------------------------
+# saved pages (parallel)
+# ---------------------------------------------------------------------------
+
+def _parse_file(args):
+    path, kind = args
+    try:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            html = f.read()
+        if kind == "list":
+            return {"path": path, "posts": parse_post_list(html)}
+        result = parse_article_page(html)
+        result["path"] = path
+        return result
+    except Exception as e:
+        return {"path": path, "error": str(e)}
+
+
+def parse_saved_pages(paths: Iterable[str], kind: str = "article",
+                      workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """저장된 HTML 파일들을 여러 프로세스에서 병렬 파싱
+
+    Parameters
+    ----------
+    paths : Iterable[str]
+        HTML 파일 경로 목록.
+    kind : str
+        "article" (상세 페이지) 또는 "list" (목록 페이지).
+    workers : int | None
+        프로세스 수. None 이면 CPU 수.
+
+    Returns
+    -------
+    list[dict]
+        입력 순서와 같은 순서의 파싱 결과. 실패한 파일은 error 키를 가진다.
+    """
+    jobs = [(path, kind) for path in paths]
+    if not jobs:
+        return []
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(jobs) == 1:
+        return [_parse_file(job) for job in jobs]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_parse_file, jobs, chunksize=8))
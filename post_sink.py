@@ -0,0 +1,181 @@
+"""post_sink.py
+게시글 스트리밍 출력 (JSONL / CSV).
+
+상세 수집이 끝난 게시글을 곧바로 파일에 한 줄씩 쓰고, 크롤러 쪽에는 중복 확인과
+진행 표시에 필요한 가벼운 참조(post_ref)만 돌려준다. 본문(최대 10,000자)과
+댓글 전체를 크롤링이 끝날 때까지 메모리에 쌓아 두지 않으므로 수집량과 관계없이
+메모리 사용량이 일정하다.
+
+Usage
+-----
+from post_sink import PostSink, read_posts
+
+sink = PostSink("output/cafe_posts.jsonl")
+ref = sink.write(post)          # 파일에 기록하고 참조 반환
+sink.close()
+posts = list(read_posts(sink.path))
+"""
+# Disclaimer: use at your own risk. The authors take no responsibility for misuse.
+
+from __future__ import annotations
+
+import csv
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterator, Optional
+
+from config import Config
+from checkpoint import post_key
+from records import to_plain
+
+__all__ = ["SINK_FORMATS", "PostRef", "post_ref", "default_sink_path", "PostSink", "read_posts"]
+
+SINK_FORMATS = ("jsonl", "csv")
+
+#: 참조에 남기는 필드 (중복 확인·진행 표시·체크포인트용 – url 이 없으면 title|author 가 키)
+REF_FIELDS = ("url", "title", "author", "keyword", "board_name", "enhanced", "collection_time")
+
+CSV_FIELDS = [
+    "title", "author", "date", "views", "likes", "url", "keyword", "board_name",
+    "collection_time", "enhanced", "content", "full_content",
+]
+#: CSV 에서는 JSON 문자열로 저장하는 중첩 필드
+NESTED_FIELDS = ("comments", "images", "attachments", "matched_keywords")
+
+
+class PostRef(dict):
+    """PostSink.write 가 돌려준 참조 – 다시 write 에 넘겨도 파일에 쓰지 않는다"""
+
+
+def post_ref(post: Dict[str, Any]) -> PostRef:
+    """게시글의 가벼운 참조 (본문·댓글·이미지 제외)"""
+    if isinstance(post, PostRef):
+        return post
+    return PostRef((field, post[field]) for field in REF_FIELDS if field in post)
+
+
+def default_sink_path(fmt: str) -> str:
+    """출력 폴더의 cafe_posts_<timestamp>.<fmt>"""
+    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    return os.path.join(getattr(Config, 'OUTPUT_DIR', 'output'), f"cafe_posts_{timestamp}.{fmt}")
+
+
+def _format_of(path: str) -> str:
+    return "csv" if path.lower().endswith(".csv") else "jsonl"
+
+
+class PostSink:
+    """게시글을 수집 즉시 JSONL/CSV 파일에 추가하는 출력기 (스레드 안전)"""
+
+    def __init__(self, path: Optional[str] = None, fmt: Optional[str] = None, resume: bool = False):
+        """
+        Parameters
+        ----------
+        path : str | None
+            출력 파일 경로. None 이면 default_sink_path(fmt).
+        fmt : str | None
+            "jsonl" 또는 "csv". None 이면 path 확장자, 그것도 없으면 jsonl.
+        resume : bool
+            True 면 기존 파일에 이어 쓰고, 이미 기록된 게시글은 다시 쓰지 않는다.
+        """
+        fmt = fmt or (_format_of(path) if path else "jsonl")
+        if fmt not in SINK_FORMATS:
+            raise ValueError(f"지원하지 않는 출력 형식: {fmt} ({', '.join(SINK_FORMATS)})")
+
+        self.fmt = fmt
+        self.path = path or default_sink_path(fmt)
+        self.stats = {"posts": 0, "with_content": 0, "with_comments": 0, "comments": 0, "images": 0}
+        self._keys = set()
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        exists = os.path.exists(self.path)
+        if resume and exists:
+            for post in read_posts(self.path):
+                self._count(post)
+        elif exists:
+            os.remove(self.path)
+
+        if self.fmt == "csv":
+            new_file = not (resume and exists)
+            # utf-8-sig: 엑셀에서 바로 열어도 한글이 깨지지 않도록 BOM 추가
+            self._file = open(self.path, "a", encoding="utf-8-sig" if new_file else "utf-8", newline="")
+            self._writer = csv.DictWriter(self._file, fieldnames=CSV_FIELDS + list(NESTED_FIELDS),
+                                          extrasaction="ignore")
+            if new_file:
+                self._writer.writeheader()
+        else:
+            self._file = open(self.path, "a", encoding="utf-8")
+            self._writer = None
+            # 중단으로 잘린 마지막 줄 뒤에 이어 쓰지 않도록 줄바꿈부터 추가
+            if resume and exists and os.path.getsize(self.path):
+                with open(self.path, "rb") as f:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b"\n":
+                        self._file.write("\n")
+
+    def _count(self, post: Dict[str, Any]):
+        self._keys.add(post_key(post))
+        self.stats["posts"] += 1
+        self.stats["with_content"] += bool(post.get("full_content"))
+        self.stats["with_comments"] += bool(post.get("comments"))
+        self.stats["comments"] += len(post.get("comments") or [])
+        self.stats["images"] += len(post.get("images") or [])
+
+    def write(self, post: Dict[str, Any]) -> PostRef:
+        """게시글을 파일에 기록하고 참조 반환
+
+        이미 기록한 게시글(checkpoint.post_key – URL 형식이 달라도 같은 글이면 같은
+        키) 과 이미 참조인 값은 건너뛴다.
+        """
+        if isinstance(post, PostRef):
+            return post
+        with self._lock:
+            if post_key(post) in self._keys or self._file.closed:
+                return post_ref(post)
+            self._count(post)
+
+            if self._writer is not None:
+                row = dict(post)
+                for field in NESTED_FIELDS:
+                    row[field] = json.dumps(post.get(field) or [], ensure_ascii=False, default=to_plain)
+                self._writer.writerow(row)
+            else:
+                self._file.write(json.dumps(post, ensure_ascii=False, default=to_plain) + "\n")
+            self._file.flush()
+        return post_ref(post)
+
+    def __len__(self) -> int:
+        return self.stats["posts"]
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+
+def read_posts(path: str) -> Iterator[Dict[str, Any]]:
+    """PostSink 가 쓴 파일을 게시글 dict 로 한 건씩 읽기 (잘린 마지막 줄은 무시)"""
+    if _format_of(path) == "csv":
+        with open(path, encoding="utf-8-sig", newline="") as f:
+            for row in csv.DictReader(f):
+                for field in NESTED_FIELDS:
+                    try:
+                        row[field] = json.loads(row.get(field) or "[]")
+                    except ValueError:
+                        row[field] = []
+                row["enhanced"] = row.get("enhanced") == "True"
+                yield row
+        return
+
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
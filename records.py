@@ -0,0 +1,225 @@
+"""records.py
+게시글·댓글·이미지·첨부파일·게시판 레코드.
+
+크롤러는 게시글·댓글마다 문자열 키 7~15개짜리 dict 를 만들고, 상세 수집 중에
+키를 더 붙인다. 게시글 1000개 × 댓글 50개면 같은 키를 되풀이해 들고 있는 dict 가
+수만 개 생긴다. 이 모듈의 레코드는 __slots__ 로 필드를 고정해 인스턴스마다
+dict 를 두지 않고, 조회수·좋아요처럼 숫자인 필드는 넣을 때 한 번만 정수로 바꾼다.
+
+dict 호환
+---------
+Record 는 MutableMapping 이라 기존 코드가 그대로 동작한다.
+
+- post['title'], post.get('views', 0), post['enhanced'] = True, 'full_content' in post
+- dict(post), {**post}, pd.DataFrame(posts), CafeDataExporter
+- 값을 넣지 않은 필드는 dict 에 키가 없는 것과 같다 (post.get('comments', []))
+- 정해지지 않은 키(search_metadata 등)는 필요할 때만 만드는 extra dict 에 둔다
+- JSON 으로 쓸 때는 json.dumps(..., default=to_plain)
+
+Usage
+-----
+from records import Post, Comment
+
+post = Post(title="가스공사 채용", url=url, views="1.2만")
+post.views                  # 12000
+post['full_content'] = text
+"""
+# Disclaimer: use at your own risk. The authors take no responsibility for misuse.
+
+from __future__ import annotations
+
+from collections.abc import Mapping, MutableMapping
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Tuple
+
+from utils import parse_count
+
+__all__ = ["Record", "Post", "Comment", "Image", "Attachment", "Board", "to_plain"]
+
+
+def _number(value: Any) -> int:
+    """'1,234' / '1.2만' / 12 → 정수 (알 수 없으면 0)"""
+    parsed = parse_count(value)
+    return parsed if parsed is not None else 0
+
+
+class Record(MutableMapping):
+    """__slots__ 필드 + dict 인터페이스
+
+    하위 클래스는 __slots__ 에 필드를 적고, 그 중 정수로 저장할 필드를
+    NUMERIC 에 둔다.
+    """
+
+    __slots__ = ("_extra",)
+
+    FIELDS: Tuple[str, ...] = ()
+    NUMERIC: FrozenSet[str] = frozenset()
+    _FIELD_SET: FrozenSet[str] = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.FIELDS = tuple(cls.__dict__.get("__slots__", ()))
+        cls._FIELD_SET = frozenset(cls.FIELDS)
+
+    def __init__(self, data: Optional[Mapping] = None, **values: Any):
+        self._extra: Optional[Dict[str, Any]] = None
+        if data:
+            self.update(data)
+        if values:
+            self.update(values)
+
+    @classmethod
+    def of(cls, data: Optional[Mapping]):
+        """dict → 레코드 (이미 같은 레코드면 그대로)"""
+        return data if isinstance(data, cls) else cls(data)
+
+    # ------------------------------------------------------------------
+    # mapping
+    # ------------------------------------------------------------------
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._FIELD_SET:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any):
+        if key in self._FIELD_SET:
+            setattr(self, key, _number(value) if key in self.NUMERIC else value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __delitem__(self, key: str):
+        if key in self._FIELD_SET:
+            try:
+                delattr(self, key)
+                return
+            except AttributeError:
+                raise KeyError(key) from None
+        if self._extra is None or key not in self._extra:
+            raise KeyError(key)
+        del self._extra[key]
+
+    def __contains__(self, key: object) -> bool:
+        if key in self._FIELD_SET:
+            return hasattr(self, key)
+        return self._extra is not None and key in self._extra
+
+    def __iter__(self) -> Iterator[str]:
+        for name in self.FIELDS:
+            if hasattr(self, name):
+                yield name
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        return sum(1 for name in self.FIELDS if hasattr(self, name)) + len(self._extra or ())
+
+    def get(self, key: str, default: Any = None) -> Any:
+        # MutableMapping.get 은 KeyError 를 거치므로 자주 쓰는 경로만 직접 처리
+        if key in self._FIELD_SET:
+            return getattr(self, key, default)
+        if self._extra is not None:
+            return self._extra.get(key, default)
+        return default
+
+    def copy(self):
+        return type(self)(self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """순수 dict (하위 레코드 목록까지 변환)"""
+        return {key: to_plain(value) for key, value in self.items()}
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self.items())!r})"
+
+
+def to_plain(value: Any) -> Any:
+    """레코드 → dict, 레코드 목록 → dict 목록 (json.dumps 의 default 로도 사용)"""
+    if isinstance(value, Record):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [to_plain(item) for item in value]
+    if isinstance(value, (str, int, float, bool, dict)) or value is None:
+        return value
+    return str(value)
+
+
+class Comment(Record):
+    """댓글/대댓글 – depth 2 는 parent_id 댓글의 답글"""
+
+    __slots__ = ("comment_id", "author", "content", "date", "like_count", "depth", "parent_id", "index")
+    NUMERIC = frozenset({"like_count", "depth"})
+
+    comment_id: Any
+    author: str
+    content: str
+    date: str
+    like_count: int
+    depth: int
+    parent_id: Any
+    index: int
+
+
+class Image(Record):
+    __slots__ = ("url", "alt", "size")
+
+    url: str
+    alt: str
+    size: str
+
+
+class Attachment(Record):
+    __slots__ = ("name", "url")
+
+    name: str
+    url: str
+
+
+class Post(Record):
+    """게시글 – 목록에서 만든 뒤 상세 수집에서 full_content/comments 등을 채운다"""
+
+    __slots__ = (
+        "title", "url", "author", "date", "views", "likes", "content",
+        "keyword", "matched_keywords", "board_name", "collection_time", "enhanced",
+        "full_content", "comments", "images", "attachments", "comment_count",
+    )
+    NUMERIC = frozenset({"views", "likes", "comment_count"})
+
+    title: str
+    url: str
+    author: str
+    date: str
+    views: int
+    likes: int
+    content: str
+    keyword: str
+    matched_keywords: List[str]
+    board_name: str
+    collection_time: str
+    enhanced: bool
+    full_content: str
+    comments: List[Comment]
+    images: List[Image]
+    attachments: List[Attachment]
+    comment_count: int
+
+
+class Board(Record):
+    __slots__ = ("name", "url", "board_type", "menu_id", "is_hidden", "description",
+                 "post_count", "comment_count")
+    NUMERIC = frozenset({"post_count", "comment_count"})
+
+    name: str
+    url: str
+    board_type: str
+    menu_id: str
+    is_hidden: bool
+    description: str
+    post_count: int
+    comment_count: int
@@ -0,0 +1,179 @@
+"""session_bridge.py
+Selenium 로그인 세션을 HTTP 수집 경로로 넘겨주는 브리지.
+
+로그인은 브라우저(login_naver / AuthManager)로만 가능하지만, 로그인 이후의
+대량 페이지 요청까지 브라우저로 처리할 필요는 없다. 이 모듈은
+  • WebDriver 의 네이버 쿠키(NID_AUT, NID_SES …)를 requests 세션으로 복사하고
+  • 응답의 최종 URL·리다이렉트 기록으로 세션 만료(로그인 페이지 이동)를 감지하여
+  • 만료 시에만 브라우저로 돌아가 쿠키를 갱신하고, 그래도 안 되면 재로그인한다.
+aiohttp 경로에는 cookie_dict() 로 같은 쿠키를 넘길 수 있다.
+
+Usage
+-----
+from session_bridge import SessionBridge
+
+bridge = SessionBridge(driver)
+if bridge.sync():
+    html = bridge.get_text(article_url)
+"""
+# Disclaimer: use at your own risk. The authors take no responsibility for misuse.
+
+from __future__ import annotations
+
+import threading
+from typing import Callable, Dict, Optional
+
+import requests
+
+from crawler import DEFAULT_TIMEOUT, create_session, response_text
+
+__all__ = ["SessionExpiredError", "SessionBridge"]
+
+# 로그인 상태를 나타내는 핵심 쿠키
+AUTH_COOKIES = ("NID_AUT", "NID_SES")
+COOKIE_DOMAIN = "naver.com"
+REFRESH_URL = "https://cafe.naver.com/"
+LOGIN_HOST = "nid.naver.com"
+
+
+class SessionExpiredError(Exception):
+    """브라우저 갱신 후에도 HTTP 세션이 로그인 상태가 아닐 때"""
+
+
+class SessionBridge:
+    """WebDriver 쿠키를 requests 세션에 동기화하고 만료 시 갱신한다."""
+
+    def __init__(self, driver, session: Optional[requests.Session] = None,
+                 refresh_callback: Optional[Callable[[], bool]] = None):
+        """
+        Parameters
+        ----------
+        driver : WebDriver
+            로그인된 브라우저.
+        session : requests.Session | None
+            쿠키를 받을 세션. None 이면 crawler.create_session() 으로 생성.
+        refresh_callback : callable | None
+            브라우저 쿠키만으로 복구되지 않을 때 호출할 재로그인 함수.
+        """
+        self.driver = driver
+        self.session = session or create_session()
+        self.refresh_callback = refresh_callback
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._logged_in = False
+
+    # ------------------------------------------------------------------
+    # cookies
+    # ------------------------------------------------------------------
+
+    def export_cookies(self) -> list:
+        """브라우저의 네이버 도메인 쿠키 목록"""
+        try:
+            cookies = self.driver.get_cookies() if self.driver else []
+        except Exception as e:
+            print(f"    ⚠️ 브라우저 쿠키 읽기 실패: {e}")
+            return []
+        return [c for c in cookies if c.get("domain", "").lstrip(".").endswith(COOKIE_DOMAIN)]
+
+    def clear_cookies(self):
+        """HTTP 세션의 네이버 도메인 쿠키 삭제 (만료된 로그인 쿠키가 남지 않도록)"""
+        stale = [c for c in self.session.cookies if c.domain.lstrip(".").endswith(COOKIE_DOMAIN)]
+        for cookie in stale:
+            self.session.cookies.clear(cookie.domain, cookie.path, cookie.name)
+
+    def sync(self) -> bool:
+        """브라우저 쿠키로 HTTP 세션 쿠키를 교체하고 브라우저의 로그인 여부를 반환"""
+        cookies = self.export_cookies()
+        self.clear_cookies()
+        for cookie in cookies:
+            self.session.cookies.set(
+                cookie["name"], cookie["value"],
+                domain=cookie.get("domain", "." + COOKIE_DOMAIN),
+                path=cookie.get("path", "/"),
+                secure=cookie.get("secure", False),
+            )
+        self._generation += 1
+
+        names = {cookie["name"] for cookie in cookies}
+        self._logged_in = all(name in names for name in AUTH_COOKIES)
+        print(f"    🍪 세션 쿠키 동기화: {len(cookies)}개 ({'로그인' if self._logged_in else '비로그인'})")
+        return self._logged_in
+
+    def is_logged_in(self) -> bool:
+        """마지막 동기화 때 브라우저에 로그인 쿠키가 있었는지"""
+        return self._logged_in
+
+    def cookie_dict(self) -> Dict[str, str]:
+        """aiohttp 등에 넘길 name → value 쿠키 dict"""
+        return {cookie.name: cookie.value for cookie in self.session.cookies}
+
+    # ------------------------------------------------------------------
+    # expiry / refresh
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def is_session_expired(response: requests.Response) -> bool:
+        """응답이 로그인 만료(권한 없음, 로그인 페이지로 리다이렉트)인지 판단
+
+        본문 문구는 보지 않는다 – 공개 페이지에도 로그인 링크가 들어 있다.
+        """
+        if response.status_code in (401, 403):
+            return True
+        if LOGIN_HOST in response.url:
+            return True
+        return any(LOGIN_HOST in r.headers.get("Location", "") for r in response.history)
+
+    def refresh(self, relogin: bool = False) -> bool:
+        """브라우저에서 세션을 새로 고친 뒤 쿠키를 다시 동기화
+
+        relogin=True 이면 브라우저 쿠키만으로는 복구되지 않은 것이므로
+        refresh_callback(재로그인) 을 바로 호출한다.
+        """
+        generation = self._generation
+        with self._lock:
+            # 다른 스레드가 이미 갱신했으면 그대로 사용
+            if self._generation != generation and self.is_logged_in():
+                return True
+
+            if not relogin:
+                print("    🔄 HTTP 세션 만료 감지 - 브라우저에서 세션 갱신")
+                try:
+                    self.driver.get(REFRESH_URL)
+                except Exception as e:
+                    print(f"    ⚠️ 브라우저 세션 갱신 실패: {e}")
+                if self.sync():
+                    return True
+
+            if self.refresh_callback and self.refresh_callback():
+                return self.sync()
+            return False
+
+    # ------------------------------------------------------------------
+    # fetch
+    # ------------------------------------------------------------------
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """세션 만료를 감지하면 한 번 갱신 후 재시도하는 GET"""
+        kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+        response = self.session.get(url, **kwargs)
+        if not self.is_session_expired(response):
+            return response
+
+        if not self.refresh():
+            raise SessionExpiredError(f"세션 갱신 실패: {url}")
+
+        response = self.session.get(url, **kwargs)
+        if self.is_session_expired(response) and self.refresh_callback:
+            # 브라우저 쿠키도 서버에서 만료됨 – 재로그인 후 한 번 더
+            if not self.refresh(relogin=True):
+                raise SessionExpiredError(f"재로그인 실패: {url}")
+            response = self.session.get(url, **kwargs)
+        if self.is_session_expired(response):
+            raise SessionExpiredError(f"갱신 후에도 로그인 필요: {url}")
+        return response
+
+    def get_text(self, url: str, **kwargs) -> str:
+        """get() 후 상태 코드 확인 및 본문 디코딩"""
+        response = self.get(url, **kwargs)
+        response.raise_for_status()
+        return response_text(response)
@@ -0,0 +1,450 @@
+"""storage.py
+수집 결과 SQLite 저장소.
+
+enhance_posts_with_details 가 만든 게시글 dict (댓글·이미지·첨부파일 포함) 와
+explore_all_boards_individually 의 게시판 결과를 하나의 SQLite 파일에 upsert 한다.
+
+- WAL 모드 + 배치 트랜잭션 (BATCH_SIZE 건마다 커밋)
+- 게시글은 post_key(utils.article_key – club_id/article_id 를 합친 정수) 기준으로
+  중복 없이 갱신된다. URL 형태가 달라도 같은 글이면 같은 행이다. 목록에서만 얻은
+  가벼운 게시글이 나중에 들어와도 이미 저장된 본문·댓글을 지우지 않는다.
+- FTS5 색인(posts_fts) 에 제목, 본문, 댓글 내용을 함께 넣어 전문 검색을 지원한다.
+- query() 는 검색어·작성자·게시판·키워드·기간 조건을 조합한 로컬 검색으로,
+  라이브 사이트를 다시 크롤링하지 않고 이전에 수집한 게시글에서 답한다.
+
+Usage
+-----
+from storage import CafeStore
+
+with CafeStore() as store:
+    store.save_posts(posts)
+    hits = store.search("채용 공고")
+"""
+# Disclaimer: use at your own risk. The authors take no responsibility for misuse.
+
+from __future__ import annotations
+
+import os
+import re
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+from config import Config
+from utils import article_key, parse_count, unpack_article_key, url_key
+
+__all__ = ["default_db_path", "CafeStore"]
+
+DB_FILENAME = "cafe_posts.db"
+BATCH_SIZE = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS boards (
+    board_key      TEXT PRIMARY KEY,
+    name           TEXT,
+    url            TEXT,
+    board_type     TEXT,
+    post_count     INTEGER,
+    comment_count  INTEGER,
+    activity_score REAL,
+    last_activity  TEXT,
+    updated_at     TEXT
+);
+CREATE TABLE IF NOT EXISTS posts (
+    post_key         INTEGER PRIMARY KEY,
+    club_id          INTEGER,
+    article_id       INTEGER,
+    title            TEXT,
+    author           TEXT,
+    date             TEXT,
+    views            INTEGER,
+    likes            INTEGER,
+    keyword          TEXT,
+    board_name       TEXT,
+    url              TEXT,
+    collection_time  TEXT,
+    enhanced         INTEGER NOT NULL DEFAULT 0,
+    full_content     TEXT,
+    comment_count    INTEGER NOT NULL DEFAULT 0,
+    image_count      INTEGER NOT NULL DEFAULT 0,
+    attachment_count INTEGER NOT NULL DEFAULT 0,
+    updated_at       TEXT,
+    date_iso         TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_posts_author ON posts(author);
+CREATE INDEX IF NOT EXISTS idx_posts_board ON posts(board_name);
+CREATE INDEX IF NOT EXISTS idx_posts_keyword ON posts(keyword);
+CREATE INDEX IF NOT EXISTS idx_posts_date_iso ON posts(date_iso);
+CREATE TABLE IF NOT EXISTS comments (
+    post_key   INTEGER NOT NULL,
+    seq        INTEGER NOT NULL,
+    comment_id INTEGER,
+    parent_id  INTEGER,
+    depth      INTEGER,
+    author     TEXT,
+    content    TEXT,
+    date       TEXT,
+    like_count INTEGER,
+    PRIMARY KEY (post_key, seq)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS images (
+    post_key INTEGER NOT NULL,
+    seq      INTEGER NOT NULL,
+    url      TEXT,
+    alt      TEXT,
+    size     TEXT,
+    PRIMARY KEY (post_key, seq)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS attachments (
+    post_key INTEGER NOT NULL,
+    seq      INTEGER NOT NULL,
+    name     TEXT,
+    url      TEXT,
+    PRIMARY KEY (post_key, seq)
+) WITHOUT ROWID;
+"""
+
+# 목록에서만 얻은 게시글이 다시 들어와도 저장된 본문/댓글 수는 유지
+_UPSERT_POST = """
+INSERT INTO posts (post_key, club_id, article_id, title, author, date, views, likes, keyword, board_name,
+                   url, collection_time, enhanced, full_content, comment_count, image_count,
+                   attachment_count, updated_at, date_iso)
+VALUES (:post_key, :club_id, :article_id, :title, :author, :date, :views, :likes, :keyword, :board_name,
+        :url, :collection_time, :enhanced, :full_content, :comment_count, :image_count,
+        :attachment_count, :updated_at, :date_iso)
+ON CONFLICT(post_key) DO UPDATE SET
+    title            = COALESCE(NULLIF(excluded.title, ''), posts.title),
+    author           = COALESCE(NULLIF(excluded.author, ''), posts.author),
+    date             = COALESCE(NULLIF(excluded.date, ''), posts.date),
+    date_iso         = COALESCE(excluded.date_iso, posts.date_iso),
+    views            = COALESCE(excluded.views, posts.views),
+    likes            = COALESCE(excluded.likes, posts.likes),
+    keyword          = COALESCE(excluded.keyword, posts.keyword),
+    board_name       = COALESCE(excluded.board_name, posts.board_name),
+    url              = COALESCE(NULLIF(excluded.url, ''), posts.url),
+    collection_time  = COALESCE(excluded.collection_time, posts.collection_time),
+    enhanced         = MAX(excluded.enhanced, posts.enhanced),
+    full_content     = COALESCE(excluded.full_content, posts.full_content),
+    comment_count    = MAX(excluded.comment_count, posts.comment_count),
+    image_count      = MAX(excluded.image_count, posts.image_count),
+    attachment_count = MAX(excluded.attachment_count, posts.attachment_count),
+    updated_at       = excluded.updated_at
+"""
+
+
+_DATE_RE = re.compile(r'(?:(\d{4})[.\-/]\s*)?(\d{1,2})[.\-/]\s*(\d{1,2})')
+_TIME_ONLY_RE = re.compile(r'^\d{1,2}:\d{2}')
+
+
+def iso_date(date: Any, collection_time: Any = None) -> Optional[str]:
+    """목록/본문 날짜 표기를 YYYY-MM-DD 로 (기간 검색용)
+
+    '2024.01.15.' / '2024-01-15 10:00' / '01.15.' (연도 없음) / '14:32' (오늘 글) 을
+    처리하며, 연도나 날짜가 빠진 경우 수집 시각을 기준으로 한다.
+    """
+    collected = str(collection_time or '')[:10] or datetime.now().strftime('%Y-%m-%d')
+    text = str(date or '').strip()
+    if not text:
+        return None
+    if _TIME_ONLY_RE.match(text):
+        return collected
+    match = _DATE_RE.search(text)
+    if not match:
+        return None
+    year = match.group(1) or collected[:4]
+    return f"{year}-{int(match.group(2)):02d}-{int(match.group(3)):02d}"
+
+
+def _post_key(post: Dict[str, Any]) -> int:
+    """게시글 정수 키 – URL 이 없는 게시글은 제목/작성자 해시"""
+    url = post.get('url')
+    if url:
+        return article_key(url)
+    return url_key(f"{post.get('title', '')}|{post.get('author', '')}")
+
+
+def default_db_path() -> str:
+    """Config.DB_PATH 또는 출력 폴더의 cafe_posts.db"""
+    path = getattr(Config, 'DB_PATH', None)
+    if path:
+        return path
+    return os.path.join(getattr(Config, 'OUTPUT_DIR', 'output'), DB_FILENAME)
+
+
+def _fts_tokenizer(conn: sqlite3.Connection) -> str:
+    """trigram (한국어 부분 문자열 검색) 을 지원하면 사용, 아니면 unicode61"""
+    preferred = getattr(Config, 'FTS_TOKENIZER', 'trigram')
+    try:
+        conn.execute(f"CREATE VIRTUAL TABLE temp._probe USING fts5(x, tokenize='{preferred}')")
+        conn.execute("DROP TABLE temp._probe")
+        return preferred
+    except sqlite3.OperationalError:
+        return "unicode61"
+
+
+class CafeStore:
+    """게시글·댓글·이미지·첨부파일·게시판 SQLite 저장소 (스레드 안전)"""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or default_db_path()
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_SCHEMA)
+
+        # 처음 만들 때 정한 토크나이저는 이후에도 그대로 사용
+        exists = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'posts_fts'"
+        ).fetchone()
+        if not exists:
+            self.conn.execute(
+                "CREATE VIRTUAL TABLE posts_fts USING fts5("
+                f"title, full_content, comments, tokenize='{_fts_tokenizer(self.conn)}')"
+            )
+        self.conn.commit()
+        self.tokenizer = "trigram" if "trigram" in self.conn.execute(
+            "SELECT sql FROM sqlite_master WHERE name = 'posts_fts'"
+        ).fetchone()[0] else "unicode61"
+
+    # ------------------------------------------------------------------
+    # lifecycle
+    # ------------------------------------------------------------------
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+    def __enter__(self) -> "CafeStore":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    # ------------------------------------------------------------------
+    # writes
+    # ------------------------------------------------------------------
+
+    def save_posts(self, posts: Iterable[Dict[str, Any]], batch_size: int = BATCH_SIZE) -> int:
+        """게시글 upsert (batch_size 건마다 한 트랜잭션) – 저장한 게시글 수 반환"""
+        saved = 0
+        batch: List[Dict[str, Any]] = []
+        for post in posts:
+            batch.append(post)
+            if len(batch) >= batch_size:
+                saved += self._save_batch(batch)
+                batch = []
+        if batch:
+            saved += self._save_batch(batch)
+        return saved
+
+    def _save_batch(self, posts: List[Dict[str, Any]]) -> int:
+        now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        with self._lock, self.conn:
+            for post in posts:
+                self._upsert_post(post, now)
+        return len(posts)
+
+    @staticmethod
+    def _post_params(key: int, post: Dict[str, Any], now: str) -> Dict[str, Any]:
+        """_UPSERT_POST 파라미터"""
+        ref = unpack_article_key(key)
+        comments = post.get('comments') or []
+        images = post.get('images') or []
+        attachments = post.get('attachments') or []
+        return {
+            'post_key': key,
+            'club_id': ref[0] if ref else None,
+            'article_id': ref[1] if ref else None,
+            'title': post.get('title', ''),
+            'author': post.get('author', ''),
+            'date': post.get('date', ''),
+            'views': parse_count(post.get('views')),
+            'likes': parse_count(post.get('likes')),
+            'keyword': post.get('keyword'),
+            'board_name': post.get('board_name'),
+            'url': post.get('url', ''),
+            'collection_time': post.get('collection_time'),
+            'enhanced': 1 if post.get('enhanced') else 0,
+            'full_content': post.get('full_content') or None,
+            'comment_count': len(comments),
+            'image_count': len(images),
+            'attachment_count': len(attachments),
+            'updated_at': now,
+            'date_iso': iso_date(post.get('date'), post.get('collection_time')),
+        }
+
+    def _upsert_post(self, post: Dict[str, Any], now: str):
+        key = _post_key(post)
+        comments = post.get('comments') or []
+        images = post.get('images') or []
+        attachments = post.get('attachments') or []
+        self.conn.execute(_UPSERT_POST, self._post_params(key, post, now))
+
+        # 상세 수집된 게시글만 하위 목록을 교체 (목록용 게시글은 기존 댓글 유지)
+        if post.get('enhanced') or comments or images or attachments:
+            self._replace_children(key, comments, images, attachments)
+
+        row = self.conn.execute(
+            "SELECT title, full_content FROM posts WHERE post_key = ?", (key,)
+        ).fetchone()
+        comment_text = "\n".join(
+            r['content'] or '' for r in self.conn.execute(
+                "SELECT content FROM comments WHERE post_key = ? ORDER BY seq", (key,))
+        )
+        # post_key 가 INTEGER PRIMARY KEY 라 posts.rowid == post_key
+        self.conn.execute("DELETE FROM posts_fts WHERE rowid = ?", (key,))
+        self.conn.execute(
+            "INSERT INTO posts_fts (rowid, title, full_content, comments) VALUES (?, ?, ?, ?)",
+            (key, row['title'] or '', row['full_content'] or '', comment_text),
+        )
+
+    def _replace_children(self, key: int, comments, images, attachments):
+        for table in ("comments", "images", "attachments"):
+            self.conn.execute(f"DELETE FROM {table} WHERE post_key = ?", (key,))
+
+        self.conn.executemany(
+            "INSERT INTO comments (post_key, seq, comment_id, parent_id, depth, author, content, date, like_count) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [(key, seq, parse_count(c.get('comment_id', c.get('index'))), parse_count(c.get('parent_id')),
+              parse_count(c.get('depth')), c.get('author', ''), c.get('content', ''), c.get('date', ''),
+              parse_count(c.get('like_count')))
+             for seq, c in enumerate(comments, 1)],
+        )
+        self.conn.executemany(
+            "INSERT INTO images (post_key, seq, url, alt, size) VALUES (?, ?, ?, ?, ?)",
+            [(key, seq, i.get('url', ''), i.get('alt', ''), i.get('size', ''))
+             for seq, i in enumerate(images, 1)],
+        )
+        self.conn.executemany(
+            "INSERT INTO attachments (post_key, seq, name, url) VALUES (?, ?, ?, ?)",
+            [(key, seq, a.get('name', ''), a.get('url', ''))
+             for seq, a in enumerate(attachments, 1)],
+        )
+
+    def save_boards(self, board_results: Dict[str, Any]) -> int:
+        """explore_all_boards_individually 결과 저장 (게시판 + 게시판별 게시글)"""
+        boards = (board_results or {}).get('board_results', {})
+        now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        with self._lock, self.conn:
+            for name, info in boards.items():
+                board = info.get('board_info') or {}
+                self.conn.execute(
+                    "INSERT INTO boards (board_key, name, url, board_type, post_count, comment_count, "
+                    "activity_score, last_activity, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT(board_key) DO UPDATE SET name = excluded.name, url = excluded.url, "
+                    "board_type = excluded.board_type, post_count = excluded.post_count, "
+                    "comment_count = excluded.comment_count, activity_score = excluded.activity_score, "
+                    "last_activity = excluded.last_activity, updated_at = excluded.updated_at",
+                    (board.get('url') or name, name, board.get('url', ''), board.get('board_type', ''),
+                     info.get('post_count', 0), info.get('comment_count', 0), info.get('activity_score'),
+                     str(info.get('last_activity') or ''), now),
+                )
+
+        for name, info in boards.items():
+            self.save_posts(dict(post, board_name=post.get('board_name') or name)
+                            for post in info.get('posts') or [])
+        return len(boards)
+
+    # ------------------------------------------------------------------
+    # reads
+    # ------------------------------------------------------------------
+
+    def search(self, query: str, limit: int = 50) -> List[Dict[str, Any]]:
+        """FTS5 전문 검색 (bm25 순위, 제목 가중치 높음)"""
+        return self.query(text=query, limit=limit)
+
+    def query(self, text: Optional[str] = None, author: Optional[str] = None,
+              board: Optional[str] = None, keyword: Optional[str] = None,
+              since: Optional[str] = None, until: Optional[str] = None,
+              limit: int = 50) -> List[Dict[str, Any]]:
+        """로컬 검색 – 조건은 모두 AND, 검색어가 있으면 bm25 순 (없으면 최신순)
+
+        검색어는 공백으로 나눈 단어가 제목·본문·댓글 중 어디에든 모두 들어 있어야
+        한다. trigram 색인은 3글자 이상만 찾을 수 있으므로 2글자 이하 단어
+        ('채용', '면접') 는 LIKE 조건으로 확인한다.
+        since/until 은 YYYY-MM-DD (포함).
+        """
+        terms = (text or "").split()
+        if self.tokenizer == "trigram":
+            indexed = [term for term in terms if len(term) >= 3]
+        else:
+            indexed = terms
+        short = [term for term in terms if term not in indexed]
+
+        where: List[str] = []
+        params: List[Any] = []
+        if indexed:
+            source = "posts_fts JOIN posts p ON p.post_key = posts_fts.rowid"
+            rank = "bm25(posts_fts, 5.0, 1.0, 0.5)"
+            where.append("posts_fts MATCH ?")
+            params.append(" ".join('"{}"'.format(term.replace('"', '""')) for term in indexed))
+            order = "rank"
+        else:
+            source = "posts p"
+            rank = "NULL"
+            order = "p.date_iso DESC, p.article_id DESC"
+            if short:
+                # 색인 밖의 짧은 검색어만 있으면 제목에 포함된 게시글을 먼저
+                order = "(p.title LIKE ?) DESC, " + order
+
+        for term in short:
+            where.append("(p.title LIKE ? OR p.full_content LIKE ? OR EXISTS "
+                         "(SELECT 1 FROM comments c WHERE c.post_key = p.post_key AND c.content LIKE ?))")
+            params.extend([f"%{term}%"] * 3)
+        if author:
+            where.append("p.author = ?")
+            params.append(author)
+        if board:
+            where.append("p.board_name LIKE ?")
+            params.append(f"%{board}%")
+        if keyword:
+            where.append("p.keyword = ?")
+            params.append(keyword)
+        if since:
+            where.append("p.date_iso >= ?")
+            params.append(since)
+        if until:
+            where.append("p.date_iso <= ?")
+            params.append(until)
+
+        sql = (f"SELECT p.*, {rank} AS rank FROM {source}"
+               + (" WHERE " + " AND ".join(where) if where else "")
+               + f" ORDER BY {order} LIMIT ?")
+        with self._lock:
+            order_params = [f"%{short[0]}%"] if short and not indexed else []
+            rows = self.conn.execute(sql, params + order_params + [limit]).fetchall()
+        return [dict(row) for row in rows]
+
+    def load_posts(self, post_keys: Iterable[int]) -> Iterable[Dict[str, Any]]:
+        """저장된 게시글을 크롤러와 같은 dict 형태(comments/images/attachments 포함)로 복원"""
+        for key in post_keys:
+            with self._lock:
+                row = self.conn.execute("SELECT * FROM posts WHERE post_key = ?", (key,)).fetchone()
+                if row is None:
+                    continue
+                post = dict(row)
+                post['enhanced'] = bool(post['enhanced'])
+                post['full_content'] = post['full_content'] or ''
+                post['comments'] = [dict(r) for r in self.conn.execute(
+                    "SELECT comment_id, parent_id, depth, author, content, date, like_count, seq AS 'index' "
+                    "FROM comments WHERE post_key = ? ORDER BY seq", (key,))]
+                post['images'] = [dict(r) for r in self.conn.execute(
+                    "SELECT url, alt, size FROM images WHERE post_key = ? ORDER BY seq", (key,))]
+                post['attachments'] = [dict(r) for r in self.conn.execute(
+                    "SELECT name, url FROM attachments WHERE post_key = ? ORDER BY seq", (key,))]
+            yield post
+
+    def counts(self) -> Dict[str, int]:
+        """테이블별 행 수"""
+        with self._lock:
+            return {
+                table: self.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                for table in ("posts", "comments", "images", "attachments", "boards")
+            }
@@ -0,0 +1,139 @@
+"""comment_api 를 로컬 대체 서버(http.server) 에 붙여 확인
+
+페이지 중단 조건(빈 페이지, 마지막 페이지 반복, hasNext=False), 답글 트리의
+depth / parent_id, CommentQuota 의 번호 재발급과 한도 자르기.
+"""
+
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+try:
+    from comment_api import CommentFetcher, CommentQuota, build_comment_tree
+except ImportError:  # config.py 가 없는 환경
+    CommentFetcher = None
+
+
+def _item(api_id, content, ref_id=None, **extra):
+    item = {"id": api_id, "refId": ref_id if ref_id is not None else api_id,
+            "content": content, "writer": {"nick": f"user{api_id}"}, "updateDate": 0}
+    item.update(extra)
+    return item
+
+
+# article_id → page → 응답 (없는 페이지는 빈 목록)
+PAGES = {
+    # hasNext=False 에서 멈춤 (3페이지는 요청하지 않음)
+    1: {1: {"result": {"comments": {"items": [_item(1, "첫 번째 댓글")], "hasNext": True}}},
+        2: {"result": {"comments": {"items": [_item(2, "두 번째 댓글")], "hasNext": False}}},
+        3: {"result": {"comments": {"items": [_item(3, "요청되면 안 됨")]}}}},
+    # 빈 페이지에서 멈춤
+    2: {1: {"result": {"comments": {"items": [_item(1, "하나뿐인 댓글")]}}}},
+    # 마지막 페이지를 반복하는 응답에서 멈춤
+    3: {1: {"result": {"comments": {"items": [_item(1, "반복되는 댓글")]}}},
+        2: {"result": {"comments": {"items": [_item(1, "반복되는 댓글")]}}}},
+}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    requested = []
+
+    def do_GET(self):
+        # /articles/<article_id>/pages/<page>
+        parts = self.path.split("?")[0].strip("/").split("/")
+        article_id, page = int(parts[1]), int(parts[3])
+        self.requested.append((article_id, page))
+        payload = PAGES.get(article_id, {}).get(page, {"result": {"comments": {"items": []}}})
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@unittest.skipIf(CommentFetcher is None, "config.py 가 없어 comment_api 를 불러올 수 없음")
+class CommentFetcherTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        host, port = cls.server.server_address
+        cls.fetcher = CommentFetcher(
+            requests.Session(),
+            url_template=f"http://{host}:{port}/articles/{{article_id}}/pages/{{page}}?club={{club_id}}",
+            max_pages=10,
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        _Handler.requested = []
+
+    def _contents(self, article_id):
+        return [c.content for c in self.fetcher.iter_comments(1, article_id, min_length=0)]
+
+    def test_stops_at_has_next_false(self):
+        self.assertEqual(self._contents(1), ["첫 번째 댓글", "두 번째 댓글"])
+        self.assertEqual(_Handler.requested, [(1, 1), (1, 2)])
+
+    def test_stops_at_empty_page(self):
+        self.assertEqual(self._contents(2), ["하나뿐인 댓글"])
+        self.assertEqual(_Handler.requested, [(2, 1), (2, 2)])
+
+    def test_stops_at_repeated_last_page(self):
+        self.assertEqual(self._contents(3), ["반복되는 댓글"])
+        self.assertEqual(_Handler.requested, [(3, 1), (3, 2)])
+
+    def test_limit_skips_remaining_pages(self):
+        comments = list(self.fetcher.iter_comments(1, 1, limit=1, min_length=0))
+        self.assertEqual(len(comments), 1)
+        self.assertEqual(_Handler.requested, [(1, 1)])
+
+
+@unittest.skipIf(CommentFetcher is None, "config.py 가 없어 comment_api 를 불러올 수 없음")
+class CommentTreeTest(unittest.TestCase):
+
+    def test_depth_and_parent_id(self):
+        items = [
+            _item(10, "최상위 댓글"),
+            _item(11, "첫 답글", ref_id=10),
+            _item(12, "삭제된 댓글", isDeleted=True),
+            _item(13, "삭제된 댓글의 답글", ref_id=12),
+            _item(14, "짧음"),
+            _item(15, "두 번째 최상위 댓글"),
+        ]
+        tree = [(c.comment_id, c.depth, c.parent_id)
+                for c in build_comment_tree(items, start_id=1, min_length=3)]
+        self.assertEqual(tree, [(1, 1, None), (2, 2, 1), (3, 2, None), (4, 1, None)])
+
+
+@unittest.skipIf(CommentFetcher is None, "config.py 가 없어 comment_api 를 불러올 수 없음")
+class CommentQuotaTest(unittest.TestCase):
+
+    def _post_comments(self):
+        items = [_item(1, "댓글 하나"), _item(2, "댓글 하나의 답글", ref_id=1), _item(3, "댓글 둘")]
+        return list(build_comment_tree(items, start_id=1))
+
+    def test_renumbers_across_posts_and_truncates(self):
+        quota = CommentQuota(limit=5)
+        first = quota.take(self._post_comments())
+        second = quota.take(self._post_comments())
+        self.assertEqual([(c.comment_id, c.parent_id) for c in first], [(1, None), (2, 1), (3, None)])
+        self.assertEqual([(c.comment_id, c.parent_id) for c in second], [(4, None), (5, 4)])
+        self.assertEqual(quota.remaining(), 0)
+        self.assertEqual(quota.take(self._post_comments()), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
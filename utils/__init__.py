@@ -12,9 +12,18 @@ import time
 import re
 from selenium.webdriver.support.wait import WebDriverWait
 
+from .article_url import (
+    article_ref, article_key, pack_article_key, unpack_article_key, url_key,
+    register_cafe_id, cafe_id_of, cafe_name_of
+)
+
 def safe_wait(driver, seconds):
-    """안전한 대기"""
-    time.sleep(seconds)
+    """안전한 대기 - 페이지가 준비되면 즉시 반환 (seconds 는 최대 대기 시간)"""
+    if driver is None:
+        time.sleep(seconds)
+        return
+    from .waits import wait_for_page_ready
+    wait_for_page_ready(driver, timeout=seconds)
 
 def clean_text(text):
     """텍스트 정리"""
@@ -34,11 +43,40 @@ def print_progress(current, total, message=""):
         print(f"진행률: {current}/{total} ({percentage:.1f}%) {message}")
 
 def extract_post_number(url):
-    """URL에서 게시글 번호 추출"""
-    if not url:
+    """URL에서 게시글 번호 추출 (지원하는 URL 형태는 article_url 참고)"""
+    ref = article_ref(url)
+    return str(ref[1]) if ref else None
+
+_COUNT_RE = re.compile(r'(\d+(?:\.\d+)?)\s*(만)?')
+
+def parse_count(value):
+    """'1,234' / '1.2만' 같은 조회수·좋아요 표기를 정수로 (알 수 없으면 None)"""
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float)):
+        return int(value)
+    match = _COUNT_RE.search(str(value).replace(",", ""))
+    if not match:
         return None
-    match = re.search(r'articleid=(\d+)', url)
-    return match.group(1) if match else None
+    return int(float(match.group(1)) * (10000 if match.group(2) else 1))
+
+# 목록/검색 URL 의 페이지 파라미터 (iframe_url 안에 인코딩된 경우 포함)
+_PAGE_PARAM_RE = re.compile(
+    r'((?:[?&]|%3[Ff]|%26)(?:search\.page\.currentpage|search\.page|page)(?:=|%3[Dd]))(\d+)'
+)
+
+def get_page_param(url):
+    """URL에서 페이지 번호 추출 (없으면 None)"""
+    match = _PAGE_PARAM_RE.search(url or "")
+    return int(match.group(2)) if match else None
+
+def set_page_param(url, page):
+    """URL의 페이지 파라미터를 page 로 교체 (없으면 search.page 추가)"""
+    if _PAGE_PARAM_RE.search(url):
+        return _PAGE_PARAM_RE.sub(lambda m: m.group(1) + str(page), url, count=1)
+    if "iframe_url=" in url:
+        return f"{url}%26search.page%3D{page}"
+    return f"{url}{'&' if '?' in url else '?'}search.page={page}"
 
 __version__ = "1.0.0"
 __all__ = [
@@ -49,11 +87,29 @@ __all__ = [
     "TITLE_SELECTORS",
     "AUTHOR_SELECTORS",
     "DATE_SELECTORS",
+    "VIEW_SELECTORS",
+    "LIKE_SELECTORS",
+    "ARTICLE_LINK_SELECTORS",
+    "ARTICLE_TITLE_SELECTORS",
+    "CONTENT_SELECTORS",
+    "COMMENT_SELECTORS",
+    "ATTACHMENT_SELECTORS",
     "SEARCH_SCOPES",
     "SORT_METHODS",
     "safe_wait",
     "clean_text",
     "get_timestamp",
     "print_progress",
-    "extract_post_number"
+    "extract_post_number",
+    "article_ref",
+    "article_key",
+    "pack_article_key",
+    "unpack_article_key",
+    "url_key",
+    "register_cafe_id",
+    "cafe_id_of",
+    "cafe_name_of",
+    "parse_count",
+    "get_page_param",
+    "set_page_param"
 ] 
\ No newline at end of file
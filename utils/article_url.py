@@ -0,0 +1,170 @@
+"""
+게시글 URL 정규화
+여러 형태로 들어오는 게시글 URL 을 (club_id, article_id) 정수 쌍과, 이를 하나로
+합친 64비트 정수 키(article_key) 로 바꿉니다. 중복 제거, SQLite 저장소, 수집
+프런티어가 모두 같은 키를 사용합니다.
+
+지원하는 URL 형태
+    https://cafe.naver.com/ArticleRead.nhn?clubid=123&articleid=456
+    https://cafe.naver.com/카페명?iframe_url=/ArticleRead.nhn%3Fclubid%3D123%26articleid%3D456
+    https://cafe.naver.com/ca-fe/cafes/123/articles/456   (m.cafe / f-e 경로 포함)
+    https://cafe.naver.com/카페명/456
+
+카페명 → clubid 는 LRU(CAFE_ID_CACHE_SIZE) 에 보관합니다. 카페명과 clubid 가
+함께 들어 있는 URL 을 만나면 자동으로 기록하고, register_cafe_id 로 직접 등록할
+수도 있습니다. clubid 를 아직 모르는 카페명은 카페명 해시로 만든 임시 club_id
+(PSEUDO_CLUB_BASE 이상) 를 사용합니다.
+"""
+# Disclaimer: use at your own risk. The authors take no responsibility for misuse.
+
+import hashlib
+import re
+import threading
+import zlib
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Optional, Tuple
+from urllib.parse import unquote
+
+CAFE_ID_CACHE_SIZE = 256
+URL_CACHE_SIZE = 8192
+
+#: 임시 club_id 범위 시작 (실제 clubid 는 이보다 작다고 가정)
+PSEUDO_CLUB_BASE = 1 << 30
+_ARTICLE_BITS = 32
+_ARTICLE_MASK = (1 << _ARTICLE_BITS) - 1
+
+_ARTICLEID_RE = re.compile(r'articleid=(\d+)', re.IGNORECASE)
+_CLUBID_RE = re.compile(r'clubid=(\d+)', re.IGNORECASE)
+_CAFES_ARTICLES_RE = re.compile(r'/cafes/(\d+)/articles/(\d+)')
+_CAFE_NAME_RE = re.compile(r'cafe\.naver\.com/([A-Za-z0-9_-]+)(?=[/?#]|$)')
+_CAFE_NAME_ARTICLE_RE = re.compile(r'cafe\.naver\.com/([A-Za-z0-9_-]+)/(\d+)(?=[/?#]|$)')
+
+#: 카페명이 아닌 경로 첫 부분
+_RESERVED_NAMES = frozenset({"ca-fe", "f-e", "cafes", "cafe-home", "section"})
+
+_cafe_ids: "OrderedDict[str, int]" = OrderedDict()
+_cafe_ids_lock = threading.Lock()
+
+
+def register_cafe_id(name: Optional[str], club_id: Any):
+    """카페명 → clubid 기록 (가장 오래 쓰지 않은 항목부터 제거)"""
+    if not name or club_id is None or not str(club_id).isdigit():
+        return
+    name = name.lower()
+    with _cafe_ids_lock:
+        _cafe_ids[name] = int(club_id)
+        _cafe_ids.move_to_end(name)
+        while len(_cafe_ids) > CAFE_ID_CACHE_SIZE:
+            _cafe_ids.popitem(last=False)
+
+
+def cafe_id_of(name: Optional[str]) -> Optional[int]:
+    """기록된 clubid (모르면 None)"""
+    if not name:
+        return None
+    name = name.lower()
+    with _cafe_ids_lock:
+        club_id = _cafe_ids.get(name)
+        if club_id is not None:
+            _cafe_ids.move_to_end(name)
+        return club_id
+
+
+def cafe_name_of(value: Optional[str]) -> Optional[str]:
+    """카페 URL 또는 카페명 → 카페명"""
+    if not value:
+        return None
+    match = _CAFE_NAME_RE.search(value)
+    name = match.group(1) if match else value.strip("/")
+    if name.lower() in _RESERVED_NAMES or not re.fullmatch(r'[A-Za-z0-9_-]+', name):
+        return None
+    return name
+
+
+def _pseudo_club_id(name: str) -> int:
+    return PSEUDO_CLUB_BASE | (zlib.crc32(name.lower().encode("utf-8")) & (PSEUDO_CLUB_BASE - 1))
+
+
+@lru_cache(maxsize=URL_CACHE_SIZE)
+def _parse(url: str) -> Optional[Tuple[Optional[int], int, Optional[str]]]:
+    """(clubid 또는 None, articleid, 카페명 또는 None) – URL 형태만 보고 판단"""
+    text = url
+    if "%" in text:
+        # iframe_url 안에 한 번(또는 두 번) 인코딩된 ArticleRead 주소
+        text = unquote(unquote(text))
+
+    name = cafe_name_of(text) if "cafe.naver.com/" in text else None
+
+    match = _CAFES_ARTICLES_RE.search(text)
+    if match:
+        return int(match.group(1)), int(match.group(2)), name
+
+    match = _ARTICLEID_RE.search(text)
+    if match:
+        club = _CLUBID_RE.search(text)
+        return (int(club.group(1)) if club else None), int(match.group(1)), name
+
+    match = _CAFE_NAME_ARTICLE_RE.search(text)
+    if match and match.group(1).lower() not in _RESERVED_NAMES:
+        return None, int(match.group(2)), match.group(1)
+    return None
+
+
+def _club_from(club_id: Any) -> Optional[int]:
+    """호출자가 넘긴 기본 카페 (clubid 숫자, 카페 URL 또는 카페명)"""
+    if club_id is None or club_id == "":
+        return None
+    if isinstance(club_id, int) or str(club_id).isdigit():
+        return int(club_id)
+    name = cafe_name_of(str(club_id))
+    if not name:
+        return None
+    return cafe_id_of(name) or _pseudo_club_id(name)
+
+
+def article_ref(url: Optional[str], club_id: Any = None) -> Optional[Tuple[int, int]]:
+    """게시글 URL → (club_id, article_id) – 게시글 번호가 없는 URL 이면 None
+
+    URL 에 clubid 가 없으면 카페명(LRU) → club_id 인자 순서로 카페를 정하고,
+    그래도 모르면 club_id 는 0 이다.
+    """
+    if not url:
+        return None
+    parsed = _parse(url)
+    if parsed is None:
+        return None
+    club, article, name = parsed
+    if club is not None:
+        if name:
+            register_cafe_id(name, club)
+        return club, article
+    if name:
+        return cafe_id_of(name) or _pseudo_club_id(name), article
+    return _club_from(club_id) or 0, article
+
+
+def pack_article_key(club_id: int, article_id: int) -> int:
+    """(club_id, article_id) → 64비트 정수 키 (SQLite INTEGER 범위)"""
+    return (club_id << _ARTICLE_BITS) | article_id
+
+
+def unpack_article_key(key: int) -> Optional[Tuple[int, int]]:
+    """article_key → (club_id, article_id) – URL 해시 키(음수) 면 None"""
+    if key is None or key < 0:
+        return None
+    return key >> _ARTICLE_BITS, key & _ARTICLE_MASK
+
+
+def url_key(text: Optional[str]) -> int:
+    """게시글 번호가 없는 URL 의 키 (항상 음수라 게시글 키와 겹치지 않음)"""
+    digest = hashlib.sha1((text or "").encode("utf-8")).digest()
+    return -(int.from_bytes(digest[:7], "big") + 1)
+
+
+def article_key(url: Optional[str], club_id: Any = None) -> int:
+    """게시글을 식별하는 정수 키 – 같은 글이면 URL 형태와 관계없이 같은 값"""
+    ref = article_ref(url, club_id)
+    if ref is None or ref[1] > _ARTICLE_MASK:
+        return url_key(url)
+    return pack_article_key(*ref)
@@ -53,6 +53,105 @@ DATE_SELECTORS = [
     "[class*='time']"
 ]
 
+VIEW_SELECTORS = [
+    ".td_view",
+    ".view",
+    ".views",
+    ".hit",
+    "td[class*='view']"
+]
+
+LIKE_SELECTORS = [
+    ".td_good",
+    ".like",
+    ".likes",
+    ".recommend",
+    "td[class*='like']"
+]
+
+# 제목 선택자로 링크를 찾지 못했을 때 사용하는 게시글 링크 패턴
+ARTICLE_LINK_SELECTORS = [
+    "a[href*='ArticleRead']",
+    "a[href*='articleid']",
+    "a[href*='/articles/']",
+    "a[href*='read']"
+]
+
+# 게시글 상세 페이지 선택자 (라이브/오프라인 추출 공용)
+ARTICLE_TITLE_SELECTORS = [
+    ".title_text",
+    ".ArticleTitle h3",
+    "div.tit-box span.b",
+    ".article_title"
+]
+
+CONTENT_SELECTORS = [
+    ".se-main-container .se-component .se-text",
+    ".se-main-container",
+    ".ContentRenderer",
+    ".article_container .article_viewer",
+    ".post-content",
+    "#tbody",
+    ".se-component",
+    ".article-content",
+    ".post_content",
+    ".content",
+    "div[class*='content']",
+    "div[class*='article']",
+    "td.article",
+    "td[class*='content']"
+]
+
+COMMENT_SELECTORS = [
+    ".comment_list li.CommentItem",
+    ".comment_area .comment_box",
+    ".cmt_area .comment_item",
+    ".reply_area .reply_item",
+    "li[class*='comment']",
+    ".CommentItem",
+    ".comment-item",
+    ".comment_list li",
+    ".comment-list .item",
+    "[class*='CommentBox']",
+    ".comment_wrap .comment",
+    ".board_comment .comment"
+]
+
+COMMENT_AUTHOR_SELECTORS = [
+    ".comment_nickname", ".comment_nick a", ".comment_author", ".nick",
+    ".user_nick", ".author", ".name", ".nickname", ".user-name",
+    ".author-name", "[class*='nick']", "[class*='author']", ".writer",
+    ".userid", "strong"
+]
+
+COMMENT_CONTENT_SELECTORS = [
+    ".text_comment", ".comment_text", ".comment_content", ".text",
+    ".comment-text", ".comment-content", ".content", "[class*='content']",
+    "[class*='text']", ".message", ".body", "p", "span"
+]
+
+COMMENT_DATE_SELECTORS = [
+    ".comment_info_date", ".comment_date", ".date", ".time", ".created_time",
+    ".comment-date", ".comment-time", ".timestamp", "[class*='date']",
+    "[class*='time']", ".regdate", ".writedate"
+]
+
+COMMENT_LIKE_SELECTORS = [
+    ".like_count", ".like-count", ".thumbup", "[class*='like']",
+    "[class*='thumb']", ".recommend", ".good"
+]
+
+# 대댓글 판별용 class 키워드
+REPLY_CLASS_KEYWORDS = ["--reply", "re-comment", "reply", "sub-comment", "child"]
+
+ATTACHMENT_SELECTORS = [
+    "a[href*='attachment']",
+    "a[href*='download']",
+    "a[href*='file']",
+    ".attachment a",
+    ".file a"
+]
+
 # 검색 관련 상수
 SEARCH_SCOPES = {
     'all': 1,      # 전체
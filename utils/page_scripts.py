@@ -0,0 +1,249 @@
+"""
+페이지 주입 스크립트 모음
+WebDriver 왕복 횟수를 줄이기 위해 한 번의 execute_script 호출로
+페이지 데이터를 통째로 추출하는 JavaScript 와 그 Python 래퍼를 정의합니다.
+"""
+# Disclaimer: use at your own risk. The authors take no responsibility for misuse.
+
+import json
+from typing import Dict, List, Optional
+
+from .constants import (
+    POST_SELECTORS, TITLE_SELECTORS, AUTHOR_SELECTORS, DATE_SELECTORS,
+    VIEW_SELECTORS, LIKE_SELECTORS, ARTICLE_LINK_SELECTORS,
+    COMMENT_SELECTORS, COMMENT_AUTHOR_SELECTORS, COMMENT_CONTENT_SELECTORS,
+    COMMENT_DATE_SELECTORS, COMMENT_LIKE_SELECTORS, REPLY_CLASS_KEYWORDS
+)
+
+# arguments[0] 으로 선택자 목록을 받아 게시글 행 전체를 JSON 문자열로 반환한다.
+# 선택자 순서는 Python 쪽 폴백 경로와 동일하게 앞에서부터 시도한다.
+BOARD_ROWS_SCRIPT = r"""
+var sel = arguments[0];
+function clean(t) { return (t || '').replace(/\s+/g, ' ').trim(); }
+function first(row, selectors) {
+    for (var i = 0; i < selectors.length; i++) {
+        var el;
+        try { el = row.querySelector(selectors[i]); } catch (e) { continue; }
+        if (el && clean(el.textContent)) { return el; }
+    }
+    return null;
+}
+function link(row) {
+    var el = first(row, sel.title);
+    if (el && el.tagName !== 'A') {
+        el = el.querySelector('a[href]') || el.closest('a[href]');
+    }
+    if (!el || !el.href) { el = first(row, sel.link); }
+    return (el && el.href) ? el : null;
+}
+function digits(el) {
+    if (!el) { return ''; }
+    var t = clean(el.textContent).replace(/[^0-9]/g, '');
+    return t;
+}
+var rows = [];
+for (var i = 0; i < sel.rows.length; i++) {
+    var found;
+    try { found = document.querySelectorAll(sel.rows[i]); } catch (e) { continue; }
+    if (found.length > 1) { rows = found; break; }
+}
+var out = [];
+for (var r = 0; r < rows.length; r++) {
+    var row = rows[r];
+    var a = link(row);
+    if (!a) { continue; }
+    var title = clean(a.textContent);
+    if (!title) { continue; }
+    var author = first(row, sel.author);
+    var date = first(row, sel.date);
+    out.push({
+        title: title,
+        url: a.href,
+        author: author ? clean(author.textContent) : '',
+        date: date ? clean(date.textContent) : '',
+        views: digits(first(row, sel.views)),
+        likes: digits(first(row, sel.likes))
+    });
+}
+return JSON.stringify(out);
+"""
+
+
+def _board_selectors() -> Dict[str, List[str]]:
+    """스크립트에 전달할 선택자 묶음"""
+    return {
+        "rows": POST_SELECTORS,
+        "title": TITLE_SELECTORS,
+        "link": ARTICLE_LINK_SELECTORS,
+        "author": AUTHOR_SELECTORS,
+        "date": DATE_SELECTORS,
+        "views": VIEW_SELECTORS,
+        "likes": LIKE_SELECTORS,
+    }
+
+
+def extract_board_rows(driver) -> Optional[List[Dict[str, str]]]:
+    """현재 프레임의 게시판 목록을 한 번의 스크립트 호출로 추출
+
+    Returns
+    -------
+    list[dict] | None
+        {title, url, author, date, views, likes} 목록.
+        스크립트 실행 자체가 실패하면 None 을 반환하여 호출자가
+        요소별 추출 경로로 폴백할 수 있게 한다.
+    """
+    if not driver:
+        return None
+    try:
+        payload = driver.execute_script(BOARD_ROWS_SCRIPT, _board_selectors())
+        rows = json.loads(payload) if payload else []
+        return rows if isinstance(rows, list) else None
+    except Exception:
+        return None
+
+
+# 페이지 번호 영역(pager)을 한 번에 읽는다: 현재 페이지, 보이는 최대 번호, 다음 묶음 존재 여부
+PAGER_SCRIPT = r"""
+var links = document.querySelectorAll(
+    '.prev-next a, .prev-next strong, .pagination a, .pagination strong, ' +
+    '.paging a, .paging strong, .page-link, .pgR a, .pgL a'
+);
+var max = 0, current = 0, more = false;
+for (var i = 0; i < links.length; i++) {
+    var el = links[i];
+    var text = (el.textContent || '').replace(/\s+/g, '');
+    var cls = (el.className || '') + ' ' + ((el.parentNode && el.parentNode.className) || '');
+    if (/^\d+$/.test(text)) {
+        var n = parseInt(text, 10);
+        if (n > max) { max = n; }
+        if (el.tagName === 'STRONG' || /\b(on|active|current|selected)\b/.test(cls) ||
+                el.getAttribute('aria-current')) {
+            current = n;
+        }
+    } else if (text.indexOf('다음') >= 0 || /\b(pgR|next)\b/.test(cls)) {
+        more = true;
+    }
+}
+return max ? JSON.stringify({current: current, max: max, more: more}) : null;
+"""
+
+
+def read_pager(driver) -> Optional[Dict[str, int]]:
+    """페이지 번호 영역 판독
+
+    Returns
+    -------
+    dict | None
+        {current, max, more}. 번호 영역을 찾지 못하면 None.
+    """
+    if not driver:
+        return None
+    try:
+        payload = driver.execute_script(PAGER_SCRIPT)
+        return json.loads(payload) if payload else None
+    except Exception:
+        return None
+
+
+# 댓글·답글 전체를 한 번에 읽는다. 답글은 (1) 다른 댓글 요소 안에 들어 있으면 그
+# 댓글의 자식, (2) class 에 답글 키워드가 있으면 바로 앞 일반 댓글의 자식으로 본다.
+# 필드 선택자는 해당 댓글 요소에 직접 속한 요소만 사용한다 (안쪽 답글의 내용 제외).
+# minLength 로 건너뛴 댓글도 index 에 -1 로 남겨, 그 안의 답글은 다른 댓글에 붙이지
+# 않고 parent -1 + DOM 중첩 깊이로 내보낸다.
+COMMENT_TREE_SCRIPT = r"""
+var sel = arguments[0];
+function clean(t) { return (t || '').replace(/\s+/g, ' ').trim(); }
+var items = [], itemSelector = null;
+for (var i = 0; i < sel.items.length; i++) {
+    var found;
+    try { found = document.querySelectorAll(sel.items[i]); } catch (e) { continue; }
+    if (found.length) { items = found; itemSelector = sel.items[i]; break; }
+}
+function owner(el) { return el.closest(itemSelector); }
+function first(item, selectors) {
+    for (var i = 0; i < selectors.length; i++) {
+        var els;
+        try { els = item.querySelectorAll(selectors[i]); } catch (e) { continue; }
+        for (var j = 0; j < els.length; j++) {
+            if (owner(els[j]) === item && clean(els[j].textContent)) { return els[j]; }
+        }
+    }
+    return null;
+}
+function text(item, selectors) {
+    var el = first(item, selectors);
+    return el ? clean(el.textContent) : '';
+}
+function isReply(item) {
+    var cls = (typeof item.className === 'string' ? item.className : '').toLowerCase();
+    for (var i = 0; i < sel.reply.length; i++) {
+        if (cls.indexOf(sel.reply[i]) >= 0) { return true; }
+    }
+    return false;
+}
+var out = [], index = new Map(), depthOf = new Map(), lastTop = -1;
+for (var k = 0; k < items.length && out.length < sel.limit; k++) {
+    var item = items[k];
+    var outer = item.parentElement ? owner(item.parentElement) : null;
+    var parent = -1, depth = 1;
+    if (outer && index.has(outer)) {
+        parent = index.get(outer);
+        depth = depthOf.get(outer) + 1;
+    } else if (isReply(item)) {
+        parent = lastTop;
+        depth = 2;
+    }
+    depthOf.set(item, depth);
+    var content = text(item, sel.content);
+    if (content.length < sel.minLength) {
+        index.set(item, -1);
+        if (depth === 1) { lastTop = -1; }
+        continue;
+    }
+    index.set(item, out.length);
+    if (depth === 1) { lastTop = out.length; }
+    out.push({
+        author: text(item, sel.author),
+        content: content,
+        date: text(item, sel.date),
+        like_count: text(item, sel.like).replace(/[^0-9]/g, ''),
+        depth: depth,
+        parent: parent
+    });
+}
+return JSON.stringify(out);
+"""
+
+
+def _comment_selectors(limit: int, min_length: int) -> Dict[str, object]:
+    return {
+        "items": COMMENT_SELECTORS,
+        "author": COMMENT_AUTHOR_SELECTORS,
+        "content": COMMENT_CONTENT_SELECTORS,
+        "date": COMMENT_DATE_SELECTORS,
+        "like": COMMENT_LIKE_SELECTORS,
+        "reply": REPLY_CLASS_KEYWORDS,
+        "limit": limit,
+        "minLength": min_length,
+    }
+
+
+def extract_comment_tree(driver, limit: int = 50, min_length: int = 0) -> Optional[List[Dict[str, object]]]:
+    """현재 프레임의 댓글·답글을 한 번의 스크립트 호출로 추출
+
+    Returns
+    -------
+    list[dict] | None
+        화면 순서의 {author, content, date, like_count, depth, parent} 목록.
+        parent 는 부모 댓글의 목록 위치 (없거나 min_length 로 건너뛴 댓글이면
+        -1 – 이때도 depth 는 DOM 중첩 깊이). 스크립트 실행 자체가
+        실패하면 None 을 반환하여 호출자가 요소별 추출로 폴백할 수 있게 한다.
+    """
+    if not driver:
+        return None
+    try:
+        payload = driver.execute_script(COMMENT_TREE_SCRIPT, _comment_selectors(limit, min_length))
+        rows = json.loads(payload) if payload else []
+        return rows if isinstance(rows, list) else None
+    except Exception:
+        return None
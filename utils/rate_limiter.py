@@ -0,0 +1,156 @@
+"""
+요청 속도 제한기
+호스트별 토큰 버킷(버스트 허용) + AIMD(가산 증가 / 곱셈 감소) 백오프.
+
+브라우저 이동(driver.get, 클릭)과 HTTP 요청(requests, aiohttp)이 모두 같은
+RateLimiter 를 거치므로, 드라이버 풀이나 스레드 수와 관계없이 호스트당 전체
+요청량이 하나의 예산으로 관리된다.
+
+- 성공 + 빠른 응답  → 속도를 조금씩 올림 (최대 RATE_LIMIT_PER_HOST)
+- 오류/429/5xx 또는 느린 응답 → 속도를 절반으로 낮춤 (최소 RATE_LIMIT_MIN)
+"""
+# Disclaimer: use at your own risk. The authors take no responsibility for misuse.
+
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+DEFAULT_HOST = "cafe.naver.com"
+
+
+class TokenBucket:
+    """단일 호스트용 토큰 버킷 (AIMD 로 초당 토큰 수 조정)"""
+
+    def __init__(self, rate: float, burst: float, min_rate: float,
+                 increase: float, slow_seconds: float):
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = max(burst, 1.0)
+        self.min_rate = min(min_rate, rate)
+        self.increase = increase
+        self.slow_seconds = slow_seconds
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """토큰 하나를 예약하고 그 토큰을 쓸 수 있을 때까지 남은 시간(초) 반환"""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1.0
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def on_success(self, elapsed: Optional[float] = None):
+        """성공 응답 – 느리면 감속, 빠르면 가산 증가"""
+        with self._lock:
+            if elapsed is not None and elapsed > self.slow_seconds:
+                self.rate = max(self.min_rate, self.rate * 0.5)
+            else:
+                self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def on_error(self):
+        """오류/제한 응답 – 곱셈 감소"""
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate * 0.5)
+
+
+class RateLimiter:
+    """호스트별 TokenBucket 묶음"""
+
+    def __init__(self, rate: float = 1.0, burst: float = 3, min_rate: float = 0.2,
+                 increase: float = 0.05, slow_seconds: float = 3.0):
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.increase = increase
+        self.slow_seconds = slow_seconds
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def host_of(url: Optional[str]) -> str:
+        host = urlsplit(url).netloc if url else ""
+        return host or DEFAULT_HOST
+
+    def bucket(self, url: Optional[str]) -> TokenBucket:
+        host = self.host_of(url)
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(self.rate, self.burst, self.min_rate,
+                                     self.increase, self.slow_seconds)
+                self._buckets[host] = bucket
+            return bucket
+
+    def reserve(self, url: Optional[str] = None) -> float:
+        """대기 없이 예약만 하고 대기 시간 반환 (asyncio 경로용)"""
+        return self.bucket(url).reserve()
+
+    def acquire(self, url: Optional[str] = None) -> float:
+        """요청 예산을 확보할 때까지 대기하고 실제 대기 시간 반환"""
+        delay = self.reserve(url)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    def record(self, url: Optional[str], ok: bool = True, elapsed: Optional[float] = None):
+        """요청 결과를 AIMD 에 반영"""
+        bucket = self.bucket(url)
+        if ok:
+            bucket.on_success(elapsed)
+        else:
+            bucket.on_error()
+
+    def current_rate(self, url: Optional[str] = None) -> float:
+        return self.bucket(url).rate
+
+
+_limiter: Optional[RateLimiter] = None
+_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """프로세스 전역 RateLimiter (Config 값으로 최초 1회 생성)"""
+    global _limiter
+    if _limiter is None:
+        with _limiter_lock:
+            if _limiter is None:
+                try:
+                    from config import Config
+                except ImportError:  # crawler.py 단독 실행 – 기본값 사용
+                    Config = None
+                _limiter = RateLimiter(
+                    rate=getattr(Config, 'RATE_LIMIT_PER_HOST', 1.0),
+                    burst=getattr(Config, 'RATE_LIMIT_BURST', 3),
+                    min_rate=getattr(Config, 'RATE_LIMIT_MIN', 0.2),
+                    increase=getattr(Config, 'RATE_LIMIT_INCREASE', 0.05),
+                    slow_seconds=getattr(Config, 'SLOW_RESPONSE_SECONDS', 3.0),
+                )
+    return _limiter
+
+
+def throttle_driver(driver, limiter: Optional[RateLimiter] = None):
+    """driver.get 이 항상 RateLimiter 를 거치도록 감싼다 (여러 번 호출해도 안전)"""
+    if driver is None or getattr(driver, "_rate_limited", False):
+        return driver
+
+    limiter = limiter or get_rate_limiter()
+    original_get = driver.get
+
+    def get(url):
+        limiter.acquire(url)
+        start = time.monotonic()
+        try:
+            result = original_get(url)
+        except Exception:
+            limiter.record(url, ok=False)
+            raise
+        limiter.record(url, ok=True, elapsed=time.monotonic() - start)
+        return result
+
+    driver.get = get
+    driver._rate_limited = True
+    return driver
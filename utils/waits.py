@@ -0,0 +1,198 @@
+"""
+조건 기반 대기 모음
+고정 sleep 대신 DOM 상태가 준비되는 즉시 반환하는 대기 함수들을 정의합니다.
+모든 함수는 timeout 을 '최대' 대기 시간으로 사용하며, 조건 충족 여부를 반환합니다.
+
+서버 부하를 고려한 요청 간 지연은 준비 대기와 분리하여 polite_delay
+(utils.rate_limiter 의 공용 토큰 버킷) 로만 둡니다.
+"""
+# Disclaimer: use at your own risk. The authors take no responsibility for misuse.
+
+import time
+from typing import Callable, Iterable, Optional
+
+from .constants import POST_SELECTORS
+from .rate_limiter import get_rate_limiter
+
+POLL_INTERVAL = 0.1
+
+# 문서 로딩 상태 + jQuery 진행 중 요청 수 + 로딩 표시 요소 존재 여부
+_READY_SCRIPT = r"""
+var busy = 0;
+try { if (window.jQuery) { busy = jQuery.active; } } catch (e) {}
+var spinner = document.querySelector('.loading, .spinner, .ajax-loading, .progress-bar');
+return [document.readyState, busy, !!(spinner && spinner.offsetParent !== null)];
+"""
+
+# 선택자 목록 중 처음으로 2개 이상 일치하는 행 수 (POST_SELECTORS 와 같은 규칙)
+_ROW_COUNT_SCRIPT = r"""
+var sel = arguments[0];
+for (var i = 0; i < sel.length; i++) {
+    var n = 0;
+    try { n = document.querySelectorAll(sel[i]).length; } catch (e) { continue; }
+    if (n > 1) { return n; }
+}
+return 0;
+"""
+
+# 지난 호출 이후 끝난 리소스 요청 수 – 읽은 뒤 비워서 버퍼 상한(기본 250개)에 걸리지 않게 한다
+_NEW_RESOURCES_SCRIPT = r"""
+var n = performance.getEntriesByType('resource').length;
+performance.clearResourceTimings();
+return n;
+"""
+
+_FIRST_MATCH_SCRIPT = r"""
+var sel = arguments[0];
+for (var i = 0; i < sel.length; i++) {
+    var el = null;
+    try { el = document.querySelector(sel[i]); } catch (e) { continue; }
+    if (el) { return el; }
+}
+return null;
+"""
+
+_FRAME_SRC_SCRIPT = r"""
+var f = document.getElementById(arguments[0]) || document.querySelector('iframe[name="' + arguments[0] + '"]');
+if (!f) { return [null, document.readyState]; }
+var state = '';
+try { state = f.contentDocument ? f.contentDocument.readyState : ''; } catch (e) { state = 'complete'; }
+return [f.src || '', state];
+"""
+
+
+def wait_until(condition: Callable[[], object], timeout: float,
+               poll: float = POLL_INTERVAL) -> object:
+    """condition() 이 참 값을 반환할 때까지 대기 (시간 초과 시 None)"""
+    deadline = time.monotonic() + max(timeout, 0)
+    while True:
+        try:
+            result = condition()
+        except Exception:
+            result = None
+        if result:
+            return result
+        if time.monotonic() >= deadline:
+            return None
+        time.sleep(poll)
+
+
+def _script(driver, script, *args):
+    return driver.execute_script(script, *args)
+
+
+def wait_for_page_ready(driver, timeout: float = 5) -> bool:
+    """document.readyState 완료, jQuery 요청 없음, 로딩 표시 사라짐"""
+    def ready():
+        state, busy, spinner = _script(driver, _READY_SCRIPT)
+        return state == "complete" and not busy and not spinner
+
+    return bool(wait_until(ready, timeout))
+
+
+def wait_for_element(driver, selectors: Iterable[str], timeout: float = 5):
+    """선택자 중 하나라도 일치하는 요소가 나타나면 그 요소를 반환 (없으면 None)"""
+    selectors = list(selectors)
+    return wait_until(lambda: _script(driver, _FIRST_MATCH_SCRIPT, selectors), timeout)
+
+
+def wait_for_rows_stable(driver, selectors: Optional[Iterable[str]] = None,
+                         timeout: float = 5, settle: float = 0.3) -> int:
+    """목록 행 수가 settle 초 동안 변하지 않을 때까지 대기하고 행 수 반환
+
+    행이 하나도 없는 상태는 안정으로 보지 않는다 (아직 렌더링 전일 수 있음) –
+    끝까지 0 이면 timeout 후 0 을 반환한다.
+    """
+    selectors = list(selectors or POST_SELECTORS)
+    state = {"count": -1, "since": time.monotonic()}
+
+    def stable():
+        count = _script(driver, _ROW_COUNT_SCRIPT, selectors) or 0
+        now = time.monotonic()
+        if count != state["count"]:
+            state["count"], state["since"] = count, now
+            return False
+        return count > 0 and now - state["since"] >= settle
+
+    wait_until(stable, timeout)
+    return max(state["count"], 0)
+
+
+def wait_for_url_change(driver, old_url: str, timeout: float = 5) -> bool:
+    """current_url 이 old_url 과 달라질 때까지 대기"""
+    return bool(wait_until(lambda: driver.current_url != old_url, timeout))
+
+
+def wait_for_staleness(element, timeout: float = 5) -> bool:
+    """기존 요소가 DOM 에서 교체(stale)될 때까지 대기 – 같은 URL 에서의 AJAX 갱신 감지"""
+    def stale():
+        try:
+            element.is_enabled()
+            return False
+        except Exception:
+            return True
+
+    return bool(wait_until(stale, timeout))
+
+
+def wait_for_frame(driver, frame_id: str = "cafe_main", old_src: Optional[str] = None,
+                   timeout: float = 5) -> bool:
+    """iframe 이 로드 완료될 때까지 대기 (old_src 지정 시 src 변경까지)
+
+    해당 iframe 이 없는 페이지라면 문서 자체의 로드 완료만 기다린다.
+    """
+    def loaded():
+        src, state = _script(driver, _FRAME_SRC_SCRIPT, frame_id)
+        if src is None:
+            return old_src is None and state == "complete"
+        if old_src is not None and src == old_src:
+            return False
+        return state == "complete"
+
+    return bool(wait_until(loaded, timeout))
+
+
+def wait_for_network_idle(driver, timeout: float = 5, idle: float = 0.5) -> bool:
+    """idle 초 동안 새 리소스 요청이 없을 때까지 대기
+
+    Resource Timing 목록을 폴링하므로 CDP 이벤트 구독 없이 동작한다. 폴링할
+    때마다 목록을 비우므로 버퍼가 가득 차 요청이 멈춘 것처럼 보이지 않는다.
+    """
+    state = {"since": time.monotonic()}
+
+    def quiet():
+        new_requests = _script(driver, _NEW_RESOURCES_SCRIPT)
+        now = time.monotonic()
+        if new_requests is None or new_requests > 0:
+            state["since"] = now
+            return False
+        return now - state["since"] >= idle
+
+    return bool(wait_until(quiet, timeout))
+
+
+def wait_for_navigation(driver, old_url: str, marker=None, timeout: float = 5) -> bool:
+    """클릭 후 이동 완료 대기: URL 변경 또는 기존 행(marker) 교체 → 목록 안정화"""
+    def moved():
+        if driver.current_url != old_url:
+            return True
+        if marker is None:
+            return False
+        try:
+            marker.is_enabled()
+            return False
+        except Exception:
+            return True
+
+    changed = bool(wait_until(moved, timeout))
+    wait_for_page_ready(driver, timeout=timeout)
+    wait_for_rows_stable(driver, timeout=timeout)
+    return changed
+
+
+def polite_delay(url: Optional[str] = None) -> float:
+    """서버 부하 방지를 위한 명시적 요청 간 지연 (준비 대기와 별개)
+
+    호스트별 공용 토큰 버킷에서 요청 예산을 확보할 때까지 대기한다.
+    """
+    return get_rate_limiter().acquire(url)